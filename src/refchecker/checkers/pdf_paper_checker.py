@@ -6,7 +6,8 @@ PDF Paper Checker - Validates citations by extracting and analyzing PDF content
 import re
 import io
 import logging
-from typing import Dict, List, Any, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Union, BinaryIO
 from urllib.parse import urlparse
 
 import requests
@@ -19,6 +20,28 @@ from refchecker.utils.text_utils import normalize_text, calculate_title_similari
 
 logger = logging.getLogger(__name__)
 
+# URL path fragments that suggest the link serves a document directly
+PDF_PATH_INDICATORS = ('/pdf/', '/document/', '/download/', '/file/', '/resource/')
+
+# Domain labels for institutional sites that commonly serve PDFs (e.g. .edu, .gov.uk)
+PDF_INSTITUTIONAL_LABELS = frozenset({'gov', 'edu', 'org'})
+
+# Registered domains that commonly serve PDFs directly
+PDF_HOST_DOMAINS = frozenset({
+    'researchgate.net', 'academia.edu', 'arxiv.org',  # Academic platforms
+    'oecd.org', 'who.int', 'unesco.org',  # International organizations
+    'aecea.ca',  # Specific domain from the user's example
+})
+
+# Read size used when streaming PDF downloads into memory
+PDF_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Patterns used when scanning the first page for title and authors
+_PDF_TEXT_LINE_RE = re.compile(r'^\s*(\S.*?)\s*$', re.MULTILINE)
+_PDF_HEADER_LINE_RE = re.compile(r'page|doi:|http|www\.|@', re.IGNORECASE)
+_PDF_AUTHOR_LINE_RE = re.compile(r',| and |university|college|institute', re.IGNORECASE)
+_PDF_AUTHOR_MARKER_RE = re.compile(r'[0-9*†‡§¶#]')
+
 
 class PDFPaperChecker:
     """
@@ -45,28 +68,26 @@ class PDFPaperChecker:
         if not url:
             return False
         
+        url_lower = url.lower()
+        
         # Check if URL ends with .pdf
-        if url.lower().endswith('.pdf'):
+        if url_lower.endswith('.pdf'):
             return True
         
         # Check if URL path suggests PDF content
-        pdf_indicators = ['/pdf/', '/document/', '/download/', '/file/', '/resource/']
-        if any(indicator in url.lower() for indicator in pdf_indicators):
+        if any(indicator in url_lower for indicator in PDF_PATH_INDICATORS):
             return True
         
         # Check if URL is from domains that commonly serve PDFs directly
-        domain = urlparse(url).netloc.lower()
-        pdf_domains = [
-            '.gov', '.edu', '.org',  # Common institutional domains
-            'researchgate.net', 'academia.edu', 'arxiv.org',  # Academic platforms
-            'oecd.org', 'who.int', 'unesco.org',  # International organizations
-            'aecea.ca'  # Specific domain from the user's example
-        ]
-        
-        if any(domain.endswith(pdf_domain) or pdf_domain in domain for pdf_domain in pdf_domains):
+        labels = (urlparse(url).hostname or '').split('.')
+        if len(labels) < 2:
+            return False
+        
+        if PDF_INSTITUTIONAL_LABELS.intersection(labels[1:]):
             return True
         
-        return False
+        # Match the host itself or any parent domain against the known hosts
+        return any('.'.join(labels[i:]) in PDF_HOST_DOMAINS for i in range(len(labels) - 1))
     
     def verify_reference(self, reference: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], Optional[str]]:
         """
@@ -137,7 +158,25 @@ class PDFPaperChecker:
             logger.error(f"Error verifying PDF reference {url}: {e}")
             return None, [{"error_type": "unverified", "error_details": "PDF processing error"}], url
     
-    def _download_pdf(self, url: str, timeout: int = 30) -> Optional[bytes]:
+    def verify_references(self, references: List[Dict[str, Any]], max_workers: int = 8) -> List[Tuple[Optional[Dict[str, Any]], List[Dict[str, Any]], Optional[str]]]:
+        """
+        Verify several references concurrently so their downloads overlap
+        
+        Args:
+            references: List of reference dictionaries
+            max_workers: Maximum number of worker threads
+            
+        Returns:
+            List of (verified_data, errors, url) tuples in the same order as references
+        """
+        if not references:
+            return []
+        
+        effective_workers = min(max_workers, len(references))
+        with ThreadPoolExecutor(max_workers=effective_workers, thread_name_prefix="PDFWorker") as executor:
+            return list(executor.map(self.verify_reference, references))
+    
+    def _download_pdf(self, url: str, timeout: int = 30) -> Optional[io.BytesIO]:
         """
         Download PDF content from URL
         
@@ -146,7 +185,7 @@ class PDFPaperChecker:
             timeout: Request timeout in seconds
             
         Returns:
-            PDF content as bytes, or None if download failed
+            PDF content as an in-memory stream, or None if download failed
         """
         try:
             logger.debug(f"Downloading PDF from: {url}")
@@ -160,12 +199,18 @@ class PDFPaperChecker:
                 # Sometimes PDFs are served with generic content types, so we'll try anyway
                 logger.debug(f"Content-Type '{content_type}' doesn't indicate PDF, but proceeding anyway")
             
-            # Download content
-            content = response.content
+            # Stream content into a buffer the PDF parsers can read directly
+            content = io.BytesIO()
+            for chunk in response.iter_content(chunk_size=PDF_DOWNLOAD_CHUNK_SIZE):
+                content.write(chunk)
+            size = content.tell()
+            content.seek(0)
             
             # Basic PDF validation - check for PDF header
-            if content.startswith(b'%PDF-'):
-                logger.debug(f"Successfully downloaded PDF ({len(content)} bytes)")
+            header = content.read(5)
+            content.seek(0)
+            if header == b'%PDF-':
+                logger.debug(f"Successfully downloaded PDF ({size} bytes)")
                 return content
             else:
                 logger.debug("Downloaded content doesn't appear to be a valid PDF")
@@ -253,12 +298,12 @@ class PDFPaperChecker:
             logger.error(f"Error searching for PDF links in {url}: {e}")
             return None
     
-    def _extract_pdf_data(self, pdf_content: bytes) -> Optional[Dict[str, Any]]:
+    def _extract_pdf_data(self, pdf_content: Union[bytes, BinaryIO]) -> Optional[Dict[str, Any]]:
         """
         Extract text and metadata from PDF content
         
         Args:
-            pdf_content: PDF file content as bytes
+            pdf_content: PDF file content as bytes or a binary stream
             
         Returns:
             Dictionary with extracted data including text, title, authors, etc.
@@ -293,9 +338,9 @@ class PDFPaperChecker:
         logger.debug("All PDF extraction methods failed")
         return None
     
-    def _extract_with_pdfplumber(self, pdf_content: bytes, pdf_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_with_pdfplumber(self, pdf_content: Union[bytes, BinaryIO], pdf_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract PDF data using pdfplumber"""
-        with pdfplumber.open(io.BytesIO(pdf_content)) as pdf:
+        with pdfplumber.open(self._as_pdf_stream(pdf_content)) as pdf:
             pdf_data['page_count'] = len(pdf.pages)
             
             # Extract text from first few pages (usually contains title/author info)
@@ -314,9 +359,9 @@ class PDFPaperChecker:
         
         return pdf_data
     
-    def _extract_with_pypdf(self, pdf_content: bytes, pdf_data: Dict[str, Any]) -> Dict[str, Any]:
+    def _extract_with_pypdf(self, pdf_content: Union[bytes, BinaryIO], pdf_data: Dict[str, Any]) -> Dict[str, Any]:
         """Extract PDF data using pypdf"""
-        reader = PdfReader(io.BytesIO(pdf_content))
+        reader = PdfReader(self._as_pdf_stream(pdf_content))
         pdf_data['page_count'] = len(reader.pages)
         
         # Extract metadata
@@ -349,6 +394,14 @@ class PDFPaperChecker:
         
         return pdf_data
     
+    @staticmethod
+    def _as_pdf_stream(pdf_content: Union[bytes, BinaryIO]) -> BinaryIO:
+        """Return a stream positioned at the start of the PDF, wrapping raw bytes if needed"""
+        if isinstance(pdf_content, (bytes, bytearray, memoryview)):
+            return io.BytesIO(pdf_content)
+        pdf_content.seek(0)
+        return pdf_content
+    
     def _parse_title_and_authors(self, text: str) -> Tuple[str, List[str]]:
         """
         Parse title and authors from PDF text
@@ -359,7 +412,7 @@ class PDFPaperChecker:
         Returns:
             Tuple of (title, authors_list)
         """
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = [match.group(1) for match in _PDF_TEXT_LINE_RE.finditer(text)]
         
         if not lines:
             return '', []
@@ -371,7 +424,7 @@ class PDFPaperChecker:
         # Look for the title - usually first non-header line
         for i, line in enumerate(lines):
             # Skip obvious header/footer content
-            if len(line) < 10 or any(skip in line.lower() for skip in ['page', 'doi:', 'http', 'www.', '@']):
+            if len(line) < 10 or _PDF_HEADER_LINE_RE.search(line):
                 continue
             
             # Title is usually longer and on its own line
@@ -383,9 +436,9 @@ class PDFPaperChecker:
                     author_line = lines[j]
                     
                     # Author lines often contain commas, "and", or institutional affiliations
-                    if any(indicator in author_line.lower() for indicator in [',', ' and ', 'university', 'college', 'institute']):
+                    if _PDF_AUTHOR_LINE_RE.search(author_line):
                         # Clean up author line
-                        author_text = re.sub(r'[0-9*†‡§¶#]', '', author_line)  # Remove superscript markers
+                        author_text = _PDF_AUTHOR_MARKER_RE.sub('', author_line)  # Remove superscript markers
                         if ',' in author_text:
                             authors.extend([name.strip() for name in author_text.split(',') if name.strip()])
                         else:
@@ -411,7 +464,7 @@ class PDFPaperChecker:
         # Check title match
         cited_title = reference.get('title', '').strip()
         extracted_title = pdf_data.get('title', '').strip()
-        pdf_text = pdf_data.get('text', '').lower()
+        pdf_text = pdf_data.get('text', '')
         
         title_match = False
         
@@ -422,9 +475,10 @@ class PDFPaperChecker:
                 title_match = True
         
         if not title_match and cited_title and pdf_text:
-            # Check if cited title appears in PDF text
+            # Check if cited title appears in PDF text (case-insensitive search avoids
+            # lowercasing a copy of the whole PDF text)
             cited_title_normalized = normalize_text(cited_title)
-            if cited_title_normalized.lower() in pdf_text:
+            if re.search(re.escape(cited_title_normalized), pdf_text, re.IGNORECASE):
                 title_match = True
         
         if not title_match:
@@ -450,12 +504,11 @@ class PDFPaperChecker:
                     break
         
         if not author_match and cited_authors and pdf_text:
-            # Check if any cited author appears in PDF text
-            for cited_author in cited_authors:
-                author_normalized = normalize_text(cited_author)
-                if author_normalized.lower() in pdf_text:
-                    author_match = True
-                    break
+            # Check if any cited author appears in PDF text, scanning the text once
+            # for all authors with a single alternation
+            author_patterns = [re.escape(normalize_text(cited_author)) for cited_author in cited_authors]
+            if re.search('|'.join(author_patterns), pdf_text, re.IGNORECASE):
+                author_match = True
         
         # For PDF validation, we're more lenient with author matching since extraction is unreliable
         if not author_match and cited_authors:
@@ -478,16 +531,11 @@ class PDFPaperChecker:
         if author1_norm == author2_norm:
             return True
         
-        # Check similarity
-        similarity = fuzz.ratio(author1_norm, author2_norm)
-        if similarity > 85:  # 85% similarity threshold
-            return True
-        
-        # Check if one name is contained in the other (handles "J. Smith" vs "John Smith")
-        words1 = set(author1_norm.split())
-        words2 = set(author2_norm.split())
-        
-        if words1.intersection(words2):
+        # Check if the names share a word (handles "J. Smith" vs "John Smith").
+        # This is a cheap set test, so run it before the edit-distance ratio.
+        if not set(author1_norm.split()).isdisjoint(author2_norm.split()):
             return True
         
-        return False
\ No newline at end of file
+        # Check similarity
+        similarity = fuzz.ratio(author1_norm, author2_norm)
+        return similarity > 85  # 85% similarity threshold
\ No newline at end of file
@@ -343,9 +343,8 @@ class ParallelReferenceProcessor:
         # Display errors and warnings
         if result.errors:
             # Check if there's an unverified error
-            has_unverified_error = any(e.get('error_type') == 'unverified' or e.get('warning_type') == 'unverified' or e.get('info_type') == 'unverified' for e in result.errors)
-            
-            if has_unverified_error:
+            from refchecker.utils.error_utils import has_unverified_error
+            if has_unverified_error(result.errors):
                 # Use the centralized unverified error display function from base checker
                 self.base_checker._display_unverified_error_with_subreason(reference, result.url, result.errors, debug_mode=False, print_output=True)
             
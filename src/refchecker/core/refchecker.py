@@ -44,6 +44,7 @@ import argparse
 import sys
 import json
 import random
+from functools import lru_cache
 from refchecker.checkers.local_semantic_scholar import LocalNonArxivReferenceChecker
 from refchecker.utils.text_utils import (clean_author_name, clean_title, clean_title_basic,
                        extract_arxiv_id_from_url, normalize_text as common_normalize_text,
@@ -171,6 +172,59 @@ def setup_logging(debug_mode=False, level=None):
 # Initialize logger (default to INFO for console)
 logger = setup_logging(debug_mode=False)
 
+# Specific URL-based unverified reasons, keyed by their lowercased text
+URL_UNVERIFIED_REASONS = {
+    "non-existent web page": "Non-existent web page",
+    "paper not found and url doesn't reference it": "Paper not found and URL doesn't reference it",
+    "paper not verified but url references paper": "Paper not verified but URL references paper",
+}
+
+# Checker/API errors
+API_ERROR_PATTERNS = (
+    'api error', 'rate limit', 'http error', 'network error',
+    'could not fetch', 'connection', 'timeout', 'server error',
+    'could not verify reference using any available api',
+    'database connection not available'
+)
+
+# Not found patterns
+NOT_FOUND_PATTERNS = (
+    'not found', 'could not be found', 'repository not found',
+    'web page not found', '404', 'invalid', 'too short or empty'
+)
+
+# Processing errors
+PROCESSING_ERROR_PATTERNS = (
+    'error processing', 'error parsing', 'unexpected error'
+)
+
+
+@lru_cache(maxsize=256)
+def categorize_unverified_reason(error_details):
+    """Categorize the unverified error into checker error or not found
+    
+    Unverified reasons come from a small, fixed vocabulary, so results are cached.
+    """
+    error_details_lower = error_details.lower()
+    
+    # New specific URL-based unverified reasons
+    url_reason = URL_UNVERIFIED_REASONS.get(error_details_lower)
+    if url_reason:
+        return url_reason
+    
+    if any(pattern in error_details_lower for pattern in API_ERROR_PATTERNS):
+        return "Checker had an error"
+    
+    if any(pattern in error_details_lower for pattern in NOT_FOUND_PATTERNS):
+        return "Paper not found by any checker"
+    
+    if any(pattern in error_details_lower for pattern in PROCESSING_ERROR_PATTERNS):
+        return "Checker had an error"
+    
+    # Default fallback
+    return "Paper not found by any checker"
+
+
 class ArxivReferenceChecker:
     def __init__(self, semantic_scholar_api_key=None, db_path=None, output_file=None, 
                  llm_config=None, debug_mode=False, enable_parallel=True, max_workers=4):
@@ -5485,9 +5539,8 @@ class ArxivReferenceChecker:
         # If errors found, add to dataset and optionally print details
         if errors:
             # Check if there's an unverified error among the errors
-            has_unverified_error = any(e.get('error_type') == 'unverified' or e.get('warning_type') == 'unverified' or e.get('info_type') == 'unverified' for e in errors)
-            
-            if has_unverified_error:
+            from refchecker.utils.error_utils import has_unverified_error
+            if has_unverified_error(errors):
                 self.total_unverified_refs += 1
                 self._display_unverified_error_with_subreason(reference, reference_url, errors, debug_mode, print_output)
             
@@ -5496,9 +5549,8 @@ class ArxivReferenceChecker:
             paper_errors.extend(errors)
             
             # Count errors vs warnings vs info
-            error_count = sum(1 for e in errors if 'error_type' in e and e['error_type'] != 'unverified')
-            warning_count = sum(1 for e in errors if 'warning_type' in e)
-            info_count = sum(1 for e in errors if 'info_type' in e)
+            from refchecker.utils.error_utils import count_error_types
+            error_count, warning_count, info_count = count_error_types(errors)
             self.total_errors_found += error_count
             self.total_warnings_found += warning_count
             self.total_info_found += info_count
@@ -5608,49 +5660,7 @@ class ArxivReferenceChecker:
 
     def _categorize_unverified_reason(self, error_details):
         """Categorize the unverified error into checker error or not found"""
-        error_details_lower = error_details.lower()
-        
-        # New specific URL-based unverified reasons
-        if error_details_lower == "non-existent web page":
-            return "Non-existent web page"
-        elif error_details_lower == "paper not found and url doesn't reference it":
-            return "Paper not found and URL doesn't reference it"
-        elif error_details_lower == "paper not verified but url references paper":
-            return "Paper not verified but URL references paper"
-        
-        # Checker/API errors
-        api_error_patterns = [
-            'api error', 'rate limit', 'http error', 'network error', 
-            'could not fetch', 'connection', 'timeout', 'server error',
-            'could not verify reference using any available api',
-            'database connection not available'
-        ]
-        
-        # Not found patterns  
-        not_found_patterns = [
-            'not found', 'could not be found', 'repository not found',
-            'web page not found', '404', 'invalid', 'too short or empty'
-        ]
-        
-        # Processing errors
-        processing_error_patterns = [
-            'error processing', 'error parsing', 'unexpected error'
-        ]
-        
-        for pattern in api_error_patterns:
-            if pattern in error_details_lower:
-                return "Checker had an error"
-                
-        for pattern in not_found_patterns:
-            if pattern in error_details_lower:
-                return "Paper not found by any checker"
-                
-        for pattern in processing_error_patterns:
-            if pattern in error_details_lower:
-                return "Checker had an error"
-        
-        # Default fallback
-        return "Paper not found by any checker"
+        return categorize_unverified_reason(error_details)
     
     def _display_non_unverified_errors(self, errors, debug_mode, print_output):
         """Display all non-unverified errors and warnings"""
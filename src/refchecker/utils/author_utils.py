@@ -9,6 +9,13 @@ from .text_utils import normalize_text
 
 logger = logging.getLogger(__name__)
 
+# Prefer the C implementation from python-Levenshtein (a declared dependency) when it
+# is installed; fall back to the pure-Python dynamic programme below
+try:
+    from Levenshtein import distance as _c_levenshtein_distance
+except ImportError:
+    _c_levenshtein_distance = None
+
 def levenshtein_distance(s1, s2):
     """
     Calculate the Levenshtein distance between two strings
@@ -19,6 +26,9 @@ def levenshtein_distance(s1, s2):
     Returns:
         Integer distance
     """
+    if _c_levenshtein_distance is not None and isinstance(s1, str) and isinstance(s2, str):
+        return _c_levenshtein_distance(s1, s2)
+    
     if len(s1) < len(s2):
         return levenshtein_distance(s2, s1)
 
@@ -79,14 +89,15 @@ def compare_authors(cited_authors, correct_authors, threshold=0.8):
     similarities = []
     matched_authors = 0
     
+    # Normalize the correct authors once rather than once per cited author
+    correct_normalized = [(correct_author, normalize_text(correct_author)) for correct_author in correct_main]
+    
     for cited_author in cited_main:
         cited_norm = normalize_text(cited_author)
         best_similarity = 0.0
         best_match = ''
         
-        for correct_author in correct_main:
-            correct_norm = normalize_text(correct_author)
-            
+        for correct_author, correct_norm in correct_normalized:
             # Calculate similarity
             if cited_norm == correct_norm:
                 similarity = 1.0
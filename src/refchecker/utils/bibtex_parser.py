@@ -12,10 +12,60 @@ Handles parsing of standard BibTeX format references like:
 
 import re
 import logging
-from typing import List, Dict, Any
+from functools import lru_cache
+from typing import List, Dict, Any, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Start of a BibTeX entry (excluding @string, @comment, @preamble) up to its citation key
+_BIBTEX_ENTRY_START_RE = re.compile(
+    r'@(article|inproceedings|incproceedings|book|incollection|inbook|proceedings|techreport|mastersthesis|masterthesis|phdthesis|misc|unpublished|conference|manual|booklet|collection)\s*\{\s*([^,]+)\s*,',
+    re.DOTALL | re.IGNORECASE,
+)
+# Braces and field separators; the scanners below jump between these instead
+# of stepping through the text one character at a time
+_BRACE_RE = re.compile(r'[{}]')
+_FIELD_END_RE = re.compile(r'[,}]')
+# Fields holding a reference's venue, in order of precedence; the first one
+# present is stored as the reference's 'journal' at parse time
+_BIBTEX_VENUE_FIELDS = ('journal', 'booktitle', 'venue')
+# Start of a field: optional whitespace, the field name and, if present, the
+# equals sign with the whitespace around it
+_BIBTEX_FIELD_HEAD_RE = re.compile(r'\s*(?P<name>\w*)\s*(?:(?P<equals>=)\s*)?')
+# Domain of a URL in a @misc entry's howpublished field, tried in order
+_HOWPUBLISHED_URL_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'://([^/]+)',  # Missing protocol case: "://example.com/path"
+    r'https?://([^/\s]+)',  # Standard URL
+    r'www\.([^/\s]+)',  # www without protocol
+))
+# Fallback for field contents the manual scanner cannot parse
+_BIBTEX_FIELD_RE = re.compile(
+    r'(?P<name>\w+)\s*=\s*(?:\{(?P<braced>[^{}]*(?:\{[^{}]*\}[^{}]*)*)\}|"(?P<quoted>[^"]*)")',
+    re.DOTALL,
+)
+
+
+def _find_closing_brace(text: str, open_pos: int) -> int:
+    """
+    Find the brace closing the one at open_pos
+    
+    Args:
+        text: Text to scan
+        open_pos: Index of an opening brace in text
+        
+    Returns:
+        Index of the matching closing brace, or -1 if the braces are unbalanced
+    """
+    depth = 0
+    for match in _BRACE_RE.finditer(text, open_pos):
+        if match.group() == '{':
+            depth += 1
+        else:
+            depth -= 1
+            if depth == 0:
+                return match.start()
+    return -1
+
 
 def detect_bibtex_format(text: str) -> bool:
     """
@@ -46,14 +96,8 @@ def parse_bibtex_entries(bib_content: str) -> List[Dict[str, Any]]:
     
     entries = []
     
-    # Pattern to match BibTeX entries (excluding @string, @comment, @preamble)
     # First find entry starts, then use brace counting for proper boundaries
-    entry_start_pattern = r'@(article|inproceedings|incproceedings|book|incollection|inbook|proceedings|techreport|mastersthesis|masterthesis|phdthesis|misc|unpublished|conference|manual|booklet|collection)\s*\{\s*([^,]+)\s*,'
-    
-    # Find entry starts and extract complete entries using brace counting
-    start_matches = list(re.finditer(entry_start_pattern, bib_content, re.DOTALL | re.IGNORECASE))
-    
-    for start_match in start_matches:
+    for start_match in _BIBTEX_ENTRY_START_RE.finditer(bib_content):
         entry_type = start_match.group(1).lower()
         entry_key = start_match.group(2).strip()
         
@@ -64,24 +108,13 @@ def parse_bibtex_entries(bib_content: str) -> List[Dict[str, Any]]:
             continue
         
         # Count braces to find the end of this entry
-        brace_count = 0
-        end_pos = brace_start
-        
-        for i, char in enumerate(bib_content[brace_start:], brace_start):
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    end_pos = i + 1
-                    break
-        
-        if brace_count != 0:
+        brace_end = _find_closing_brace(bib_content, brace_start)
+        if brace_end == -1:
             logger.warning(f"Unbalanced braces in BibTeX entry starting at position {start_pos}")
             continue
         
         # Extract the entry content (inside the outermost braces)
-        entry_content = bib_content[brace_start+1:end_pos-1]
+        entry_content = bib_content[brace_start+1:brace_end]
         
         # Parse the entry content
         parsed_entry = parse_bibtex_entry_content(entry_type, entry_key, entry_content)
@@ -108,36 +141,22 @@ def parse_bibtex_entry_content(entry_type: str, entry_key: str, content: str) ->
     # Use a more robust approach with manual parsing
     i = 0
     while i < len(content):
-        # Skip whitespace
-        while i < len(content) and content[i].isspace():
-            i += 1
-        
-        if i >= len(content):
+        # Skip whitespace, then read the field name and its equals sign in one match
+        head = _BIBTEX_FIELD_HEAD_RE.match(content, i)
+        field_start = head.start('name')
+        if field_start >= len(content):
             break
         
-        # Look for field name
-        field_start = i
-        while i < len(content) and (content[i].isalnum() or content[i] == '_'):
-            i += 1
-        
-        if i == field_start:
-            i += 1  # Skip non-alphanumeric character
+        if head.end('name') == field_start:
+            i = field_start + 1  # Skip non-alphanumeric character
             continue
         
-        field_name = content[field_start:i].lower()
-        
-        # Skip whitespace
-        while i < len(content) and content[i].isspace():
-            i += 1
+        field_name = head.group('name').lower()
+        i = head.end()
         
         # Look for equals sign
-        if i >= len(content) or content[i] != '=':
+        if head.group('equals') is None:
             continue
-        i += 1  # Skip '='
-        
-        # Skip whitespace
-        while i < len(content) and content[i].isspace():
-            i += 1
         
         if i >= len(content):
             break
@@ -146,30 +165,22 @@ def parse_bibtex_entry_content(entry_type: str, entry_key: str, content: str) ->
         field_value = ""
         if content[i] == '"':
             # Handle quoted strings
-            i += 1  # Skip opening quote
-            value_start = i
-            while i < len(content) and content[i] != '"':
-                i += 1
-            if i < len(content):
-                field_value = content[value_start:i]
-                i += 1  # Skip closing quote
+            value_start = i + 1  # Skip opening quote
+            value_end = content.find('"', value_start)
+            if value_end == -1:
+                i = len(content)
+            else:
+                field_value = content[value_start:value_end]
+                i = value_end + 1  # Skip closing quote
         elif content[i] == '{':
             # Handle braced strings with proper nesting
-            brace_count = 0
             value_start = i + 1  # Skip opening brace
-            i += 1
-            while i < len(content):
-                if content[i] == '{':
-                    brace_count += 1
-                elif content[i] == '}':
-                    if brace_count == 0:
-                        break
-                    brace_count -= 1
-                i += 1
-            
-            if i < len(content):
-                field_value = content[value_start:i]
-                i += 1  # Skip closing brace
+            value_end = _find_closing_brace(content, i)
+            if value_end == -1:
+                i = len(content)
+            else:
+                field_value = content[value_start:value_end]
+                i = value_end + 1  # Skip closing brace
         
         if field_value:
             field_value = field_value.strip()
@@ -179,19 +190,17 @@ def parse_bibtex_entry_content(entry_type: str, entry_key: str, content: str) ->
             fields[field_name] = field_value
         
         # Skip to next field (look for comma)
-        while i < len(content) and content[i] not in ',}':
-            i += 1
+        field_end = _FIELD_END_RE.search(content, i)
+        i = field_end.start() if field_end else len(content)
         if i < len(content) and content[i] == ',':
             i += 1
     
     # Fallback to regex if manual parsing failed
     if not fields:
         logger.debug("Manual parsing failed, trying regex approach")
-        field_pattern = r'(\w+)\s*=\s*(?:\{([^{}]*(?:\{[^{}]*\}[^{}]*)*)\}|"([^"]*)")'
-        
-        for match in re.finditer(field_pattern, content, re.DOTALL):
-            field_name = match.group(1).lower()
-            field_value = match.group(2) or match.group(3) or ""
+        for match in _BIBTEX_FIELD_RE.finditer(content):
+            field_name = match.group('name').lower()
+            field_value = match.group('braced') or match.group('quoted') or ""
             field_value = field_value.strip()
             if field_value.startswith('"') and field_value.endswith('"'):
                 field_value = field_value[1:-1]
@@ -214,8 +223,23 @@ def parse_bibtex_references(bibliography_text: str) -> List[Dict[str, Any]]:
     Returns:
         List of structured reference dictionaries
     """
+    if not bibliography_text:
+        return []
+    
+    # The same bibliography is often parsed more than once per run; callers get
+    # their own dicts and author lists so they can update them freely
+    return [
+        dict(reference, authors=list(reference['authors']))
+        for reference in _parse_bibtex_references(bibliography_text)
+    ]
+
+
+@lru_cache(maxsize=32)
+def _parse_bibtex_references(bibliography_text: str) -> Tuple[Dict[str, Any], ...]:
+    """Cached worker for parse_bibtex_references; results must not be mutated"""
     from refchecker.utils.text_utils import parse_authors_with_initials, clean_title
     from refchecker.utils.doi_utils import construct_doi_url, is_valid_doi_format
+    from refchecker.utils.url_utils import clean_url
     
     entries = parse_bibtex_entries(bibliography_text)
     references = []
@@ -277,7 +301,11 @@ def parse_bibtex_references(bibliography_text: str) -> List[Dict[str, Any]]:
                         year = 2000 + yy
         
         # Extract journal/venue
-        journal = fields.get('journal', fields.get('booktitle', fields.get('venue', '')))
+        journal = ''
+        for venue_field in _BIBTEX_VENUE_FIELDS:
+            if venue_field in fields:
+                journal = fields[venue_field]
+                break
         # Remove braces from journal/venue names
         if journal and journal.startswith('{') and journal.endswith('}'):
             journal = journal[1:-1]
@@ -291,7 +319,6 @@ def parse_bibtex_references(bibliography_text: str) -> List[Dict[str, Any]]:
         # Extract other URLs
         url = fields.get('url', '')
         if url:
-            from refchecker.utils.url_utils import clean_url
             url = clean_url(url)
         
         # Handle special @misc entries with only howpublished field
@@ -299,14 +326,8 @@ def parse_bibtex_references(bibliography_text: str) -> List[Dict[str, Any]]:
             howpublished = fields.get('howpublished', '')
             if howpublished:
                 # Try to extract a URL from howpublished
-                url_patterns = [
-                    r'://([^/]+)',  # Missing protocol case: "://example.com/path"
-                    r'https?://([^/\s]+)',  # Standard URL
-                    r'www\.([^/\s]+)',  # www without protocol
-                ]
-                
-                for pattern in url_patterns:
-                    match = re.search(pattern, howpublished)
+                for pattern in _HOWPUBLISHED_URL_PATTERNS:
+                    match = pattern.search(howpublished)
                     if match:
                         domain = match.group(1)
                         # Reconstruct URL with https if protocol was missing
@@ -318,7 +339,6 @@ def parse_bibtex_references(bibliography_text: str) -> List[Dict[str, Any]]:
                             url = howpublished
                         
                         # Clean the reconstructed URL
-                        from refchecker.utils.url_utils import clean_url
                         url = clean_url(url)
                         
                         # Generate title from domain/path
@@ -348,9 +368,10 @@ def parse_bibtex_references(bibliography_text: str) -> List[Dict[str, Any]]:
         if url.startswith('\\url{') and url.endswith('}'):
             url = url[5:-1]  # Remove \url{...}
             
-        # Clean any URL we extracted
+        # Clean any URL we extracted; this second pass is not redundant for
+        # URLs cleaned above, since dropping a DOI query or trailing punctuation
+        # can expose more punctuation or an unwrapped \url{} to clean
         if url:
-            from refchecker.utils.url_utils import clean_url
             url = clean_url(url)
         
         # Construct ArXiv URL from eprint field if no URL present
@@ -408,4 +429,4 @@ def parse_bibtex_references(bibliography_text: str) -> List[Dict[str, Any]]:
         references.append(reference)
     
     logger.debug(f"Extracted {len(references)} BibTeX references")
-    return references
\ No newline at end of file
+    return tuple(references)
\ No newline at end of file
@@ -6,7 +6,7 @@ This module provides standardized error and warning creation functions
 for reference checkers.
 """
 
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 
 
 def print_labeled_multiline(label: str, text: str) -> None:
@@ -407,4 +407,40 @@ def validate_error_dict(error_dict: Dict[str, Any], required_fields: List[str])
     Returns:
         True if all required fields are present, False otherwise
     """
-    return all(field in error_dict for field in required_fields)
\ No newline at end of file
+    return all(field in error_dict for field in required_fields)
+
+
+def has_unverified_error(errors: List[Dict[str, Any]]) -> bool:
+    """
+    Check whether any error, warning or info entry marks a reference as unverified.
+    
+    Args:
+        errors: List of error, warning and info dictionaries
+        
+    Returns:
+        True if any entry has an 'unverified' error, warning or info type
+    """
+    return any('unverified' in (e.get('error_type'), e.get('warning_type'), e.get('info_type')) for e in errors)
+
+
+def count_error_types(errors: List[Dict[str, Any]]) -> Tuple[int, int, int]:
+    """
+    Count errors, warnings and info messages in a single pass.
+    
+    Unverified errors are not counted as errors; they are tracked separately.
+    
+    Args:
+        errors: List of error, warning and info dictionaries
+        
+    Returns:
+        Tuple of (error_count, warning_count, info_count)
+    """
+    error_count = warning_count = info_count = 0
+    for e in errors:
+        if 'error_type' in e and e['error_type'] != 'unverified':
+            error_count += 1
+        if 'warning_type' in e:
+            warning_count += 1
+        if 'info_type' in e:
+            info_count += 1
+    return error_count, warning_count, info_count
@@ -4,9 +4,11 @@ Text processing utilities for ArXiv Reference Checker
 """
 
 import re
+import sys
 import logging
 import unicodedata
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -74,29 +76,50 @@ def expand_abbreviations(text: str) -> str:
     return text
 
 
+# Apostrophe variants folded to the ASCII apostrophe by normalize_apostrophes
+_APOSTROPHE_TABLE = str.maketrans({
+    '\u02bc': "'",   # Modifier letter apostrophe
+    '\u02c8': "'",   # Modifier letter vertical line (primary stress)
+    '`': "'",        # Grave accent (sometimes used as apostrophe)
+    '\u00b4': "'",   # Acute accent (sometimes used as apostrophe)
+})
+
+
 def normalize_apostrophes(text):
     """
     Normalize all apostrophe variants to standard ASCII apostrophe
     """
     if not text:
         return text
-    
-    # All known apostrophe variants
-    apostrophe_variants = [
-        "'",      # U+0027 ASCII apostrophe
-        "'",      # U+2019 Right single quotation mark (most common)
-        "'",      # U+2018 Left single quotation mark  
-        "ʼ",      # U+02BC Modifier letter apostrophe
-        "ˈ",      # U+02C8 Modifier letter vertical line (primary stress)
-        "`",      # U+0060 Grave accent (sometimes used as apostrophe)
-        "´",      # U+00B4 Acute accent (sometimes used as apostrophe)
-    ]
-    
-    # Replace all variants with standard ASCII apostrophe
-    for variant in apostrophe_variants:
-        text = text.replace(variant, "'")
-    
-    return text
+    return text.translate(_APOSTROPHE_TABLE)
+
+
+# Special characters replaced with ASCII equivalents by normalize_text
+_SPECIAL_CHAR_TABLE = str.maketrans({
+    'ä': 'a', 'ö': 'o', 'ü': 'u', 'ß': 'ss',
+    'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
+    'à': 'a', 'è': 'e', 'ì': 'i', 'ò': 'o', 'ù': 'u',
+    'â': 'a', 'ê': 'e', 'î': 'i', 'ô': 'o', 'û': 'u',
+    'ç': 'c', 'ñ': 'n', 'ø': 'o', 'å': 'a',
+    'ë': 'e', 'ï': 'i', 'ÿ': 'y',
+    'Ł': 'L', 'ł': 'l',
+    '¨': '', '´': '', '`': '', '^': '', '~': '',
+    '–': '-', '—': '-', '−': '-',
+    '„': '"', '"': '"', '"': '"',
+    '«': '"', '»': '"',
+    '¡': '!', '¿': '?',
+    '°': 'degrees', '©': '(c)', '®': '(r)', '™': '(tm)',
+    '€': 'EUR', '£': 'GBP', '¥': 'JPY', '₹': 'INR',
+    '×': 'x', '÷': '/',
+    '½': '1/2', '¼': '1/4', '¾': '3/4',
+    '\u00A0': ' ',  # Non-breaking space
+    '\u2013': '-',  # En dash
+    '\u2014': '-',  # Em dash
+    '\u2026': '...',  # Horizontal ellipsis
+    '\u00B7': '.',  # Middle dot
+    '\u2022': '.',  # Bullet
+})
+_NON_WORD_CHARS_RE = re.compile(r"[^\w\s']")
 
 
 def normalize_text(text):
@@ -110,46 +133,50 @@ def normalize_text(text):
     text = normalize_apostrophes(text)
         
     # Replace common special characters with their ASCII equivalents
-    replacements = {
-        'ä': 'a', 'ö': 'o', 'ü': 'u', 'ß': 'ss',
-        'á': 'a', 'é': 'e', 'í': 'i', 'ó': 'o', 'ú': 'u',
-        'à': 'a', 'è': 'e', 'ì': 'i', 'ò': 'o', 'ù': 'u',
-        'â': 'a', 'ê': 'e', 'î': 'i', 'ô': 'o', 'û': 'u',
-        'ç': 'c', 'ñ': 'n', 'ø': 'o', 'å': 'a',
-        'ë': 'e', 'ï': 'i', 'ÿ': 'y',
-        'Ł': 'L', 'ł': 'l',
-        '¨': '', '´': '', '`': '', '^': '', '~': '',
-        '–': '-', '—': '-', '−': '-',
-        '„': '"', '"': '"', '"': '"',
-        '«': '"', '»': '"',
-        '¡': '!', '¿': '?',
-        '°': 'degrees', '©': '(c)', '®': '(r)', '™': '(tm)',
-        '€': 'EUR', '£': 'GBP', '¥': 'JPY', '₹': 'INR',
-        '×': 'x', '÷': '/',
-        '½': '1/2', '¼': '1/4', '¾': '3/4',
-        '\u00A0': ' ',  # Non-breaking space
-        '\u2013': '-',  # En dash
-        '\u2014': '-',  # Em dash
-        '\u2026': '...',  # Horizontal ellipsis
-        '\u00B7': '.',  # Middle dot
-        '\u2022': '.',  # Bullet
-}
-    
-    for char, replacement in replacements.items():
-        text = text.replace(char, replacement)
+    text = text.translate(_SPECIAL_CHAR_TABLE)
     
     # Remove any remaining diacritical marks
     text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
     
     # Remove special characters except apostrophes
-    text = re.sub(r"[^\w\s']", '', text)
+    text = _NON_WORD_CHARS_RE.sub('', text)
     
     # Normalize whitespace
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _WHITESPACE_RE.sub(' ', text).strip()
     
     return text.lower()
 
 
+# Author list entries that stand for the remaining authors rather than a name
+_AUTHOR_LIST_ET_AL_MARKERS = frozenset({'others', 'and others', 'et al', 'et al.'})
+
+# Semicolon-separated "Surname, Initials" author lists (e.g. "Hashimoto, K.; Saoud, A.")
+_SEMICOLON_SPLIT_RE = re.compile(r'\s*;\s*')
+_SEMICOLON_SURNAME_RE = re.compile(r'^[A-Z][a-zA-Z\s\-\.\']+$')
+_SEMICOLON_INITIALS_RE = re.compile(r'^[A-Z]\.?(\s+[A-Z]\.?)*\s*$')
+
+# Pre-split normalization and "Name et al" detection in parse_authors_with_initials
+_INITIAL_PERIOD_SPACING_RE = re.compile(r'(\w)\s+\.')
+_TRAILING_ET_AL_RE = re.compile(r'^(.+?)\s+et\s+al\.?$', re.IGNORECASE)
+_INITIAL_WITH_PERIOD_RE = re.compile(r'[A-Z]\.')
+_NAME_CHARS_RE = re.compile(r'^[\w\s\-\'.]+$', re.UNICODE)
+
+# Single "Lastname, Firstname" author (no spaces in the surname to avoid "Other Author")
+_SINGLE_SURNAME_RE = re.compile(r'^[A-Z][a-zA-Z\-\']+$')
+_SINGLE_FIRSTNAME_RE = re.compile(r'^[A-Z]([a-zA-Z\s\-\'.]*|\.(\s+[A-Z]\.?)*\s*)$')
+
+# BibTeX comma-separated "Surname, Given" pairs: compound surnames like "De Mathelin",
+# full given names with optional middle initials like "Andru P", or initials like "G. G"
+_BIBTEX_SURNAME_RE = re.compile(r'^[A-Z][a-z]{1,}(-[A-Z][a-z]{1,})*(\s+[A-Z][a-z]{1,})*$')
+_BIBTEX_FULL_GIVEN_RE = re.compile(r'^[A-Z][a-z]{1,}(-[A-Z][a-z]{1,})*(\s+[A-Z]([a-z]+)?)*$')
+_BIBTEX_INITIALS_RE = re.compile(r'^[A-Z]\.?\s*([A-Z]\.?\s*)*$')
+_FOUR_PART_SURNAME_RE = re.compile(r'^[A-Z][a-z]{2,}(-[A-Z][a-z]{2,})*$')
+_FOUR_PART_GIVEN_RE = re.compile(r'^[A-Z][a-z]{1,}$')
+
+# Initials that continue the current author in the fallback comma parser ("J", "G. G")
+_CONTINUATION_INITIALS_RE = re.compile(r'^(?:[A-Z]\.?\s*|[A-Z]\.\s*[A-Z]\.?\s*)$')
+
+
 def parse_authors_with_initials(authors_text):
     """
     Parse author list that may contain initials, handling various formats:
@@ -165,12 +192,9 @@ def parse_authors_with_initials(authors_text):
     if not authors_text:
         return []
     
-    # Import regex at function level to avoid import issues
-    import re
-    
     # Handle standalone "others" or "et al" cases that should return empty list
     stripped_text = authors_text.strip().lower()
-    if stripped_text in ['others', 'and others', 'et al', 'et al.']:
+    if stripped_text in _AUTHOR_LIST_ET_AL_MARKERS:
         return []
     
     # Clean LaTeX commands early to prevent parsing issues
@@ -179,16 +203,19 @@ def parse_authors_with_initials(authors_text):
     authors_text = strip_latex_commands(authors_text)
     
     # Fix spacing around periods in initials (e.g., "Y . Li" -> "Y. Li") before parsing
-    authors_text = re.sub(r'(\w)\s+\.', r'\1.', authors_text)
+    authors_text = _INITIAL_PERIOD_SPACING_RE.sub(r'\1.', authors_text)
     
     # Normalize multi-line whitespace (especially for BibTeX author strings with line breaks)
     # This fixes cases like "Haotian Liu and\n                     Chunyuan Li and\n                     Qingyang Wu"
     # by converting to "Haotian Liu and Chunyuan Li and Qingyang Wu"
-    authors_text = re.sub(r'\s+', ' ', authors_text.strip())
+    authors_text = _WHITESPACE_RE.sub(' ', authors_text.strip())
     
     # Special case: Handle single author followed by "et al" (e.g., "Mubashara Akhtar et al.")
     # This should be split into ["Mubashara Akhtar", "et al"]
-    single_et_al_match = re.match(r'^(.+?)\s+et\s+al\.?$', authors_text, re.IGNORECASE)
+    # (whitespace is collapsed above, so the text must end in " et al" or " et al.")
+    single_et_al_match = (
+        authors_text.lower().endswith((' et al', ' et al.')) and _TRAILING_ET_AL_RE.match(authors_text)
+    )
     if single_et_al_match:
         base_author = single_et_al_match.group(1).strip()
         if base_author and not ' and ' in base_author and not ',' in base_author:
@@ -198,7 +225,7 @@ def parse_authors_with_initials(authors_text):
     # Check if this is a semicolon-separated format (e.g., "Hashimoto, K.; Saoud, A.; Kishida, M.")
     if ';' in authors_text:
         # Split by semicolons and handle the last part which might have "and"
-        semicolon_parts = [part.strip() for part in authors_text.split(';')]
+        semicolon_parts = _SEMICOLON_SPLIT_RE.split(authors_text)
         
         # Handle cases where the last part starts with "and" (e.g., "and Dimarogonas, D. V.")
         if len(semicolon_parts) > 1:
@@ -222,7 +249,7 @@ def parse_authors_with_initials(authors_text):
                     continue
                     
                 # Check for et al indicators
-                if part.lower() in ['others', 'et al', 'et al.', 'and others']:
+                if part.lower() in _AUTHOR_LIST_ET_AL_MARKERS:
                     if valid_authors:  # Only add et al if we have real authors
                         valid_authors.append("et al")
                     break
@@ -233,13 +260,10 @@ def parse_authors_with_initials(authors_text):
                     if len(comma_parts) == 2:
                         surname, initials = comma_parts
                         # Surname should be capitalized word(s)
-                        surname_pattern = r'^[A-Z][a-zA-Z\s\-\.\']+$'
                         # Initials should be 1-3 capital letters with optional periods and spaces
                         # Allow patterns like "K.", "D. V.", "A. B. C."
-                        initial_pattern = r'^[A-Z]\.?(\s+[A-Z]\.?)*\s*$'
-                        
-                        if (re.match(surname_pattern, surname) and 
-                            re.match(initial_pattern, initials) and
+                        if (_SEMICOLON_SURNAME_RE.match(surname) and 
+                            _SEMICOLON_INITIALS_RE.match(initials) and
                             len(surname) >= 2 and len(initials.replace('.', '').replace(' ', '')) >= 1):
                             valid_authors.append(f"{surname}, {initials}")
                         else:
@@ -264,12 +288,12 @@ def parse_authors_with_initials(authors_text):
             for part in and_parts:
                 part = part.strip()
                 # Check for et al indicators first
-                if part.lower() in ['others', 'et al', 'et al.', 'and others']:
+                if part.lower() in _AUTHOR_LIST_ET_AL_MARKERS:
                     # Add et al if we have real authors, then stop
                     if valid_names:
                         valid_names.append("et al")
                     break
-                elif part and (len(part.split()) >= 2 or re.search(r'[A-Z]\.', part)):
+                elif part and (len(part.split()) >= 2 or _INITIAL_WITH_PERIOD_RE.search(part)):
                     valid_names.append(part)
             
             if valid_names:  # Return if we found any valid names (including et al handling)
@@ -287,7 +311,7 @@ def parse_authors_with_initials(authors_text):
                 # Handle special cases without commas
                 if comma_count == 0:
                     # Check if this is "others", "et al", or similar
-                    if part.lower() in ['others', 'et al', 'et al.', 'and others']:
+                    if part.lower() in _AUTHOR_LIST_ET_AL_MARKERS:
                         # Convert to standard "et al" and add it, then stop processing
                         if valid_author_parts:  # Only add if we have real authors
                             valid_author_parts.append("et al")
@@ -306,8 +330,8 @@ def parse_authors_with_initials(authors_text):
                     if len(comma_parts) == 2:
                         lastname, firstname = comma_parts
                         # Both parts should contain only letters (including Unicode), spaces, hyphens, apostrophes, and periods
-                        if (re.match(r'^[\w\s\-\'.]+$', lastname, re.UNICODE) and 
-                            re.match(r'^[\w\s\-\'.]+$', firstname, re.UNICODE) and
+                        if (_NAME_CHARS_RE.match(lastname) and 
+                            _NAME_CHARS_RE.match(firstname) and
                             lastname and firstname):
                             valid_author_parts.append(part)
             
@@ -322,12 +346,9 @@ def parse_authors_with_initials(authors_text):
     # Handle single author with "Lastname, Firstname" format (exactly 2 parts)
     if len(parts) == 2:
         lastname, firstname = parts
-        # Pattern for surnames: capitalized word(s), possibly hyphenated or compound
-        # But exclude common patterns that suggest multiple authors like "Other Author"
-        surname_pattern = r'^[A-Z][a-zA-Z\-\']+$'  # Single surname word (no spaces to avoid "Other Author")
-        # Pattern for first names or initials: either full names or initials with periods
-        # Accept both full names like "David R" and initials like "A. C"
-        firstname_pattern = r'^[A-Z]([a-zA-Z\s\-\'.]*|\.(\s+[A-Z]\.?)*\s*)$'  # Full names or initials
+        # Surname must be a single capitalized word (_SINGLE_SURNAME_RE) to exclude
+        # patterns that suggest multiple authors like "Other Author"; full first names
+        # like "David R" and initials like "A. C" match _SINGLE_FIRSTNAME_RE
         
         # Additional check: if the "firstname" part looks like "Other Author" or similar, 
         # it's likely multiple authors, not a single "Lastname, Firstname" pattern
@@ -356,8 +377,8 @@ def parse_authors_with_initials(authors_text):
             looks_like_multiple_authors = False
         
         # Check if this looks like a single author in "Lastname, Firstname" format
-        if (re.match(surname_pattern, lastname) and 
-            re.match(firstname_pattern, firstname) and
+        if (_SINGLE_SURNAME_RE.match(lastname) and 
+            _SINGLE_FIRSTNAME_RE.match(firstname) and
             len(lastname) >= 2 and len(firstname) >= 1 and
             not looks_like_multiple_authors):
             # This is a single author, return as "Lastname, Firstname"
@@ -367,15 +388,6 @@ def parse_authors_with_initials(authors_text):
     # Enhanced heuristic: even number of parts >= 6, alternating proper surname/given pattern
     # Distinguish between initials (should remain as "Surname, Initial") and full names
     if len(parts) >= 6 and len(parts) % 2 == 0:
-        # Pattern for proper surnames: capitalized word(s), possibly hyphenated or compound, length >= 2
-        # Allow compound surnames like "De Mathelin", "Van der Berg", etc.
-        surname_pattern = r'^[A-Z][a-z]{1,}(-[A-Z][a-z]{1,})*(\s+[A-Z][a-z]{1,})*$'  # Allow spaces in surnames
-        # Pattern for FULL given names (not initials): starts with capital, at least 2 chars, no periods
-        # Allow hyphenated names, shorter names like "Qi", and names with middle initials like "Andru P"
-        full_given_pattern = r'^[A-Z][a-z]{1,}(-[A-Z][a-z]{1,})*(\s+[A-Z]([a-z]+)?)*$'  # Full names with optional middle initials
-        # Pattern for initials: single letters with optional periods and spaces
-        initial_pattern = r'^[A-Z]\.?\s*([A-Z]\.?\s*)*$'  # Like "J", "G. G", "D. B"
-        
         is_bibtex_format = True
         surname_count = 0
         valid_pairs = 0
@@ -387,9 +399,9 @@ def parse_authors_with_initials(authors_text):
                 given_candidate = parts[i + 1].strip()
                 
                 # Check if this follows surname, given pattern
-                surname_matches = re.match(surname_pattern, surname_candidate)
-                is_full_given = re.match(full_given_pattern, given_candidate)
-                is_initial = re.match(initial_pattern, given_candidate)
+                surname_matches = _BIBTEX_SURNAME_RE.match(surname_candidate)
+                is_full_given = _BIBTEX_FULL_GIVEN_RE.match(given_candidate)
+                is_initial = _BIBTEX_INITIALS_RE.match(given_candidate)
                 
                 # Accept if surname matches and given is either full name or initial
                 given_matches = is_full_given or is_initial
@@ -429,16 +441,14 @@ def parse_authors_with_initials(authors_text):
     # Special case for exactly 4 parts that clearly match BibTeX pattern with known surnames
     elif len(parts) == 4:
         # More lenient for 4-part lists but still require proper pattern
-        surname_pattern = r'^[A-Z][a-z]{2,}(-[A-Z][a-z]{2,})*$'  # At least 3 chars for surname, allow hyphens
-        given_pattern = r'^[A-Z][a-z]{1,}$'  # Full given names (at least 2 chars total)
         
         all_match = True
         for i in range(0, 4, 2):
             surname_candidate = parts[i]
             given_candidate = parts[i + 1]
             
-            if not (re.match(surname_pattern, surname_candidate) and 
-                   re.match(given_pattern, given_candidate)):
+            if not (_FOUR_PART_SURNAME_RE.match(surname_candidate) and 
+                   _FOUR_PART_GIVEN_RE.match(given_candidate)):
                 all_match = False
                 break
         
@@ -457,7 +467,7 @@ def parse_authors_with_initials(authors_text):
     
     for i, part in enumerate(parts):
         # Check for "others" or "et al" variations
-        if part.lower() in ['others', 'and others', 'et al', 'et al.']:
+        if part.lower() in _AUTHOR_LIST_ET_AL_MARKERS:
             # Finish current author if any, then add et al
             if current_author:
                 authors.append(current_author)
@@ -468,7 +478,7 @@ def parse_authors_with_initials(authors_text):
         elif current_author:
             # We're building an author name
             # Check if this part looks like an initial (1-3 characters, possibly with periods)
-            if re.match(r'^[A-Z]\.?\s*$', part) or re.match(r'^[A-Z]\.\s*[A-Z]\.?\s*$', part):
+            if _CONTINUATION_INITIALS_RE.match(part):
                 # This is an initial, add to current author
                 current_author += f", {part}"
             else:
@@ -498,91 +508,135 @@ def clean_author_name(author):
     """
     if not isinstance(author, str):
         return str(author) if author is not None else ''
-    
-    import unicodedata
-    
-    # Normalize Unicode characters (e.g., combining diacritics)
-    author = unicodedata.normalize('NFKC', author)
+    return _clean_author_name(author)
+
+
+# LaTeX dashes, quotes and ties replaced by clean_author_name; all are literal
+# substitutions, and order matters, so longer forms come first
+_AUTHOR_LATEX_REPLACEMENTS = (
+    ('---', '—'),    # LaTeX em-dash (must come before en-dash)
+    ('--', '–'),     # LaTeX en-dash
+    ("\\'", "'"),    # LaTeX escaped apostrophe
+    ("\\'", "'"),    # Second pass: a doubled backslash ("\\\\'") leaves "\\'" after the first
+    ('\\"', '"'),    # LaTeX escaped quote
+    ('``', '"'),     # LaTeX open quotes
+    ("''", '"'),     # LaTeX close quotes
+    ('~', ' '),      # LaTeX non-breaking space
+)
+
+# LaTeX-escaped Polish and other diacritics restored by clean_author_name, in order
+_ESCAPED_DIACRITIC_PATTERNS = tuple(
+    (re.compile(latex_form, re.IGNORECASE), unicode_form) for latex_form, unicode_form in (
+        (r'\\l', 'ł'),
+        (r'\\L', 'Ł'),
+        (r'\\a', 'ą'),
+        (r'\\A', 'Ą'),
+        (r'\\c\{c\}', 'ć'),
+        (r'\\c\{C\}', 'Ć'),
+        (r'\\e', 'ę'),
+        (r'\\E', 'Ę'),
+        (r'\\n', 'ń'),
+        (r'\\N', 'Ń'),
+        (r'\\o', 'ó'),
+        (r'\\O', 'Ó'),
+        (r'\\s', 'ś'),
+        (r'\\S', 'Ś'),
+        (r'\\z\{z\}', 'ż'),
+        (r'\\z\{Z\}', 'Ż'),
+        (r'\\.z', 'ż'),
+        (r'\\.Z', 'Ż'),
+    )
+)
+# Honorific prefixes, only when standalone at the start (so "Mrinmaya" keeps its "Mr")
+_HONORIFIC_PREFIX_RE = re.compile(r'^(?:Dr|Prof|Professor|Mr|Ms|Mrs)\.?\s+', re.IGNORECASE)
+_EMAIL_ADDRESS_RE = re.compile(r'\S+@\S+\.\S+')
+# Affiliations in parentheses or brackets, numbers and superscript markers
+_PARENTHETICAL_RE = re.compile(r'\([^)]*\)')
+_BRACKETED_RE = re.compile(r'\[[^\]]*\]')
+_DIGITS_RE = re.compile(r'\d+')
+_AFFILIATION_MARKS_TABLE = str.maketrans('', '', '†‡§¶‖#*')
+# Trailing periods that belong to a suffix or an initial rather than the sentence
+_GENERATIONAL_SUFFIX_RE = re.compile(r'\b(Jr|Sr|III|IV|II)\.$', re.IGNORECASE)
+_FINAL_INITIAL_RE = re.compile(r'\b[A-Z]\.$')
+
+
+@lru_cache(maxsize=16384)
+def _clean_author_name(author: str) -> str:
+    """Cached worker for clean_author_name; the same authors recur across a bibliography"""
+    # Normalize Unicode characters (e.g., combining diacritics); ASCII text is
+    # already in NFKC form, and most author names are ASCII
+    if not author.isascii():
+        author = unicodedata.normalize('NFKC', author)
     
     # Normalize apostrophes first before other processing
     author = normalize_apostrophes(author)
     
     # Handle common Unicode escape sequences and LaTeX encodings
-    # Note: Order matters - process longer patterns first
-    unicode_replacements = [
-        (r'---', '—'),   # LaTeX em-dash (must come before en-dash)
-        (r'--', '–'),    # LaTeX en-dash  
-        (r'\\\'', "'"),  # LaTeX escaped apostrophe
-        (r"\\'", "'"),   # Alternative LaTeX apostrophe
-        (r"\'", "'"),    # Simple escaped apostrophe
-        (r'\\"', '"'),   # LaTeX escaped quote
-        (r'``', '"'),    # LaTeX open quotes
-        (r"''", '"'),    # LaTeX close quotes
-        (r'~', ' '),     # LaTeX non-breaking space
-    ]
-    
-    for latex_form, unicode_form in unicode_replacements:
-        author = re.sub(latex_form, unicode_form, author)
-    
-    # Handle specific Polish and other diacritics that might be escaped
-    polish_replacements = {
-        r'\\l': 'ł',
-        r'\\L': 'Ł', 
-        r'\\a': 'ą',
-        r'\\A': 'Ą',
-        r'\\c\{c\}': 'ć',
-        r'\\c\{C\}': 'Ć',
-        r'\\e': 'ę',
-        r'\\E': 'Ę',
-        r'\\n': 'ń',
-        r'\\N': 'Ń',
-        r'\\o': 'ó',
-        r'\\O': 'Ó',
-        r'\\s': 'ś',
-        r'\\S': 'Ś',
-        r'\\z\{z\}': 'ż',
-        r'\\z\{Z\}': 'Ż',
-        r'\\.z': 'ż',
-        r'\\.Z': 'Ż',
-    }
+    for latex_form, unicode_form in _AUTHOR_LATEX_REPLACEMENTS:
+        if latex_form in author:
+            author = author.replace(latex_form, unicode_form)
     
-    for latex_form, unicode_form in polish_replacements.items():
-        author = re.sub(latex_form, unicode_form, author, flags=re.IGNORECASE)
+    # Handle specific Polish and other diacritics that might be escaped; all of
+    # them start with a backslash, so plain names skip the table entirely
+    if '\\' in author:
+        for latex_form, unicode_form in _ESCAPED_DIACRITIC_PATTERNS:
+            author = latex_form.sub(unicode_form, author)
     
     # Remove extra whitespace
-    author = re.sub(r'\s+', ' ', author).strip()
+    author = _WHITESPACE_RE.sub(' ', author).strip()
     
     # Fix spacing around periods in initials (e.g., "Y . Li" -> "Y. Li")
-    author = re.sub(r'(\w)\s+\.', r'\1.', author)
+    author = _INITIAL_PERIOD_SPACING_RE.sub(r'\1.', author)
     
     # Remove common honorific prefixes only when they are standalone at the start (require trailing whitespace)
     # Previous pattern falsely removed the leading "Mr" from names like "Mrinmaya" due to optional whitespace.
     # Anchor to start and require at least one space after the title to avoid stripping inside longer names.
-    author = re.sub(r'^(?:Dr|Prof|Professor|Mr|Ms|Mrs)\.?\s+', '', author, flags=re.IGNORECASE)
+    author = _HONORIFIC_PREFIX_RE.sub('', author)
     
     # Remove email addresses
-    author = re.sub(r'\S+@\S+\.\S+', '', author)
+    author = _EMAIL_ADDRESS_RE.sub('', author)
     
     # Remove affiliations in parentheses or brackets
-    author = re.sub(r'\([^)]*\)', '', author)
-    author = re.sub(r'\[[^\]]*\]', '', author)
+    author = _PARENTHETICAL_RE.sub('', author)
+    author = _BRACKETED_RE.sub('', author)
     
     # Remove numbers and superscripts
-    author = re.sub(r'\d+', '', author)
-    author = re.sub(r'[†‡§¶‖#*]', '', author)
+    author = _DIGITS_RE.sub('', author)
+    author = author.translate(_AFFILIATION_MARKS_TABLE)
     
     # Remove trailing periods that are not part of initials
     # This handles cases like "M. Bowling." -> "M. Bowling"
     # but preserves "Jr." or "Sr." and middle initials like "J. R."
-    if author.endswith('.') and not re.search(r'\b(Jr|Sr|III|IV|II)\.$', author, re.IGNORECASE):
+    if author.endswith('.') and not _GENERATIONAL_SUFFIX_RE.search(author):
         # Check if the period is after a single letter (initial) at the end
-        if not re.search(r'\b[A-Z]\.$', author):
+        if not _FINAL_INITIAL_RE.search(author):
             author = author.rstrip('.')
     
     # Clean up extra spaces
-    author = re.sub(r'\s+', ' ', author).strip()
+    author = _WHITESPACE_RE.sub(' ', author).strip()
     
-    return author
+    # Different spellings often clean to the same name; share one string object
+    return sys.intern(author)
+
+# Trailing BibTeX publication type indicator (common in Chinese and some international BibTeX styles):
+# [J] = Journal, [C] = Conference, [M] = Monograph/Book, [D] = Dissertation, [P] = Patent, [R] = Report
+_PUBLICATION_TYPE_SUFFIX_RE = re.compile(r'\s*\[[JCMDPRS]\]\s*$')
+_TRAILING_TITLE_PUNCTUATION_RE = re.compile(r'[.,;:]+$')
+# Words hyphenated across a line break, e.g. "jailbreak- ing"
+_LINE_BREAK_HYPHEN_RE = re.compile(r'([a-z])-\s+([a-z])')
+# Years in parentheses, leading "2020." and trailing " 2020" removed by remove_year_from_title
+_PARENTHESIZED_YEAR_RE = re.compile(r'\s*\((19|20)\d{2}\)\s*')
+_LEADING_YEAR_RE = re.compile(r'^(19|20)\d{2}\.\s*')
+_TITLE_END_YEAR_RE = re.compile(r'\s+(19|20)\d{2}\s*$')
+
+
+def _strip_publication_type_suffix(title: str) -> str:
+    """Remove a trailing publication type indicator such as "[J]" from a title"""
+    # Only titles ending in "]" can carry an indicator; skip the regex scan for the rest
+    if not title.rstrip().endswith(']'):
+        return title
+    return _PUBLICATION_TYPE_SUFFIX_RE.sub('', title)
+
 
 def clean_title_basic(title):
     """
@@ -600,14 +654,13 @@ def clean_title_basic(title):
     
     # Clean up newlines and normalize whitespace
     title = title.replace('\n', ' ').strip()
-    title = re.sub(r'\s+', ' ', title)
+    title = _WHITESPACE_RE.sub(' ', title)
     
     # Remove trailing punctuation
-    title = re.sub(r'[.,;:]+$', '', title)
+    title = _TRAILING_TITLE_PUNCTUATION_RE.sub('', title)
     
-    # Remove BibTeX publication type indicators at the end (common in Chinese and some international BibTeX styles)
-    # [J] = Journal, [C] = Conference, [M] = Monograph/Book, [D] = Dissertation, [P] = Patent, [R] = Report
-    title = re.sub(r'\s*\[[JCMDPRS]\]\s*$', '', title)
+    # Remove BibTeX publication type indicators at the end
+    title = _strip_publication_type_suffix(title)
     
     return title
 
@@ -634,10 +687,10 @@ def clean_title_for_search(title):
     
     # Clean up newlines and normalize whitespace (but preserve other structure)
     title = title.replace('\n', ' ').strip()
-    title = re.sub(r'\s+', ' ', title)  # Normalize whitespace only
+    title = _WHITESPACE_RE.sub(' ', title)  # Normalize whitespace only
     
     # Remove BibTeX publication type indicators that are not part of the actual title
-    title = re.sub(r'\s*\[[JCMDPRS]\]\s*$', '', title)
+    title = _strip_publication_type_suffix(title)
     
     # Note: We intentionally preserve:
     # - Capitalization (helps with exact matching)
@@ -665,7 +718,7 @@ def clean_title(title):
     title = clean_title_basic(title)
     
     # Fix hyphenated words broken across lines (e.g., "jailbreak- ing" -> "jailbreaking")
-    title = re.sub(r'([a-z])-\s+([a-z])', r'\1\2', title)
+    title = _LINE_BREAK_HYPHEN_RE.sub(r'\1\2', title)
     
     # Remove quotes
     title = title.strip('"\'')
@@ -757,20 +810,23 @@ def remove_year_from_title(title):
         return str(title) if title is not None else ''
     
     # Remove years in parentheses, at the beginning, or at the end
-    title = re.sub(r'\s*\((19|20)\d{2}\)\s*', ' ', title)
-    title = re.sub(r'^(19|20)\d{2}\.\s*', '', title)
-    title = re.sub(r'\s+(19|20)\d{2}\s*$', '', title)
+    title = _PARENTHESIZED_YEAR_RE.sub(' ', title)
+    title = _LEADING_YEAR_RE.sub('', title)
+    title = _TITLE_END_YEAR_RE.sub('', title)
     
     # Clean up extra spaces
-    title = re.sub(r'\s+', ' ', title).strip()
+    title = _WHITESPACE_RE.sub(' ', title).strip()
     
     return title
 
 
+@lru_cache(maxsize=16384)
 def normalize_author_name(name: str) -> str:
     """
     Normalize author name for comparison.
     This function is used across multiple checker modules.
+    Results are cached and interned, since the same names recur across
+    references and are compared against each other repeatedly.
     
     Args:
         name: Author name
@@ -788,7 +844,7 @@ def normalize_author_name(name: str) -> str:
     name = re.sub(r'(\w)\s+\.', r'\1.', name)
     
     # Use common normalization function
-    return normalize_text(name)
+    return sys.intern(normalize_text(name))
 
 
 def normalize_paper_title(title: str) -> str:
@@ -841,6 +897,67 @@ def normalize_paper_title(title: str) -> str:
 
 
 
+# Characters that don't decompose properly under NFD, including common transliterations,
+# plus hyphen-like characters that appear in academic papers
+_TRANSLITERATION_TABLE = str.maketrans({
+    'ł': 'l', 'Ł': 'L',
+    'đ': 'd', 'Đ': 'D', 
+    'ħ': 'h', 'Ħ': 'H',
+    'ø': 'o', 'Ø': 'O',
+    'þ': 'th', 'Þ': 'TH',
+    'ß': 'ss',
+    'æ': 'ae', 'Æ': 'AE',
+    'œ': 'oe', 'Œ': 'OE',
+    # Common German/Austrian transliterations
+    'ü': 'ue', 'Ü': 'UE',
+    'ö': 'oe', 'Ö': 'OE',
+    'ä': 'ae', 'Ä': 'AE',
+    # Hyphen variants
+    '‐': '-',  # Unicode hyphen (U+2010)
+    '‑': '-',  # Non-breaking hyphen (U+2011)  
+    '–': '-',  # En dash (U+2013)
+    '—': '-',  # Em dash (U+2014)
+    '−': '-',  # Minus sign (U+2212)
+})
+
+# Standalone diacritics and modifier symbols that aren't handled by NFD. These often
+# appear in incorrectly formatted academic papers (e.g. "J. Gl¨ uck")
+STANDALONE_DIACRITICS = (
+    '¨',    # Diaeresis (U+00A8) - category Sk
+    '´',    # Acute accent (U+00B4) - category Sk  
+    '`',    # Grave accent (U+0060) - category Sk (except when used as quotes)
+    '^',    # Circumflex accent (U+005E) - category Sk
+    '˜',    # Small tilde (U+02DC) - category Sk
+    '¯',    # Macron (U+00AF) - category Sk
+    '˘',    # Breve (U+02D8) - category Sk
+    '˙',    # Dot above (U+02D9) - category Sk
+    '¸',    # Cedilla (U+00B8) - category Sk
+    '˚',    # Ring above (U+02DA) - category Sk
+    '˝',    # Double acute accent (U+02DD) - category Sk
+    'ˇ',    # Caron (U+02C7) - category Sk
+)
+
+# A letter split from a short lower-case word fragment, left behind by a removed diacritic
+_DIACRITIC_GAP_RE = re.compile(r'([a-zA-Z]) ([a-z]{1,4})\b')
+_WHITESPACE_RUN_RE = re.compile(r'\s+')
+
+
+def _strip_combining_marks(text: str) -> str:
+    """
+    Remove combining accents (category Mn) after NFD decomposition and collapse whitespace.
+    
+    ASCII text has nothing to decompose, so it skips the per-character scan.
+    """
+    if not text.isascii():
+        # Decompose characters into base + combining characters (NFD normalization)
+        normalized = unicodedata.normalize('NFD', text)
+        # Remove all combining characters (accents, diacritics) - category Mn
+        text = ''.join(char for char in normalized if unicodedata.category(char) != 'Mn')
+    
+    # Clean up any extra spaces that may have been created by removing diacritics
+    return _WHITESPACE_RUN_RE.sub(' ', text).strip()
+
+
 def normalize_diacritics(text: str) -> str:
     """
     Normalize diacritics in text by removing accent marks and converting to ASCII equivalent.
@@ -862,47 +979,13 @@ def normalize_diacritics(text: str) -> str:
     # First normalize apostrophes
     text = normalize_apostrophes(text)
     
-    # Then handle special characters that don't decompose properly
-    # Including common transliterations
-    special_chars = {
-        'ł': 'l', 'Ł': 'L',
-        'đ': 'd', 'Đ': 'D', 
-        'ħ': 'h', 'Ħ': 'H',
-        'ø': 'o', 'Ø': 'O',
-        'þ': 'th', 'Þ': 'TH',
-        'ß': 'ss',
-        'æ': 'ae', 'Æ': 'AE',
-        'œ': 'oe', 'Œ': 'OE',
-        # Common German/Austrian transliterations
-        'ü': 'ue', 'Ü': 'UE',
-        'ö': 'oe', 'Ö': 'OE',
-        'ä': 'ae', 'Ä': 'AE',
-    }
-    
-    for special, replacement in special_chars.items():
-        text = text.replace(special, replacement)
-    
-    # Handle standalone diacritics and modifier symbols that aren't handled by NFD
-    # These often appear in incorrectly formatted academic papers
-    # We need to be careful not to create mid-word spaces when removing diacritics
-    standalone_diacritics = {
-        '¨': '',    # Diaeresis (U+00A8) - category Sk
-        '´': '',    # Acute accent (U+00B4) - category Sk  
-        '`': '',    # Grave accent (U+0060) - category Sk (except when used as quotes)
-        '^': '',    # Circumflex accent (U+005E) - category Sk
-        '˜': '',    # Small tilde (U+02DC) - category Sk
-        '¯': '',    # Macron (U+00AF) - category Sk
-        '˘': '',    # Breve (U+02D8) - category Sk
-        '˙': '',    # Dot above (U+02D9) - category Sk
-        '¸': '',    # Cedilla (U+00B8) - category Sk
-        '˚': '',    # Ring above (U+02DA) - category Sk
-        '˝': '',    # Double acute accent (U+02DD) - category Sk
-        'ˇ': '',    # Caron (U+02C7) - category Sk
-    }
+    # Then handle special characters that don't decompose properly (including common
+    # transliterations) and normalize hyphen-like characters, in one pass
+    text = text.translate(_TRANSLITERATION_TABLE)
     
     # Remove standalone diacritics, being careful about spacing
     # Use a more intelligent approach that considers context
-    for diacritic, replacement in standalone_diacritics.items():
+    for diacritic in STANDALONE_DIACRITICS:
         # Skip grave accent if it looks like it's being used as a quote mark
         if diacritic == '`' and ('`' in text[1:] if text else False):
             continue
@@ -910,39 +993,14 @@ def normalize_diacritics(text: str) -> str:
         # Only apply the fix if this diacritic is actually present
         if diacritic in text:
             # Replace the diacritic
-            old_text = text
-            text = text.replace(diacritic, replacement)
+            text = text.replace(diacritic, '')
             
-            # Only apply the letter merging if we actually made a change
-            # and if it looks like we created a mid-word space issue
-            if old_text != text:
-                # Look for patterns where removing the diacritic created "letter space lowercase"
-                # but be more specific - only merge if there's exactly one space
-                # and the pattern looks like it was from a single word split
-                text = re.sub(r'([a-zA-Z]) ([a-z]{1,4})\b', r'\1\2', text)
-    
-    # Normalize different hyphen-like characters to standard hyphen
-    # Common hyphen variants that appear in academic papers
-    hyphen_variants = {
-        '‐': '-',  # Unicode hyphen (U+2010)
-        '‑': '-',  # Non-breaking hyphen (U+2011)  
-        '–': '-',  # En dash (U+2013)
-        '—': '-',  # Em dash (U+2014)
-        '−': '-',  # Minus sign (U+2212)
-    }
-    
-    for variant, replacement in hyphen_variants.items():
-        text = text.replace(variant, replacement)
-    
-    # Decompose characters into base + combining characters (NFD normalization)
-    normalized = unicodedata.normalize('NFD', text)
-    # Remove all combining characters (accents, diacritics) - category Mn
-    ascii_text = ''.join(char for char in normalized if unicodedata.category(char) != 'Mn')
-    
-    # Clean up any extra spaces that may have been created by removing diacritics
-    ascii_text = re.sub(r'\s+', ' ', ascii_text).strip()
+            # Look for patterns where removing the diacritic created "letter space lowercase"
+            # but be more specific - only merge if there's exactly one space
+            # and the pattern looks like it was from a single word split
+            text = _DIACRITIC_GAP_RE.sub(r'\1\2', text)
     
-    return ascii_text
+    return _strip_combining_marks(text)
 
 def normalize_diacritics_simple(text: str) -> str:
     """
@@ -950,38 +1008,387 @@ def normalize_diacritics_simple(text: str) -> str:
     Used as an alternative normalization for name matching.
     """
     # Remove standalone diacritics without transliteration
-    standalone_diacritics = {
-        '¨': '',    # Diaeresis
-        '´': '',    # Acute accent
-        '`': '',    # Grave accent
-        '^': '',    # Circumflex accent
-        '˜': '',    # Small tilde
-        '¯': '',    # Macron
-        '˘': '',    # Breve
-        '˙': '',    # Dot above
-        '¸': '',    # Cedilla
-        '˚': '',    # Ring above
-        '˝': '',    # Double acute accent
-        'ˇ': '',    # Caron
-    }
-    
-    for diacritic in standalone_diacritics:
+    for diacritic in STANDALONE_DIACRITICS:
         if diacritic in text:
-            old_text = text
             text = text.replace(diacritic, '')
-            if old_text != text:
-                # Only merge if we created a pattern like "Gl uck" -> "Gluck"
-                text = re.sub(r'([a-zA-Z]) ([a-z]{1,4})\b', r'\1\2', text)
+            # Only merge if we created a pattern like "Gl uck" -> "Gluck"
+            text = _DIACRITIC_GAP_RE.sub(r'\1\2', text)
     
-    # NFD normalization to decompose characters
-    normalized = unicodedata.normalize('NFD', text)
-    # Remove combining characters (accents, diacritics)
-    ascii_text = ''.join(char for char in normalized if unicodedata.category(char) != 'Mn')
+    return _strip_combining_marks(text)
+
+# Author-name normalization patterns used by is_name_match
+_TRAILING_PERIODS_RE = re.compile(r'\.+$')
+_PERIOD_SPACING_RE = re.compile(r'\.([A-Za-z])')
+_BARE_MIDDLE_INITIAL_RE = re.compile(r'(\w+) ([a-z]) (\w+)')
+
+# Lower-case surname particles/prefixes grouped with the following surname component
+SURNAME_PARTICLES = frozenset({
+    'von', 'van', 'de', 'del', 'della', 'di', 'da', 'dos', 'du', 'le', 'la', 'las', 'los',
+    'mc', 'mac', 'o', 'ibn', 'bin', 'ben', 'af', 'av', 'zu', 'zur', 'zum', 'ter', 'ten',
+    'der', 'den', 'des'  # Articles that often follow 'van', 'von', etc.
+})
+
+
+@lru_cache(maxsize=4096)
+def _primary_name_form(name: str) -> str:
+    """
+    Normalize an author name for comparison, transliterating diacritics.
     
-    # Clean up spaces
-    ascii_text = re.sub(r'\s+', ' ', ascii_text).strip()
+    Lower-cases the name, drops trailing periods that are not part of initials
+    (e.g., "J. L. D'Amato." -> "j. l. d'amato") and spaces out initials
+    ("F.Last" -> "f. last"). Cached because the same names are compared many times.
+    """
+    normalized = normalize_diacritics(name.strip().lower())
+    normalized = _TRAILING_PERIODS_RE.sub('', normalized)
+    return _PERIOD_SPACING_RE.sub(r'. \1', normalized)
+
+
+@lru_cache(maxsize=4096)
+def _alternative_name_form(name: str) -> str:
+    """Like _primary_name_form, but strips diacritics without transliterating them."""
+    normalized = normalize_diacritics_simple(name.strip().lower())
+    normalized = _TRAILING_PERIODS_RE.sub('', normalized)
+    return _PERIOD_SPACING_RE.sub(r'. \1', normalized)
+
+
+# Letter runs of a normalized name, e.g. "j.-p. stein" -> j, p, stein
+_NAME_WORD_RE = re.compile(r'[^\W\d_]+')
+
+
+@lru_cache(maxsize=4096)
+def _name_words(normalized_name: str) -> tuple:
+    """Split a normalized author name into its letter runs."""
+    return tuple(_NAME_WORD_RE.findall(normalized_name))
+
+
+def _share_name_word(normalized1: str, normalized2: str) -> bool:
+    """
+    Check whether two normalized author names have a multi-letter word in common.
     
-    return ascii_text
+    A word counts as shared when it occurs anywhere in the other name's letters,
+    so hyphenated, joined and particle forms ("berg" in "vanderberg") still count.
+    Names ending in the same part (even a lone initial, as in "Smith, M." vs
+    "Sachan, M.") or made only of initials always count as sharing, since the
+    generic last-part comparison in is_name_match accepts them.
+    """
+    parts1 = normalized1.split()
+    parts2 = normalized2.split()
+    if parts1 and parts2 and parts1[-1] == parts2[-1]:
+        return True
+    words1 = _name_words(normalized1)
+    words2 = _name_words(normalized2)
+    long_words1 = [word for word in words1 if len(word) > 1]
+    long_words2 = [word for word in words2 if len(word) > 1]
+    if not long_words1 or not long_words2:
+        return True
+    letters1 = ''.join(words1)
+    letters2 = ''.join(words2)
+    return (any(word in letters2 for word in long_words1) or
+            any(word in letters1 for word in long_words2))
+
+
+def _add_periods_to_middle_initials(name):
+    """Add periods after single letter middle names for consistent matching"""
+    # Match: word + space + single letter + space + word
+    # Replace with: word + space + single letter + period + space + word
+    return _BARE_MIDDLE_INITIAL_RE.sub(r'\1 \2. \3', name)
+
+
+def _expand_consecutive_initials(name):
+    """Convert consecutive initials to spaced initials for consistent matching"""
+    parts = name.split()
+    if len(parts) >= 2:
+        first_part = parts[0]
+        # Check if first part is consecutive letters (initials)
+        if len(first_part) > 1 and first_part.isalpha():
+            # Convert "gv" to "g. v."
+            spaced = '. '.join(first_part) + '.'
+            return spaced + ' ' + ' '.join(parts[1:])
+    return name
+
+
+def _normalize_surname_particles(name_parts):
+    """Group surname particles with the following surname component"""
+    if len(name_parts) < 2:
+        return name_parts
+
+    normalized_parts = []
+    i = 0
+    while i < len(name_parts):
+        current_part = name_parts[i]
+
+        # Check if current part is a surname particle
+        # Be more conservative: avoid treating short words as particles when followed by short surnames
+        # This prevents "Da Yu" from being treated as particle+surname instead of first+last name
+        # Also avoid treating first names as particles in 2-word names (e.g., "Bin Chen" shouldn't become "bin chen")
+        if (current_part.lower() in SURNAME_PARTICLES and 
+            i + 1 < len(name_parts) and  # Not the last part
+            not (len(current_part) <= 2 and len(name_parts) == 2 and len(name_parts[i + 1]) <= 3) and  # Avoid "Da Yu" -> "Da Yu"
+            not (i == 0 and len(name_parts) == 2)):  # Avoid treating first word as particle in 2-word names
+
+            # Collect all consecutive particles
+            compound_parts = [current_part]
+            j = i + 1
+
+            # Look for additional particles (like "van der" or "von dem")
+            while (j < len(name_parts) - 1 and  # Not the last part
+                   name_parts[j].lower() in SURNAME_PARTICLES):
+                compound_parts.append(name_parts[j])
+                j += 1
+
+            # Add the actual surname part
+            if j < len(name_parts):
+                compound_parts.append(name_parts[j])
+                j += 1
+
+            # Create compound surname
+            compound_surname = " ".join(compound_parts)
+            normalized_parts.append(compound_surname)
+            i = j  # Skip all processed parts
+        else:
+            normalized_parts.append(current_part)
+            i += 1
+
+    return normalized_parts
+
+
+def _match_initials_with_names(init_parts, name_parts):
+    """Helper function to match initials against full names"""
+    if len(init_parts) == 3 and len(name_parts) == 2:
+        # After surname particle normalization: ['g.', 'v.', 'horn'] vs ['grant', 'van horn']
+        if (len(init_parts[0].rstrip('.')) == 1 and len(init_parts[1].rstrip('.')) == 1 and len(init_parts[2]) > 1 and
+            len(name_parts[0]) > 1 and len(name_parts[1]) > 1):
+
+            first_initial = init_parts[0].rstrip('.')
+            middle_initial = init_parts[1].rstrip('.')
+            last_name = init_parts[2]
+            first_name = name_parts[0]
+            compound_last = name_parts[1]
+
+            # Extract middle and last parts from compound lastname
+            compound_parts = compound_last.split()
+            if len(compound_parts) >= 2:
+                middle_name = compound_parts[0]
+                actual_last = compound_parts[-1]
+
+                if (last_name == actual_last and 
+                    first_initial == first_name[0] and
+                    middle_initial == middle_name[0]):
+                    return True
+
+    elif len(init_parts) == 3 and len(name_parts) == 3:
+        # Check for "Last, First Middle" vs "First Middle Last" format
+        # e.g., "ong, c. s." vs "cheng soon ong"
+        if (len(init_parts[0]) > 1 and  # Last name
+            len(init_parts[1].rstrip('.')) == 1 and  # First initial
+            len(init_parts[2].rstrip('.')) == 1 and  # Middle initial
+            len(name_parts[0]) > 1 and len(name_parts[1]) > 1 and len(name_parts[2]) > 1):
+
+            last_name_cited = init_parts[0].rstrip(',')  # "ong" (remove comma)
+            first_initial_cited = init_parts[1].rstrip('.')  # "c"
+            middle_initial_cited = init_parts[2].rstrip('.')  # "s"
+
+            first_name_correct = name_parts[0]  # "cheng"
+            middle_name_correct = name_parts[1]  # "soon"
+            last_name_correct = name_parts[2]  # "ong"
+
+            if (last_name_cited == last_name_correct and
+                first_initial_cited == first_name_correct[0] and
+                middle_initial_cited == middle_name_correct[0]):
+                return True
+
+        # Standard 3-part case: ['g.', 'v.', 'horn'] vs ['grant', 'van', 'horn']
+        elif (len(init_parts[0].rstrip('.')) == 1 and len(init_parts[1].rstrip('.')) == 1 and len(init_parts[2]) > 1 and
+            len(name_parts[0]) > 1 and len(name_parts[1]) > 1 and len(name_parts[2]) > 1):
+
+            first_initial = init_parts[0].rstrip('.')
+            middle_initial = init_parts[1].rstrip('.')
+            last_name = init_parts[2]
+            first_name = name_parts[0]
+            middle_name = name_parts[1]
+            actual_last = name_parts[2]
+
+            if (last_name == actual_last and 
+                first_initial == first_name[0] and
+                middle_initial == middle_name[0]):
+                return True
+
+    return False
+
+
+def _parse_comma_separated_name(name):
+    """Parse 'Last, First' format into (first_part, last_part)"""
+    if ',' in name:
+        parts = name.split(',', 1)  # Only split on first comma
+        last_part = parts[0].strip()
+        first_part = parts[1].strip()
+        return first_part, last_part
+    return None, None
+
+
+def _matches_name_part(abbrev, full):
+    """Check if abbreviated name part matches full name part"""
+    # Handle cases like "S." vs "Scott", "A.-D." vs "Alexandru-Daniel", "I. J." vs "I."
+    abbrev_clean = abbrev.rstrip('.')
+    full_clean = full.rstrip('.')
+
+    # If abbrev is single letter, check if it matches first letter of full name
+    if len(abbrev_clean) == 1:
+        return abbrev_clean == full_clean[0] if full_clean else False
+
+    # If abbrev has hyphens/dashes, check each part FIRST (before general multiple initials)
+    if '-' in abbrev_clean:
+        abbrev_letters = [p.strip().rstrip('.') for p in abbrev_clean.split('-')]
+        if '-' in full:
+            # Full name also has hyphens - match part by part
+            full_parts_split = [p.strip() for p in full.split('-')]
+            if len(abbrev_letters) == len(full_parts_split):
+                for al, fp in zip(abbrev_letters, full_parts_split):
+                    if len(al) == 1 and al != fp[0]:
+                        return False
+                    elif len(al) > 1 and al != fp:
+                        return False
+                return True
+            else:
+                return False
+        else:
+            # Full name doesn't have hyphens, but abbrev does
+            # Try to match by treating the full name as space-separated parts
+            # e.g., "A.-D." vs "Alexandru Daniel" 
+            full_space_parts = full.split()
+            if len(abbrev_letters) == len(full_space_parts):
+                for al, fp in zip(abbrev_letters, full_space_parts):
+                    if len(al) == 1 and al != fp[0]:
+                        return False
+                    elif len(al) > 1 and al != fp:
+                        return False
+                return True
+            else:
+                return False
+
+    # Handle multiple initials case: "I. J." should match "I."
+    # Split by spaces, dots, and hyphens to get individual initials
+    abbrev_initials = [p.strip().rstrip('.').lstrip('-') for p in re.split(r'[\s.\-]+', abbrev_clean) if p.strip()]
+    full_initials = [p.strip().rstrip('.').lstrip('-') for p in re.split(r'[\s.\-]+', full_clean) if p.strip()]
+
+    # If both are multiple initials, check if they match appropriately
+    if len(abbrev_initials) > 1 and len(full_initials) >= 1:
+        # Handle cases like "l.g" vs "leslie g" or "i j" vs "i"
+        # Also handle reverse case like "leslie g" vs "l.g"
+
+        # Determine which one has the initials and which has full names
+        if all(len(p) == 1 for p in abbrev_initials) and any(len(p) > 1 for p in full_initials):
+            # abbrev has initials, full has names: "l g" vs "leslie g"
+            # Must have same number of parts or fewer initials than full names
+            if len(abbrev_initials) > len(full_initials):
+                return False
+            for i, abbrev_initial in enumerate(abbrev_initials):
+                if i < len(full_initials):
+                    if abbrev_initial != full_initials[i][0]:
+                        return False
+            return True
+        elif any(len(p) > 1 for p in abbrev_initials) and all(len(p) == 1 for p in full_initials):
+            # abbrev has names, full has initials: "leslie g" vs "l g"  
+            # But only match if they have the same number of parts
+            if len(abbrev_initials) != len(full_initials):
+                return False
+            for i, full_initial in enumerate(full_initials):
+                if full_initial != abbrev_initials[i][0]:
+                    return False
+            return True
+        else:
+            # Mixed case or both same type, use original logic
+            for i, abbrev_initial in enumerate(abbrev_initials):
+                if i < len(full_initials):
+                    full_part = full_initials[i]
+                    # If abbrev_initial is single letter and full_part is longer, compare with first letter
+                    if len(abbrev_initial) == 1 and len(full_part) > 1:
+                        if abbrev_initial != full_part[0]:
+                            return False
+                    # If both are single letters or same length, compare directly
+                    elif abbrev_initial != full_part:
+                        return False
+                # If abbrev has more initials than full, that's OK (extra initials ignored)
+            return True
+
+    # Otherwise, abbrev should be contained in full name
+    return full.startswith(abbrev_clean)
+
+
+def _matches_abbreviated(abbrev_parts, full_parts):
+    """Check if abbreviated name matches full name"""
+    # Note: abbrev_parts can have more parts than full_parts in cases like:
+    # "I. J. Smith" (3 parts) vs "I. Smith" (2 parts) where "I. J." should match "I."
+
+    # Special case: single part abbreviated name vs single part full name
+    # e.g., "A.-D." vs "Alexandru-Daniel"
+    if len(abbrev_parts) == 1 and len(full_parts) == 1:
+        return _matches_name_part(abbrev_parts[0], full_parts[0])
+
+    # Last names must match exactly
+    if abbrev_parts[-1] != full_parts[-1]:
+        return False
+
+    # Handle different scenarios based on number of parts
+    if len(abbrev_parts) == len(full_parts):
+        # Same number of parts - match each part except last (already checked)
+        for i in range(len(abbrev_parts) - 1):
+            if not _matches_name_part(abbrev_parts[i], full_parts[i]):
+                return False
+    elif len(abbrev_parts) < len(full_parts):
+        # Fewer abbreviated parts - match first parts
+        # e.g., "Q." (1 part) vs "Qing Xue" (2 parts) - no first names to check
+        # e.g., "A. Smith" (2 parts) vs "Alexander John Smith" (3 parts) - check "A." vs "Alexander"
+        # e.g., "L.G. Valiant" (2 parts) vs "Leslie G. Valiant" (3 parts) - check "L.G." vs "Leslie G."
+        num_first_names = len(abbrev_parts) - 1  # All but last part
+        for i in range(num_first_names):
+            # Special handling for concatenated initials like "L.G." vs multiple full names
+            abbrev_part = abbrev_parts[i]
+            if ('.' in abbrev_part and len(abbrev_part.rstrip('.')) > 1 and 
+                all(len(c) == 1 for c in abbrev_part.rstrip('.').replace('.', ''))):
+                # This looks like concatenated initials (e.g., "L.G.")
+                # Match against combined full parts
+                remaining_full_parts_count = len(full_parts) - len(abbrev_parts) + 1
+                combined_full = ' '.join(full_parts[i:i + remaining_full_parts_count])
+                if not _matches_name_part(abbrev_part, combined_full):
+                    return False
+                # Skip the matched full parts
+                continue
+            else:
+                # Regular single initial matching
+                if not _matches_name_part(abbrev_part, full_parts[i]):
+                    return False
+    elif len(abbrev_parts) > len(full_parts):
+        # More abbreviated parts than full parts
+        # e.g., "I. J. Smith" (3 parts) vs "I. Smith" (2 parts)
+        # Check if the first parts of abbrev match the first parts of full
+        num_full_first_names = len(full_parts) - 1  # All but last part of full
+
+        # Build a combined abbreviated first name from multiple parts
+        # "I. J." should be treated as one first name unit
+        if num_full_first_names == 1:
+            # full has one first name, abbrev has multiple first name parts
+
+            # Special case: Handle "Nitin J." vs "N." - check if first name initial matches
+            # e.g., abbrev_parts = ['nitin', 'j.', 'sanket'], full_parts = ['n.', 'sanket']
+            if (len(abbrev_parts) >= 2 and 
+                len(full_parts[0].rstrip('.')) == 1 and 
+                len(abbrev_parts[0]) > 1):
+                # Check if first letter of full first name matches first letter of abbreviated first name
+                if abbrev_parts[0][0] == full_parts[0].rstrip('.'):
+                    return True
+
+            combined_abbrev_first = ' '.join(abbrev_parts[:-1])  # All but last
+            if not _matches_name_part(combined_abbrev_first, full_parts[0]):
+                return False
+        else:
+            # More complex case - match part by part for available positions
+            for i in range(min(num_full_first_names, len(abbrev_parts) - 1)):
+                if not _matches_name_part(abbrev_parts[i], full_parts[i]):
+                    return False
+
+    return True
+
 
 def is_name_match(name1: str, name2: str) -> bool:
     """
@@ -998,65 +1405,39 @@ def is_name_match(name1: str, name2: str) -> bool:
     if not name1 or not name2:
         return False
     
-    # Try primary normalization first (with transliterations)
-    name1_primary = normalize_diacritics(name1.strip().lower())
-    name2_primary = normalize_diacritics(name2.strip().lower())
-    
-    # Remove trailing periods that are not part of initials (e.g., "J. L. D'Amato." -> "J. L. D'Amato")
-    name1_primary = re.sub(r'\.+$', '', name1_primary)
-    name2_primary = re.sub(r'\.+$', '', name2_primary)
-    
-    # Handle spacing variations around periods: "F.Last" vs "F. Last"
-    name1_normalized = re.sub(r'\.([A-Za-z])', r'. \1', name1_primary)
-    name2_normalized = re.sub(r'\.([A-Za-z])', r'. \1', name2_primary)
+    # Try primary normalization first (with transliterations), which also removes
+    # trailing periods and handles spacing variations around periods: "F.Last" vs "F. Last"
+    name1_normalized = _primary_name_form(name1)
+    name2_normalized = _primary_name_form(name2)
     
     # If they're identical after primary normalization, they match
     if name1_normalized == name2_normalized:
         return True
     
     # Try alternative normalization (without transliterations) if primary failed  
-    name1_alt = normalize_diacritics_simple(name1.strip().lower())
-    name2_alt = normalize_diacritics_simple(name2.strip().lower())
-    
-    # Remove trailing periods for alternative normalization too
-    name1_alt = re.sub(r'\.+$', '', name1_alt)
-    name2_alt = re.sub(r'\.+$', '', name2_alt)
-    
-    name1_alt_norm = re.sub(r'\.([A-Za-z])', r'. \1', name1_alt)
-    name2_alt_norm = re.sub(r'\.([A-Za-z])', r'. \1', name2_alt)
+    name1_alt_norm = _alternative_name_form(name1)
+    name2_alt_norm = _alternative_name_form(name2)
     
     # If they match with alternative normalization, they match
     if name1_alt_norm == name2_alt_norm:
         return True
     
-    # Handle middle initial period variations: "Pavlo O Dral" vs "Pavlo O. Dral"
-    def add_periods_to_middle_initials(name):
-        """Add periods after single letter middle names for consistent matching"""
-        # Match: word + space + single letter + space + word
-        # Replace with: word + space + single letter + period + space + word
-        return re.sub(r'(\w+) ([a-z]) (\w+)', r'\1 \2. \3', name)
+    # Every rule below relies on the names sharing a surname, so names without a
+    # multi-letter word in common (e.g. "John Smith" vs "Jane Doe") cannot match
+    if not (_share_name_word(name1_normalized, name2_normalized) or
+            _share_name_word(name1_alt_norm, name2_alt_norm)):
+        return False
     
-    name1_middle_norm = add_periods_to_middle_initials(name1_normalized)
-    name2_middle_norm = add_periods_to_middle_initials(name2_normalized)
+    # Handle middle initial period variations: "Pavlo O Dral" vs "Pavlo O. Dral"
+    name1_middle_norm = _add_periods_to_middle_initials(name1_normalized)
+    name2_middle_norm = _add_periods_to_middle_initials(name2_normalized)
     
     if name1_middle_norm == name2_middle_norm:
         return True
     
     # Handle consecutive initials: "GV Abramkin" vs "G. V. Abramkin"
-    def expand_consecutive_initials(name):
-        """Convert consecutive initials to spaced initials for consistent matching"""
-        parts = name.split()
-        if len(parts) >= 2:
-            first_part = parts[0]
-            # Check if first part is consecutive letters (initials)
-            if len(first_part) > 1 and first_part.isalpha():
-                # Convert "gv" to "g. v."
-                spaced = '. '.join(first_part) + '.'
-                return spaced + ' ' + ' '.join(parts[1:])
-        return name
-    
-    name1_init_norm = expand_consecutive_initials(name1_normalized)
-    name2_init_norm = expand_consecutive_initials(name2_normalized)
+    name1_init_norm = _expand_consecutive_initials(name1_normalized)
+    name2_init_norm = _expand_consecutive_initials(name2_normalized)
     
     if name1_init_norm == name2_init_norm:
         return True
@@ -1100,59 +1481,10 @@ def is_name_match(name1: str, name2: str) -> bool:
     #     return True
     
     # Handle surname particles/prefixes before splitting
-    def normalize_surname_particles(name_parts):
-        """Group surname particles with the following surname component"""
-        surname_particles = {
-            'von', 'van', 'de', 'del', 'della', 'di', 'da', 'dos', 'du', 'le', 'la', 'las', 'los',
-            'mc', 'mac', 'o', 'ibn', 'bin', 'ben', 'af', 'av', 'zu', 'zur', 'zum', 'ter', 'ten',
-            'der', 'den', 'des'  # Articles that often follow 'van', 'von', etc.
-        }
-        
-        if len(name_parts) < 2:
-            return name_parts
-            
-        normalized_parts = []
-        i = 0
-        while i < len(name_parts):
-            current_part = name_parts[i]
-            
-            # Check if current part is a surname particle
-            # Be more conservative: avoid treating short words as particles when followed by short surnames
-            # This prevents "Da Yu" from being treated as particle+surname instead of first+last name
-            # Also avoid treating first names as particles in 2-word names (e.g., "Bin Chen" shouldn't become "bin chen")
-            if (current_part.lower() in surname_particles and 
-                i + 1 < len(name_parts) and  # Not the last part
-                not (len(current_part) <= 2 and len(name_parts) == 2 and len(name_parts[i + 1]) <= 3) and  # Avoid "Da Yu" -> "Da Yu"
-                not (i == 0 and len(name_parts) == 2)):  # Avoid treating first word as particle in 2-word names
-                
-                # Collect all consecutive particles
-                compound_parts = [current_part]
-                j = i + 1
-                
-                # Look for additional particles (like "van der" or "von dem")
-                while (j < len(name_parts) - 1 and  # Not the last part
-                       name_parts[j].lower() in surname_particles):
-                    compound_parts.append(name_parts[j])
-                    j += 1
-                
-                # Add the actual surname part
-                if j < len(name_parts):
-                    compound_parts.append(name_parts[j])
-                    j += 1
-                
-                # Create compound surname
-                compound_surname = " ".join(compound_parts)
-                normalized_parts.append(compound_surname)
-                i = j  # Skip all processed parts
-            else:
-                normalized_parts.append(current_part)
-                i += 1
-                
-        return normalized_parts
     
     # Split into parts (first name, last name, etc.) using normalized names with consistent spacing
-    parts1 = normalize_surname_particles(name1_normalized.split())
-    parts2 = normalize_surname_particles(name2_normalized.split())
+    parts1 = _normalize_surname_particles(name1_normalized.split())
+    parts2 = _normalize_surname_particles(name2_normalized.split())
     
     
     # Basic 2-part name matching: "F. Last" vs "First Last" 
@@ -1330,71 +1662,9 @@ def is_name_match(name1: str, name2: str) -> bool:
 
     # Special case: Handle "G. V. Horn" vs "Grant Van Horn" patterns
     # This handles both surname particle normalization effects and standard 3-part names
-    def match_initials_with_names(init_parts, name_parts):
-        """Helper function to match initials against full names"""
-        if len(init_parts) == 3 and len(name_parts) == 2:
-            # After surname particle normalization: ['g.', 'v.', 'horn'] vs ['grant', 'van horn']
-            if (len(init_parts[0].rstrip('.')) == 1 and len(init_parts[1].rstrip('.')) == 1 and len(init_parts[2]) > 1 and
-                len(name_parts[0]) > 1 and len(name_parts[1]) > 1):
-                
-                first_initial = init_parts[0].rstrip('.')
-                middle_initial = init_parts[1].rstrip('.')
-                last_name = init_parts[2]
-                first_name = name_parts[0]
-                compound_last = name_parts[1]
-                
-                # Extract middle and last parts from compound lastname
-                compound_parts = compound_last.split()
-                if len(compound_parts) >= 2:
-                    middle_name = compound_parts[0]
-                    actual_last = compound_parts[-1]
-                    
-                    if (last_name == actual_last and 
-                        first_initial == first_name[0] and
-                        middle_initial == middle_name[0]):
-                        return True
-        
-        elif len(init_parts) == 3 and len(name_parts) == 3:
-            # Check for "Last, First Middle" vs "First Middle Last" format
-            # e.g., "ong, c. s." vs "cheng soon ong"
-            if (len(init_parts[0]) > 1 and  # Last name
-                len(init_parts[1].rstrip('.')) == 1 and  # First initial
-                len(init_parts[2].rstrip('.')) == 1 and  # Middle initial
-                len(name_parts[0]) > 1 and len(name_parts[1]) > 1 and len(name_parts[2]) > 1):
-                
-                last_name_cited = init_parts[0].rstrip(',')  # "ong" (remove comma)
-                first_initial_cited = init_parts[1].rstrip('.')  # "c"
-                middle_initial_cited = init_parts[2].rstrip('.')  # "s"
-                
-                first_name_correct = name_parts[0]  # "cheng"
-                middle_name_correct = name_parts[1]  # "soon"
-                last_name_correct = name_parts[2]  # "ong"
-                
-                if (last_name_cited == last_name_correct and
-                    first_initial_cited == first_name_correct[0] and
-                    middle_initial_cited == middle_name_correct[0]):
-                    return True
-            
-            # Standard 3-part case: ['g.', 'v.', 'horn'] vs ['grant', 'van', 'horn']
-            elif (len(init_parts[0].rstrip('.')) == 1 and len(init_parts[1].rstrip('.')) == 1 and len(init_parts[2]) > 1 and
-                len(name_parts[0]) > 1 and len(name_parts[1]) > 1 and len(name_parts[2]) > 1):
-                
-                first_initial = init_parts[0].rstrip('.')
-                middle_initial = init_parts[1].rstrip('.')
-                last_name = init_parts[2]
-                first_name = name_parts[0]
-                middle_name = name_parts[1]
-                actual_last = name_parts[2]
-                
-                if (last_name == actual_last and 
-                    first_initial == first_name[0] and
-                    middle_initial == middle_name[0]):
-                    return True
-        
-        return False
     
     # Try both directions
-    if match_initials_with_names(parts1, parts2) or match_initials_with_names(parts2, parts1):
+    if _match_initials_with_names(parts1, parts2) or _match_initials_with_names(parts2, parts1):
         return True
 
     # Special case: Handle single letter first name variations like "S. Jeong" vs "S Jeong"
@@ -1575,18 +1845,10 @@ def is_name_match(name1: str, name2: str) -> bool:
 
     # Special case: Handle "Last, First" vs "First Last" patterns
     # e.g., "Cubitt, Toby S" vs "Toby S. Cubitt", "Smith, John" vs "John Smith"
-    def parse_comma_separated_name(name):
-        """Parse 'Last, First' format into (first_part, last_part)"""
-        if ',' in name:
-            parts = name.split(',', 1)  # Only split on first comma
-            last_part = parts[0].strip()
-            first_part = parts[1].strip()
-            return first_part, last_part
-        return None, None
     
     # Check if either name has comma format
-    first1_comma, last1_comma = parse_comma_separated_name(name1_normalized)
-    first2_comma, last2_comma = parse_comma_separated_name(name2_normalized)
+    first1_comma, last1_comma = _parse_comma_separated_name(name1_normalized)
+    first2_comma, last2_comma = _parse_comma_separated_name(name2_normalized)
     
     if first1_comma and last1_comma and not (first2_comma and last2_comma):
         # name1 is "Last, First" format, name2 is regular format
@@ -1699,176 +1961,15 @@ def is_name_match(name1: str, name2: str) -> bool:
     if parts1[-1] != parts2[-1]:
         return False
     
-    def _matches_name_part(abbrev, full):
-        """Check if abbreviated name part matches full name part"""
-        # Handle cases like "S." vs "Scott", "A.-D." vs "Alexandru-Daniel", "I. J." vs "I."
-        abbrev_clean = abbrev.rstrip('.')
-        full_clean = full.rstrip('.')
-        
-        # If abbrev is single letter, check if it matches first letter of full name
-        if len(abbrev_clean) == 1:
-            return abbrev_clean == full_clean[0] if full_clean else False
-        
-        # If abbrev has hyphens/dashes, check each part FIRST (before general multiple initials)
-        if '-' in abbrev_clean:
-            abbrev_letters = [p.strip().rstrip('.') for p in abbrev_clean.split('-')]
-            if '-' in full:
-                # Full name also has hyphens - match part by part
-                full_parts_split = [p.strip() for p in full.split('-')]
-                if len(abbrev_letters) == len(full_parts_split):
-                    for al, fp in zip(abbrev_letters, full_parts_split):
-                        if len(al) == 1 and al != fp[0]:
-                            return False
-                        elif len(al) > 1 and al != fp:
-                            return False
-                    return True
-                else:
-                    return False
-            else:
-                # Full name doesn't have hyphens, but abbrev does
-                # Try to match by treating the full name as space-separated parts
-                # e.g., "A.-D." vs "Alexandru Daniel" 
-                full_space_parts = full.split()
-                if len(abbrev_letters) == len(full_space_parts):
-                    for al, fp in zip(abbrev_letters, full_space_parts):
-                        if len(al) == 1 and al != fp[0]:
-                            return False
-                        elif len(al) > 1 and al != fp:
-                            return False
-                    return True
-                else:
-                    return False
-        
-        # Handle multiple initials case: "I. J." should match "I."
-        # Split by spaces, dots, and hyphens to get individual initials
-        abbrev_initials = [p.strip().rstrip('.').lstrip('-') for p in re.split(r'[\s.\-]+', abbrev_clean) if p.strip()]
-        full_initials = [p.strip().rstrip('.').lstrip('-') for p in re.split(r'[\s.\-]+', full_clean) if p.strip()]
-        
-        # If both are multiple initials, check if they match appropriately
-        if len(abbrev_initials) > 1 and len(full_initials) >= 1:
-            # Handle cases like "l.g" vs "leslie g" or "i j" vs "i"
-            # Also handle reverse case like "leslie g" vs "l.g"
-            
-            # Determine which one has the initials and which has full names
-            if all(len(p) == 1 for p in abbrev_initials) and any(len(p) > 1 for p in full_initials):
-                # abbrev has initials, full has names: "l g" vs "leslie g"
-                # Must have same number of parts or fewer initials than full names
-                if len(abbrev_initials) > len(full_initials):
-                    return False
-                for i, abbrev_initial in enumerate(abbrev_initials):
-                    if i < len(full_initials):
-                        if abbrev_initial != full_initials[i][0]:
-                            return False
-                return True
-            elif any(len(p) > 1 for p in abbrev_initials) and all(len(p) == 1 for p in full_initials):
-                # abbrev has names, full has initials: "leslie g" vs "l g"  
-                # But only match if they have the same number of parts
-                if len(abbrev_initials) != len(full_initials):
-                    return False
-                for i, full_initial in enumerate(full_initials):
-                    if full_initial != abbrev_initials[i][0]:
-                        return False
-                return True
-            else:
-                # Mixed case or both same type, use original logic
-                for i, abbrev_initial in enumerate(abbrev_initials):
-                    if i < len(full_initials):
-                        full_part = full_initials[i]
-                        # If abbrev_initial is single letter and full_part is longer, compare with first letter
-                        if len(abbrev_initial) == 1 and len(full_part) > 1:
-                            if abbrev_initial != full_part[0]:
-                                return False
-                        # If both are single letters or same length, compare directly
-                        elif abbrev_initial != full_part:
-                            return False
-                    # If abbrev has more initials than full, that's OK (extra initials ignored)
-                return True
-        
-        # Otherwise, abbrev should be contained in full name
-        return full.startswith(abbrev_clean)
-
     # Handle abbreviated vs full names
-    def matches_abbreviated(abbrev_parts, full_parts):
-        """Check if abbreviated name matches full name"""
-        # Note: abbrev_parts can have more parts than full_parts in cases like:
-        # "I. J. Smith" (3 parts) vs "I. Smith" (2 parts) where "I. J." should match "I."
-        
-        # Special case: single part abbreviated name vs single part full name
-        # e.g., "A.-D." vs "Alexandru-Daniel"
-        if len(abbrev_parts) == 1 and len(full_parts) == 1:
-            return _matches_name_part(abbrev_parts[0], full_parts[0])
-        
-        # Last names must match exactly
-        if abbrev_parts[-1] != full_parts[-1]:
-            return False
-        
-        # Handle different scenarios based on number of parts
-        if len(abbrev_parts) == len(full_parts):
-            # Same number of parts - match each part except last (already checked)
-            for i in range(len(abbrev_parts) - 1):
-                if not _matches_name_part(abbrev_parts[i], full_parts[i]):
-                    return False
-        elif len(abbrev_parts) < len(full_parts):
-            # Fewer abbreviated parts - match first parts
-            # e.g., "Q." (1 part) vs "Qing Xue" (2 parts) - no first names to check
-            # e.g., "A. Smith" (2 parts) vs "Alexander John Smith" (3 parts) - check "A." vs "Alexander"
-            # e.g., "L.G. Valiant" (2 parts) vs "Leslie G. Valiant" (3 parts) - check "L.G." vs "Leslie G."
-            num_first_names = len(abbrev_parts) - 1  # All but last part
-            for i in range(num_first_names):
-                # Special handling for concatenated initials like "L.G." vs multiple full names
-                abbrev_part = abbrev_parts[i]
-                if ('.' in abbrev_part and len(abbrev_part.rstrip('.')) > 1 and 
-                    all(len(c) == 1 for c in abbrev_part.rstrip('.').replace('.', ''))):
-                    # This looks like concatenated initials (e.g., "L.G.")
-                    # Match against combined full parts
-                    remaining_full_parts_count = len(full_parts) - len(abbrev_parts) + 1
-                    combined_full = ' '.join(full_parts[i:i + remaining_full_parts_count])
-                    if not _matches_name_part(abbrev_part, combined_full):
-                        return False
-                    # Skip the matched full parts
-                    continue
-                else:
-                    # Regular single initial matching
-                    if not _matches_name_part(abbrev_part, full_parts[i]):
-                        return False
-        elif len(abbrev_parts) > len(full_parts):
-            # More abbreviated parts than full parts
-            # e.g., "I. J. Smith" (3 parts) vs "I. Smith" (2 parts)
-            # Check if the first parts of abbrev match the first parts of full
-            num_full_first_names = len(full_parts) - 1  # All but last part of full
-            
-            # Build a combined abbreviated first name from multiple parts
-            # "I. J." should be treated as one first name unit
-            if num_full_first_names == 1:
-                # full has one first name, abbrev has multiple first name parts
-                
-                # Special case: Handle "Nitin J." vs "N." - check if first name initial matches
-                # e.g., abbrev_parts = ['nitin', 'j.', 'sanket'], full_parts = ['n.', 'sanket']
-                if (len(abbrev_parts) >= 2 and 
-                    len(full_parts[0].rstrip('.')) == 1 and 
-                    len(abbrev_parts[0]) > 1):
-                    # Check if first letter of full first name matches first letter of abbreviated first name
-                    if abbrev_parts[0][0] == full_parts[0].rstrip('.'):
-                        return True
-                
-                combined_abbrev_first = ' '.join(abbrev_parts[:-1])  # All but last
-                if not _matches_name_part(combined_abbrev_first, full_parts[0]):
-                    return False
-            else:
-                # More complex case - match part by part for available positions
-                for i in range(min(num_full_first_names, len(abbrev_parts) - 1)):
-                    if not _matches_name_part(abbrev_parts[i], full_parts[i]):
-                        return False
-        
-        return True
     
     # Check if name1 is abbreviated form of name2
     if any('.' in part for part in parts1):
-        return matches_abbreviated(parts1, parts2)
+        return _matches_abbreviated(parts1, parts2)
     
     # Check if name2 is abbreviated form of name1
     if any('.' in part for part in parts2):
-        return matches_abbreviated(parts2, parts1)
+        return _matches_abbreviated(parts2, parts1)
     
     # For non-abbreviated names, compare first initials and last names
     if parts1[0][0] != parts2[0][0]:
@@ -2033,6 +2134,33 @@ def enhanced_name_match(name1: str, name2: str) -> bool:
     return False
 
 
+# Standalone "et al" entries in a cited author list
+ET_AL_VARIANTS = frozenset({
+    'et al', 'et al.', 'et.al', 'et.al.',
+    'and others', 'and other', 'etc', 'etc.', '...',
+})
+
+# "et al" variations at the end of an author name: "et al.", "and others", "et.al", "etc", "..."
+_TRAILING_ET_AL_VARIANT_RE = re.compile(
+    r'\bet\s+al\.?$|\band\s+others?$|\bet\s*\.?\s*al\.?$|\betc\.?$|\s+\.\.\.$'
+)
+# Suffixes stripped from an author name, applied in order
+_ET_AL_SUFFIX_PATTERNS = (
+    re.compile(r'\s+et\s+al\.?$', re.IGNORECASE),
+    re.compile(r'\s+and\s+others?$', re.IGNORECASE),
+    re.compile(r'\s+et\s*\.?\s*al\.?$', re.IGNORECASE),
+    re.compile(r'\s+etc\.?$', re.IGNORECASE),
+    re.compile(r'\s+\.\.\.$'),
+)
+_REFERENCE_NUMBER_PREFIX_RE = re.compile(r'^\[\d+\]')
+
+
+def _author_surname_key(author_name: str) -> str:
+    """Lowercased last word of an author name in 'Firstname Lastname' display form"""
+    words = (format_author_for_display(author_name) or '').split()
+    return words[-1].lower() if words else ''
+
+
 def compare_authors(cited_authors: list, correct_authors: list, normalize_func=None) -> tuple:
     """
     Compare author lists to check if they match.
@@ -2071,27 +2199,13 @@ def compare_authors(cited_authors: list, correct_authors: list, normalize_func=N
         if not text:
             return False
         text_clean = str(text).strip().lower()
-        # Check for standalone et al variants
-        et_al_variants = [
-            'et al', 'et al.', 'et.al', 'et.al.', 
-            'and others', 'and other', 'etc', 'etc.', '...'
-        ]
-        return text_clean in et_al_variants
+        return text_clean in ET_AL_VARIANTS
     
     def contains_et_al(text):
         """Check if text contains 'et al' variations at the end"""
         if not text:
             return False
-        text_lower = str(text).lower()
-        # Common variations of "et al" at end of author names
-        et_al_patterns = [
-            r'\bet\s+al\.?$',          # "et al" or "et al." at end
-            r'\band\s+others?$',       # "and others" or "and other" at end
-            r'\bet\s*\.?\s*al\.?$',    # "et.al" or similar variations
-            r'\betc\.?$',              # "etc" or "etc." at end
-            r'\s+\.\.\.$',             # "..." at end (sometimes used like et al)
-        ]
-        return any(re.search(pattern, text_lower) for pattern in et_al_patterns)
+        return _TRAILING_ET_AL_VARIANT_RE.search(str(text).lower()) is not None
     
     # Clean up cited author names and detect "et al"
     cleaned_cited = []
@@ -2099,7 +2213,7 @@ def compare_authors(cited_authors: list, correct_authors: list, normalize_func=N
     
     for author in cited_authors:
         # Remove reference numbers (e.g., "[1]")
-        author = re.sub(r'^\[\d+\]', '', str(author))
+        author = _REFERENCE_NUMBER_PREFIX_RE.sub('', str(author))
         # Remove line breaks
         author = author.replace('\n', ' ')
         author_clean = author.strip()
@@ -2116,11 +2230,8 @@ def compare_authors(cited_authors: list, correct_authors: list, normalize_func=N
         if contains_et_al(author_clean):
             has_et_al = True
             # Remove "et al" and similar patterns from the author name
-            author_clean = re.sub(r'\s+et\s+al\.?$', '', author_clean, flags=re.IGNORECASE)
-            author_clean = re.sub(r'\s+and\s+others?$', '', author_clean, flags=re.IGNORECASE)
-            author_clean = re.sub(r'\s+et\s*\.?\s*al\.?$', '', author_clean, flags=re.IGNORECASE)
-            author_clean = re.sub(r'\s+etc\.?$', '', author_clean, flags=re.IGNORECASE)
-            author_clean = re.sub(r'\s+\.\.\.$', '', author_clean)
+            for et_al_suffix in _ET_AL_SUFFIX_PATTERNS:
+                author_clean = et_al_suffix.sub('', author_clean)
             author_clean = author_clean.strip()
             
             if author_clean:  # Only add if something remains after removing "et al"
@@ -2143,15 +2254,38 @@ def compare_authors(cited_authors: list, correct_authors: list, normalize_func=N
         # Import here to avoid circular imports
         from refchecker.utils.error_utils import format_author_mismatch
         # For et al cases, check if each cited author matches ANY author in the correct list
-        # rather than comparing positionally, since author order can vary
+        # rather than comparing positionally, since author order can vary.
+        # Names spelled identically to a correct author are found with one dict lookup;
+        # only the rest fall back to pairwise enhanced matching.
+        correct_by_lower = {}
+        for correct_author in correct_names:
+            correct_by_lower.setdefault(correct_author.lower(), correct_author)
+        # Correct authors grouped by surname, built on the first miss; a cited
+        # author is tried against namesakes first so long author lists are
+        # usually resolved without walking the whole list
+        correct_by_surname = None
         for i, cited_author in enumerate(cleaned_cited):
-            author_found = False
-            matched_author = None
-            for correct_author in correct_names:
-                if enhanced_name_match(cited_author, correct_author):
-                    author_found = True
-                    matched_author = correct_author
-                    break
+            matched_author = correct_by_lower.get(cited_author.lower())
+            author_found = matched_author is not None
+            if not author_found:
+                if correct_by_surname is None:
+                    correct_by_surname = {}
+                    for correct_author in correct_names:
+                        correct_by_surname.setdefault(_author_surname_key(correct_author), []).append(correct_author)
+                namesakes = correct_by_surname.get(_author_surname_key(cited_author), ())
+                for correct_author in namesakes:
+                    if enhanced_name_match(cited_author, correct_author):
+                        author_found = True
+                        matched_author = correct_author
+                        break
+            if not author_found:
+                for correct_author in correct_names:
+                    if correct_author in namesakes:
+                        continue
+                    if enhanced_name_match(cited_author, correct_author):
+                        author_found = True
+                        matched_author = correct_author
+                        break
             
             if not author_found:
                 # Use standardized three-line formatting for author mismatch
@@ -2162,40 +2296,17 @@ def compare_authors(cited_authors: list, correct_authors: list, normalize_func=N
         
         return True, f"Authors match (verified {len(cleaned_cited)} of {len(correct_names)} with et al)"
     
-    # Detect if cited authors look like parsing fragments 
-    # (many short single-word entries that might be first/last name fragments)
-    def looks_like_fragments(authors_list):
-        if len(authors_list) < 4:  # Need at least 4 to detect fragment pattern
-            return False
-        single_word_count = sum(1 for author in authors_list if len(author.strip().split()) == 1)
-        return single_word_count >= len(authors_list) * 0.7  # 70% or more are single words
-    
     # Normal case without "et al" - compare all authors
     if len(cleaned_cited) != len(correct_names):
-        
-        # Check if cited authors look like parsing fragments
-        if looks_like_fragments(cleaned_cited):
-            from refchecker.utils.error_utils import format_author_count_mismatch
-            display_cited = [format_author_for_display(author) for author in cleaned_cited]
-            error_msg = format_author_count_mismatch(len(cleaned_cited), len(correct_names), display_cited, correct_names)
-            return False, error_msg
-        
-        # For all count mismatches, show the count mismatch error
-        if len(cleaned_cited) < len(correct_names):
-            from refchecker.utils.error_utils import format_author_count_mismatch
-            display_cited = [format_author_for_display(author) for author in cleaned_cited]
-            error_msg = format_author_count_mismatch(len(cleaned_cited), len(correct_names), display_cited, correct_names)
-            return False, error_msg
-        
-        # For cases where cited > correct, also show count mismatch
-        elif len(cleaned_cited) > len(correct_names):
-            from refchecker.utils.error_utils import format_author_count_mismatch
-            display_cited = [format_author_for_display(author) for author in cleaned_cited]
-            error_msg = format_author_count_mismatch(len(cleaned_cited), len(correct_names), display_cited, correct_names)
-            return False, error_msg
-    else:
-        comparison_cited = cleaned_cited
-        comparison_correct = correct_names
+        # Whether the cited list is short, long, or split into first/last name
+        # fragments, report the count mismatch with the cited authors in display form
+        from refchecker.utils.error_utils import format_author_count_mismatch
+        display_cited = [format_author_for_display(author) for author in cleaned_cited]
+        error_msg = format_author_count_mismatch(len(cleaned_cited), len(correct_names), display_cited, correct_names)
+        return False, error_msg
+    
+    comparison_cited = cleaned_cited
+    comparison_correct = correct_names
     
     # Use shared three-line formatter (imported lazily to avoid circular imports)
     from refchecker.utils.error_utils import format_first_author_mismatch, format_author_mismatch
@@ -2395,6 +2506,10 @@ def detect_bibtex_format(text):
     return type_count >= 2
 
 
+# Trailing semicolon or comma left over from splitting an author list
+_TRAILING_LIST_SEPARATOR_RE = re.compile(r'[;,]\s*$')
+
+
 def format_author_for_display(author_name):
     """
     Convert author name from 'Lastname, Firstname' to 'Firstname Lastname' format for display.
@@ -2414,7 +2529,7 @@ def format_author_for_display(author_name):
     # Clean up any stray punctuation that might have been attached during parsing
     author_name = author_name.strip()
     # Remove trailing semicolons that sometimes get attached during bibliographic parsing
-    author_name = re.sub(r'[;,]\s*$', '', author_name)
+    author_name = _TRAILING_LIST_SEPARATOR_RE.sub('', author_name)
     
     # Normalize apostrophes for consistent display
     author_name = normalize_apostrophes(author_name)
@@ -2451,213 +2566,238 @@ def format_authors_for_display(authors):
     return ', '.join(formatted_authors)
 
 
+# Characters that can start any of the LaTeX markup handled by strip_latex_commands
+_LATEX_MARKUP_CHAR_RE = re.compile(r'[\\%"`~${}]')
+
+# LaTeX comments (% to end of line), but not URL-encoded characters like %20
+_LATEX_COMMENT_RE = re.compile(r'%(?![0-9A-Fa-f]{2}).*')
+
+# LaTeX accented characters, applied in order before general command removal
+_LATEX_ACCENT_PATTERNS = tuple((re.compile(pattern), replacement) for pattern, replacement in (
+    # Acute accents
+    (r"\{\\\'([aeiouAEIOU])\}", r'\1'),  # {\'a} -> á
+    (r"\\\'([aeiouAEIOU])", r'\1'),      # \'a -> á
+    # Grave accents
+    (r"\{\\`([aeiouAEIOU])\}", r'\1'),   # {\`a} -> à
+    (r"\\`([aeiouAEIOU])", r'\1'),       # \`a -> à
+    # Grave accents - partially processed forms (backslashes already stripped)
+    (r"\{`([aeiouAEIOU])\}", r'\1'),     # {`a} -> a
+    (r"`([aeiouAEIOU])", r'\1'),         # `a -> a
+    # Circumflex
+    (r"\{\\\^([aeiouAEIOU])\}", r'\1'),  # {\^a} -> â
+    (r"\\\^([aeiouAEIOU])", r'\1'),      # \^a -> â
+    # Umlaut/diaeresis - handle both \" and \\"
+    (r'\{\\"([aeiouAEIOU])\}', r'\1'),   # {\"a} -> ä
+    (r'\{\\\\"([aeiouAEIOU])\}', r'\1'), # {\\"a} -> ä
+    (r'\\"([aeiouAEIOU])', r'\1'),       # \"a -> ä
+    (r'\\\\"([aeiouAEIOU])', r'\1'),     # \\"a -> ä
+    # Umlaut/diaeresis - partially processed forms (backslashes already stripped)
+    (r'\{"([aeiouAEIOU])\}', r'\1'),     # {"a} -> a
+    (r'"([aeiouAEIOU])', r'\1'),         # "a -> a
+    # Tilde
+    (r"\{\\~([aeiouAEIOU])\}", r'\1'),   # {\~a} -> ã
+    (r"\\~([aeiouAEIOU])", r'\1'),       # \~a -> ã
+    # Cedilla
+    (r"\{\\c\{([cC])\}\}", r'\1'),       # {\c{c}} -> ç
+    (r"\\c\{([cC])\}", r'\1'),           # \c{c} -> ç
+    # Ring
+    (r"\{\\r\{([aA])\}\}", r'\1'),       # {\r{a}} -> å
+    (r"\\r\{([aA])\}", r'\1'),           # \r{a} -> å
+    # Slash
+    (r"\{\\\/([oO])\}", r'\1'),          # {\/o} -> ø
+    (r"\\\/([oO])", r'\1'),              # \/o -> ø
+    # Polish L with stroke - need to handle as replacements not patterns
+    (r'\\L(?=[a-z])', 'L'),              # \L followed by lowercase -> L
+    (r'\{\\L\}', 'L'),                   # {\L} -> L
+    (r'\\l(?=[a-z])', 'l'),              # \l followed by lowercase -> l
+    (r'\{\\l\}', 'l'),                   # {\l} -> l
+    # Special characters like {\`\i} -> ì
+    (r"\{\\`\\\\i\}", 'ì'),             # {\`\i} -> ì
+    (r"\\`\\\\i", 'ì'),                 # \`\i -> ì
+))
+
+_UMLAUT_CHARS = {
+    'a': 'ä', 'e': 'ë', 'i': 'ï', 'o': 'ö', 'u': 'ü',
+    'A': 'Ä', 'E': 'Ë', 'I': 'Ï', 'O': 'Ö', 'U': 'Ü'
+}
+
+# Umlaut forms converted to their Unicode equivalents
+_LATEX_UMLAUT_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'\{\\"([aeiouAEIOU])\}',    # {\"u} -> ü
+    r'\{\\\\"([aeiouAEIOU])\}',  # {\\"u} -> ü
+    r'\\"([aeiouAEIOU])',        # \"u -> ü
+    r'\\\\"([aeiouAEIOU])',      # \\"u -> ü
+    r'\{"([aeiouAEIOU])\}',      # {"u} -> ü
+    r'"([aeiouAEIOU])',          # "u -> ü
+))
+
+# Greek letter commands inside math mode
+_LATEX_GREEK_LETTERS = tuple((re.compile(r'\\' + name + r'\b'), letter) for name, letter in (
+    ('mu', 'μ'), ('alpha', 'α'), ('beta', 'β'), ('gamma', 'γ'), ('delta', 'δ'),
+    ('epsilon', 'ε'), ('lambda', 'λ'), ('pi', 'π'), ('sigma', 'σ'), ('theta', 'θ'),
+))
+_LATEX_MU_RE = _LATEX_GREEK_LETTERS[0][0]
+
+_LATEX_ET_AL_TILDE_RE = re.compile(r'\bet~al\.?')
+_LATEX_NAME_TILDE_RE = re.compile(r'([a-zA-Z])~([A-Z])')
+_LATEX_TEXT_FORMAT_RE = re.compile(r'\\(textbf|textit|emph|underline|textsc|texttt)\{([^{}]*)\}')
+_LATEX_FONT_SWITCH_RE = re.compile(r'\{\\(scshape|bfseries|itshape|ttfamily|sffamily|rmfamily)\s+([^{}]*)\}')
+_LATEX_FONT_SIZE_RE = re.compile(r'\\(tiny|scriptsize|footnotesize|small|normalsize|large|Large|LARGE|huge|Huge)\b')
+_LATEX_NESTED_MATH_RE = re.compile(r'\$\\\{[^}]*\\\}\$')
+_LATEX_MATH_MARKUP_RE = re.compile(r'[\$\{\}\\]+')
+_LATEX_INLINE_MATH_RE = re.compile(r'\$([^$]*)\$')
+_LATEX_EQUATION_RE = re.compile(r'\\begin\{equation\}.*?\\end\{equation\}', re.DOTALL)
+_LATEX_ALIGN_RE = re.compile(r'\\begin\{align\}.*?\\end\{align\}', re.DOTALL)
+_LATEX_SECTION_RE = re.compile(r'\\(section|subsection|subsubsection|paragraph|subparagraph)\*?\{([^{}]*)\}')
+_LATEX_CITE_RE = re.compile(r'\\cite[pt]?\*?\{([^}]+)\}')
+_LATEX_PENALTY_RE = re.compile(r'\\penalty\d+')
+_LATEX_BREAK_RE = re.compile(r'\\(newline|linebreak|pagebreak|clearpage|newpage)\b')
+_LATEX_ESCAPED_CHAR_RE = re.compile(r'\\([&%$#_{}~^\\])')
+_LATEX_COMMAND_WITH_ARG_RE = re.compile(r'\\[a-zA-Z]+\{[^{}]*\}')
+_LATEX_COMMAND_RE = re.compile(r'\\[a-zA-Z]+\b')
+_BRACED_GROUP_RE = re.compile(r'\{([^{}]+)\}')
+_NESTED_BRACED_GROUP_RE = re.compile(r'\{([^{}]*\{[^{}]*\}[^{}]*)\}')
+_DOUBLE_BRACED_GROUP_RE = re.compile(r'\{\{([^{}]+)\}\}')
+_TRIPLE_BRACED_GROUP_RE = re.compile(r'\{\{\{([^{}]+)\}\}\}')
+_BRACES_RE = re.compile(r'[{}]')
+
+
+def _replace_latex_umlaut(match):
+    """Replace a matched umlaut vowel with its Unicode equivalent"""
+    return _UMLAUT_CHARS.get(match.group(1), match.group(1))
+
+
+def _strip_nested_math(match):
+    """Reduce a nested math pattern like $\\{$$\\mu$second-scale$\\}$ to μsecond-scale"""
+    content = match.group(0)
+    if r'\mu' in content:
+        content = _LATEX_MU_RE.sub('μ', content)
+    # Remove all LaTeX math markup
+    return _LATEX_MATH_MARKUP_RE.sub('', content)
+
+
+def _convert_standard_math(match):
+    """Convert Greek letters in math mode and drop any remaining commands"""
+    content = match.group(1)
+    for pattern, letter in _LATEX_GREEK_LETTERS:
+        content = pattern.sub(letter, content)
+    return _LATEX_COMMAND_RE.sub('', content)
+
+
 def strip_latex_commands(text):
     """
     Strip LaTeX commands and markup from text
-    
+
     Args:
         text: Text containing LaTeX markup
-        
+
     Returns:
         Cleaned text with LaTeX commands removed
     """
     if not text:
         return ""
-    
+
+    # Most titles and venues contain no markup at all; every pass below needs at
+    # least one of these characters, so plain text only has its whitespace cleaned
+    if not _LATEX_MARKUP_CHAR_RE.search(text):
+        return _WHITESPACE_RE.sub(' ', text).strip()
+
     # Remove LaTeX comments (% followed by text to end of line)
     # But preserve URL-encoded characters like %20, %21, etc.
     # Only treat % as comment start if it's followed by non-hex digits or whitespace
-    text = re.sub(r'%(?![0-9A-Fa-f]{2}).*', '', text)
-    
+    if '%' in text:
+        text = _LATEX_COMMENT_RE.sub('', text)
+
+    # Each group of passes below needs a particular character to match anything.
+    # Nothing inserts backslashes or double quotes, so those are checked once here
+    has_backslash = '\\' in text
+    has_quote = '"' in text
+
     # Handle LaTeX accented characters first (before general command removal)
-    latex_accents = {
-        # Acute accents
-        r"\{\\\'([aeiouAEIOU])\}": r'\1',  # {\'a} -> á
-        r"\\\'([aeiouAEIOU])": r'\1',      # \'a -> á
-        # Grave accents  
-        r"\{\\`([aeiouAEIOU])\}": r'\1',   # {\`a} -> à
-        r"\\`([aeiouAEIOU])": r'\1',       # \`a -> à
-        # Grave accents - partially processed forms (backslashes already stripped)
-        r"\{`([aeiouAEIOU])\}": r'\1',     # {`a} -> a
-        r"`([aeiouAEIOU])": r'\1',         # `a -> a
-        # Circumflex
-        r"\{\\\^([aeiouAEIOU])\}": r'\1',  # {\^a} -> â
-        r"\\\^([aeiouAEIOU])": r'\1',      # \^a -> â
-        # Umlaut/diaeresis - handle both \" and \\"
-        r'\{\\"([aeiouAEIOU])\}': r'\1',   # {\"a} -> ä (handled by replace_umlaut function)
-        r'\{\\\\"([aeiouAEIOU])\}': r'\1', # {\\"a} -> ä
-        r'\\"([aeiouAEIOU])': r'\1',       # \"a -> ä
-        r'\\\\"([aeiouAEIOU])': r'\1',     # \\"a -> ä
-        # Umlaut/diaeresis - partially processed forms (backslashes already stripped)
-        r'\{"([aeiouAEIOU])\}': r'\1',     # {"a} -> a
-        r'"([aeiouAEIOU])': r'\1',         # "a -> a
-        # Tilde
-        r"\{\\~([aeiouAEIOU])\}": r'\1',   # {\~a} -> ã
-        r"\\~([aeiouAEIOU])": r'\1',       # \~a -> ã
-        # Cedilla
-        r"\{\\c\{([cC])\}\}": r'\1',       # {\c{c}} -> ç
-        r"\\c\{([cC])\}": r'\1',           # \c{c} -> ç
-        # Ring
-        r"\{\\r\{([aA])\}\}": r'\1',       # {\r{a}} -> å
-        r"\\r\{([aA])\}": r'\1',           # \r{a} -> å
-        # Slash
-        r"\{\\\/([oO])\}": r'\1',          # {\/o} -> ø
-        r"\\\/([oO])": r'\1',              # \/o -> ø
-        # Polish L with stroke - need to handle as replacements not patterns
-        r'\\L(?=[a-z])': 'L',              # \L followed by lowercase -> L
-        r'\{\\L\}': 'L',                   # {\L} -> L
-        r'\\l(?=[a-z])': 'l',              # \l followed by lowercase -> l  
-        r'\{\\l\}': 'l',                   # {\l} -> l
-        # Special characters like {\`\i} -> ì
-        r"\{\\`\\\\i\}": 'ì',             # {\`\i} -> ì
-        r"\\`\\\\i": 'ì',                 # \`\i -> ì
-    }
-    
-    # Helper function to replace umlaut characters with Unicode equivalents
-    def replace_umlaut(match):
-        char_map = {
-            'a': 'ä', 'e': 'ë', 'i': 'ï', 'o': 'ö', 'u': 'ü',
-            'A': 'Ä', 'E': 'Ë', 'I': 'Ï', 'O': 'Ö', 'U': 'Ü'
-        }
-        return char_map.get(match.group(1), match.group(1))
-    
-    # Apply accent replacements
-    for pattern, replacement in latex_accents.items():
-        if 'umlaut' in latex_accents.get(pattern, '') or 'diaeresis' in str(replacement):
-            # Skip umlaut patterns, handle them separately
-            continue
-        text = re.sub(pattern, replacement, text)
-    
+    if has_backslash or has_quote or '`' in text:
+        for pattern, replacement in _LATEX_ACCENT_PATTERNS:
+            text = pattern.sub(replacement, text)
+
     # Handle umlauts with proper Unicode conversion
-    text = re.sub(r'\{\\"([aeiouAEIOU])\}', replace_umlaut, text)     # {\"u} -> ü
-    text = re.sub(r'\{\\\\"([aeiouAEIOU])\}', replace_umlaut, text)   # {\\"u} -> ü
-    text = re.sub(r'\\"([aeiouAEIOU])', replace_umlaut, text)         # \"u -> ü
-    text = re.sub(r'\\\\"([aeiouAEIOU])', replace_umlaut, text)       # \\"u -> ü
-    text = re.sub(r'\{"([aeiouAEIOU])\}', replace_umlaut, text)       # {"u} -> ü
-    text = re.sub(r'"([aeiouAEIOU])', replace_umlaut, text)           # "u -> ü
-    
+    if has_quote:
+        for pattern in _LATEX_UMLAUT_PATTERNS:
+            text = pattern.sub(_replace_latex_umlaut, text)
+
     # Handle specific common patterns
     # Non-breaking space ~ should become regular space
-    text = re.sub(r'~', ' ', text)
-    
+    text = text.replace('~', ' ')
+
     # Handle et~al specifically (common in academic papers)
-    text = re.sub(r'\bet~al\.?', 'et al.', text)
-    
+    text = _LATEX_ET_AL_TILDE_RE.sub('et al.', text)
+
     # Handle name patterns like Juan~D -> Juan D
-    text = re.sub(r'([a-zA-Z])~([A-Z])', r'\1 \2', text)
-    
-    # Remove common text formatting commands
-    text = re.sub(r'\\(textbf|textit|emph|underline|textsc|texttt)\{([^{}]*)\}', r'\2', text)
-    
-    # Handle {\scshape ...} and similar font switching commands
-    text = re.sub(r'\{\\(scshape|bfseries|itshape|ttfamily|sffamily|rmfamily)\s+([^{}]*)\}', r'\2', text)
-    
-    # Remove font size commands
-    text = re.sub(r'\\(tiny|scriptsize|footnotesize|small|normalsize|large|Large|LARGE|huge|Huge)\b', '', text)
-    
-    # Handle complex math mode patterns first
-    # Pattern like $\{$$\mu$second-scale$\}$ should become μsecond-scale
-    def process_complex_math(match):
-        content = match.group(1)
-        # Handle common Greek letters
-        content = re.sub(r'\\mu\b', 'μ', content)  # \mu -> μ
-        content = re.sub(r'\\alpha\b', 'α', content)  # \alpha -> α
-        content = re.sub(r'\\beta\b', 'β', content)   # \beta -> β
-        content = re.sub(r'\\gamma\b', 'γ', content)  # \gamma -> γ
-        content = re.sub(r'\\delta\b', 'δ', content)  # \delta -> δ
-        content = re.sub(r'\\epsilon\b', 'ε', content)  # \epsilon -> ε
-        content = re.sub(r'\\lambda\b', 'λ', content)  # \lambda -> λ
-        content = re.sub(r'\\pi\b', 'π', content)    # \pi -> π
-        content = re.sub(r'\\sigma\b', 'σ', content)  # \sigma -> σ
-        content = re.sub(r'\\theta\b', 'θ', content)  # \theta -> θ
-        # Remove any remaining LaTeX commands and braces from inside math
-        content = re.sub(r'\\[a-zA-Z]+\b', '', content)
-        content = re.sub(r'[{}]', '', content)
-        # Clean up any remaining $ signs
-        content = re.sub(r'\$+', '', content)
-        return content
-    
-    # Handle complex nested math patterns first
-    # Pattern like $\{$$\mu$second-scale$\}$ should become μsecond-scale
-    def process_nested_math_specifically(match):
-        content = match.group(0)
-        # Handle the specific pattern: $\{$$\mu$second-scale$\}$
-        # Extract the meaningful parts
-        if r'\mu' in content:
-            # Replace \mu with μ and extract the surrounding text
-            content = re.sub(r'\\mu\b', 'μ', content)
-        # Remove all LaTeX math markup
-        content = re.sub(r'[\$\{\}\\]+', '', content)
-        return content
-    
-    # Handle the specific problematic pattern
-    text = re.sub(r'\$\\\{[^}]*\\\}\$', process_nested_math_specifically, text)
-    
-    # Handle Greek letters in math mode before removing delimiters
-    def process_standard_math(match):
-        content = match.group(1)
-        # Handle common Greek letters - content has single backslashes
-        content = re.sub(r'\\mu\b', 'μ', content)
-        content = re.sub(r'\\alpha\b', 'α', content)
-        content = re.sub(r'\\beta\b', 'β', content)
-        content = re.sub(r'\\gamma\b', 'γ', content)
-        content = re.sub(r'\\delta\b', 'δ', content)
-        content = re.sub(r'\\epsilon\b', 'ε', content)
-        content = re.sub(r'\\lambda\b', 'λ', content)
-        content = re.sub(r'\\pi\b', 'π', content)
-        content = re.sub(r'\\sigma\b', 'σ', content)
-        content = re.sub(r'\\theta\b', 'θ', content)
-        # Remove any remaining LaTeX commands
-        content = re.sub(r'\\[a-zA-Z]+\b', '', content)
-        return content
-    
-    # Remove standard math mode delimiters with Greek letter processing
-    text = re.sub(r'\$([^$]*)\$', process_standard_math, text)
-    text = re.sub(r'\\begin\{equation\}.*?\\end\{equation\}', '', text, flags=re.DOTALL)
-    text = re.sub(r'\\begin\{align\}.*?\\end\{align\}', '', text, flags=re.DOTALL)
-    
-    # Remove section commands but keep the text
-    text = re.sub(r'\\(section|subsection|subsubsection|paragraph|subparagraph)\*?\{([^{}]*)\}', r'\2', text)
-    
-    # Remove citation commands but keep the keys
-    text = re.sub(r'\\cite[pt]?\*?\{([^}]+)\}', r'[\1]', text)
-    
-    # Remove penalty commands (LaTeX line breaking hints)
-    text = re.sub(r'\\penalty\d+', '', text)
-    
-    # Remove common commands
-    text = re.sub(r'\\(newline|linebreak|pagebreak|clearpage|newpage)\b', ' ', text)
-    
-    # Remove escaped characters
-    text = re.sub(r'\\([&%$#_{}~^\\])', r'\1', text)
-    
-    # Remove remaining commands with arguments
-    text = re.sub(r'\\[a-zA-Z]+\{[^{}]*\}', '', text)
-    
-    # Remove remaining commands without arguments
-    text = re.sub(r'\\[a-zA-Z]+\b', '', text)
-    
-    # Remove excessive curly braces that are used for grouping in LaTeX/BibTeX
-    # Handle nested braces carefully - remove outer braces but preserve content
-    # First pass: remove simple {content} patterns (single level)
-    text = re.sub(r'\{([^{}]+)\}', r'\1', text)
-    
-    # Second pass: handle any remaining nested braces (up to 2 levels deep)
-    # This handles cases like {{title}} -> {title} -> title
-    text = re.sub(r'\{([^{}]*\{[^{}]*\}[^{}]*)\}', r'\1', text)
-    text = re.sub(r'\{([^{}]+)\}', r'\1', text)
-    
-    # Third pass: handle any remaining double braces or triple braces
-    text = re.sub(r'\{\{([^{}]+)\}\}', r'\1', text)
-    text = re.sub(r'\{\{\{([^{}]+)\}\}\}', r'\1', text)
-    
-    # Remove any isolated braces that might be left
-    text = re.sub(r'[{}]', '', text)
-    
+    text = _LATEX_NAME_TILDE_RE.sub(r'\1 \2', text)
+
+    if has_backslash:
+        # Remove common text formatting commands
+        text = _LATEX_TEXT_FORMAT_RE.sub(r'\2', text)
+
+        # Handle {\scshape ...} and similar font switching commands
+        text = _LATEX_FONT_SWITCH_RE.sub(r'\2', text)
+
+        # Remove font size commands
+        text = _LATEX_FONT_SIZE_RE.sub('', text)
+
+    if '$' in text:
+        # Handle the specific problematic pattern
+        # Pattern like $\{$$\mu$second-scale$\}$ should become μsecond-scale
+        text = _LATEX_NESTED_MATH_RE.sub(_strip_nested_math, text)
+
+        # Remove standard math mode delimiters with Greek letter processing
+        text = _LATEX_INLINE_MATH_RE.sub(_convert_standard_math, text)
+
+    if has_backslash:
+        text = _LATEX_EQUATION_RE.sub('', text)
+        text = _LATEX_ALIGN_RE.sub('', text)
+
+        # Remove section commands but keep the text
+        text = _LATEX_SECTION_RE.sub(r'\2', text)
+
+        # Remove citation commands but keep the keys
+        text = _LATEX_CITE_RE.sub(r'[\1]', text)
+
+        # Remove penalty commands (LaTeX line breaking hints)
+        text = _LATEX_PENALTY_RE.sub('', text)
+
+        # Remove common commands
+        text = _LATEX_BREAK_RE.sub(' ', text)
+
+        # Remove escaped characters
+        text = _LATEX_ESCAPED_CHAR_RE.sub(r'\1', text)
+
+        # Remove remaining commands with arguments
+        text = _LATEX_COMMAND_WITH_ARG_RE.sub('', text)
+
+        # Remove remaining commands without arguments
+        text = _LATEX_COMMAND_RE.sub('', text)
+
+    if '{' in text or '}' in text:
+        # Remove excessive curly braces that are used for grouping in LaTeX/BibTeX
+        # Handle nested braces carefully - remove outer braces but preserve content
+        # First pass: remove simple {content} patterns (single level)
+        text = _BRACED_GROUP_RE.sub(r'\1', text)
+
+        # Second pass: handle any remaining nested braces (up to 2 levels deep)
+        # This handles cases like {{title}} -> {title} -> title
+        text = _NESTED_BRACED_GROUP_RE.sub(r'\1', text)
+        text = _BRACED_GROUP_RE.sub(r'\1', text)
+
+        # Third pass: handle any remaining double braces or triple braces
+        text = _DOUBLE_BRACED_GROUP_RE.sub(r'\1', text)
+        text = _TRIPLE_BRACED_GROUP_RE.sub(r'\1', text)
+
+        # Remove any isolated braces that might be left
+        text = _BRACES_RE.sub('', text)
+
     # Clean up multiple spaces and normalize whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     text = text.strip()
-    
+
     return text
 
 
@@ -3746,151 +3886,156 @@ def compare_titles_with_latex_cleaning(cited_title: str, database_title: str) ->
     return calculate_title_similarity(clean_cited, database_title)
 
 
-def calculate_title_similarity(title1: str, title2: str) -> float:
+# Title normalization patterns used by calculate_title_similarity
+_TRAILING_YEAR_RE = re.compile(r"[,\s]*\b(19|20)\d{2}\b\s*$")
+_WHITESPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
+# Common technical term variations, e.g. "mmWave" vs "mm wave", "AI-driven" vs "AI driven"
+_TITLE_TECH_TERM_PATTERNS = (
+    (re.compile(r'\bmmwave\b'), 'mm wave'),  # mmWave -> mm wave
+    (re.compile(r'\bmm\s+wave\b'), 'mmwave'),  # mm wave -> mmWave (for reverse check)
+    (re.compile(r'\bai\s*-?\s*driven\b'), 'ai driven'),  # AI-driven/AI-Driven -> ai driven
+    (re.compile(r'\bml\s*-?\s*based\b'), 'ml based'),  # ML-based -> ml based
+    (re.compile(r'\b6g\s+networks?\b'), '6g network'),  # 6G networks -> 6g network
+    (re.compile(r'\b5g\s+networks?\b'), '5g network'),  # 5G networks -> 5g network
+)
+
+# Compound word variations, e.g. "pre trained" vs "pretrained". Applied in order, so a
+# forward mapping followed by its reverse brings both spellings to the same form.
+_TITLE_COMPOUND_PATTERNS = (
+    (re.compile(r'\bpre\s+trained\b'), 'pretrained'),
+    (re.compile(r'\bpretrained\b'), 'pre trained'),  # reverse mapping
+    (re.compile(r'\bmulti\s+modal\b'), 'multimodal'),
+    (re.compile(r'\bmultimodal\b'), 'multi modal'),
+    (re.compile(r'\bmulti\s+task\b'), 'multitask'),
+    (re.compile(r'\bmultitask\b'), 'multi task'),
+    (re.compile(r'\bmulti\s+agent\b'), 'multiagent'),
+    (re.compile(r'\bmultiagent\b'), 'multi agent'),
+    (re.compile(r'\bmulti\s+class\b'), 'multiclass'),
+    (re.compile(r'\bmulticlass\b'), 'multi class'),
+    (re.compile(r'\bmulti\s+layer\b'), 'multilayer'),
+    (re.compile(r'\bmultilayer\b'), 'multi layer'),
+    (re.compile(r'\bco\s+training\b'), 'cotraining'),
+    (re.compile(r'\bcotraining\b'), 'co training'),
+    (re.compile(r'\bfew\s+shot\b'), 'fewshot'),
+    (re.compile(r'\bfewshot\b'), 'few shot'),
+    (re.compile(r'\bzero\s+shot\b'), 'zeroshot'),
+    (re.compile(r'\bzeroshot\b'), 'zero shot'),
+    (re.compile(r'\bone\s+shot\b'), 'oneshot'),
+    (re.compile(r'\boneshot\b'), 'one shot'),
+    (re.compile(r'\breal\s+time\b'), 'realtime'),
+    (re.compile(r'\brealtime\b'), 'real time'),
+    (re.compile(r'\breal\s+world\b'), 'realworld'),
+    (re.compile(r'\brealworld\b'), 'real world'),
+    
+    # Handle BERT variants and technical terms with hyphens/spaces
+    (re.compile(r'\bscib\s+ert\b'), 'scibert'),  # SciB ERT -> SciBERT
+    (re.compile(r'\bscibert\b'), 'scib ert'),    # SciBERT -> SciB ERT (reverse mapping)
+    (re.compile(r'\bbio\s+bert\b'), 'biobert'),  # Bio BERT -> BioBERT
+    (re.compile(r'\bbiobert\b'), 'bio bert'),    # BioBERT -> Bio BERT
+    (re.compile(r'\brob\s+erta\b'), 'roberta'),  # Rob ERTa -> RoBERTa
+    (re.compile(r'\broberta\b'), 'rob erta'),    # RoBERTa -> Rob ERTa
+    (re.compile(r'\bdeb\s+erta\b'), 'deberta'),  # Deb ERTa -> DeBERTa
+    (re.compile(r'\bdeberta\b'), 'deb erta'),    # DeBERTa -> Deb ERTa
+    (re.compile(r'\bon\s+line\b'), 'online'),
+    (re.compile(r'\bonline\b'), 'on line'),
+    (re.compile(r'\boff\s+line\b'), 'offline'),
+    (re.compile(r'\boffline\b'), 'off line'),
+)
+
+# Edition suffixes ("Second Edition", "2nd Edition", "Revised Edition", ...), tried one at a time
+_TITLE_EDITION_PATTERNS = (
+    re.compile(r'\s+second\s+edition\s*$', re.IGNORECASE),
+    re.compile(r'\s+third\s+edition\s*$', re.IGNORECASE),
+    re.compile(r'\s+fourth\s+edition\s*$', re.IGNORECASE),
+    re.compile(r'\s+fifth\s+edition\s*$', re.IGNORECASE),
+    re.compile(r'\s+\d+(?:st|nd|rd|th)\s+edition\s*$', re.IGNORECASE),
+    re.compile(r'\s+revised\s+edition\s*$', re.IGNORECASE),
+    re.compile(r'\s+updated\s+edition\s*$', re.IGNORECASE),
+    re.compile(r'\s+new\s+edition\s*$', re.IGNORECASE),
+    re.compile(r'\s+latest\s+edition\s*$', re.IGNORECASE),
+)
+
+# Stop words ignored when comparing title word sets
+TITLE_STOP_WORDS = frozenset({'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'})
+
+
+@lru_cache(maxsize=4096)
+def _title_similarity_forms(title: str) -> Tuple[str, str, str]:
     """
-    Calculate similarity between two titles using multiple approaches
+    Normalize a title through the stages compared by calculate_title_similarity.
+    
+    Cached because one cited title is typically scored against many candidates.
     
     Args:
-        title1: First title
-        title2: Second title
+        title: Title to normalize
         
     Returns:
-        Similarity score between 0 and 1
+        Tuple of (lower-cased title without trailing year, dehyphenated form,
+        fully normalized form without punctuation)
     """
-    if not title1 or not title2:
-        return 0.0
-    
-    # Normalize titles for comparison
-    t1 = title1.lower().strip()
-    t2 = title2.lower().strip()
-
-    # Remove trailing year suffixes like ", 2024" or " 2024" for robust matching
-    def strip_trailing_year(s: str) -> str:
-        return re.sub(r"[,\s]*\b(19|20)\d{2}\b\s*$", "", s).strip()
-    t1 = strip_trailing_year(t1)
-    t2 = strip_trailing_year(t2)
-    
-    # Exact match
-    if t1 == t2:
-        return 1.0
+    # Normalize titles for comparison and remove trailing year suffixes like
+    # ", 2024" or " 2024" for robust matching
+    lowered = _TRAILING_YEAR_RE.sub("", title.lower().strip()).strip()
     
     # Handle common technical term variations before other processing
     # This helps with terms like "mmWave" vs "mm wave", "AI-driven" vs "AI driven", etc.
-    tech_patterns = [
-        (r'\bmmwave\b', 'mm wave'),  # mmWave -> mm wave
-        (r'\bmm\s+wave\b', 'mmwave'),  # mm wave -> mmWave (for reverse check)
-        (r'\bai\s*-?\s*driven\b', 'ai driven'),  # AI-driven/AI-Driven -> ai driven
-        (r'\bml\s*-?\s*based\b', 'ml based'),  # ML-based -> ml based
-        (r'\b6g\s+networks?\b', '6g network'),  # 6G networks -> 6g network
-        (r'\b5g\s+networks?\b', '5g network'),  # 5G networks -> 5g network
-    ]
-    
-    t1_tech_normalized = t1
-    t2_tech_normalized = t2
-    for pattern, replacement in tech_patterns:
-        t1_tech_normalized = re.sub(pattern, replacement, t1_tech_normalized)
-        t2_tech_normalized = re.sub(pattern, replacement, t2_tech_normalized)
-    
-    # Check for match after tech term normalization
-    if t1_tech_normalized == t2_tech_normalized:
-        return 1.0
+    tech_normalized = lowered
+    for pattern, replacement in _TITLE_TECH_TERM_PATTERNS:
+        tech_normalized = pattern.sub(replacement, tech_normalized)
     
     # Normalize hyphens to handle hyphenation differences
-    # Replace hyphens with spaces and normalize whitespace
-    t1_dehyphenated = re.sub(r'-', ' ', t1_tech_normalized)
-    t1_dehyphenated = re.sub(r'\s+', ' ', t1_dehyphenated).strip()
-    t2_dehyphenated = re.sub(r'-', ' ', t2_tech_normalized)
-    t2_dehyphenated = re.sub(r'\s+', ' ', t2_dehyphenated).strip()
-    
-    # Check for match after hyphen normalization
-    if t1_dehyphenated == t2_dehyphenated:
-        return 1.0
+    dehyphenated = _WHITESPACE_RE.sub(' ', tech_normalized.replace('-', ' ')).strip()
     
     # Handle compound word variations - normalize common academic compound words
     # This fixes cases like "pre trained" vs "pretrained", "multi modal" vs "multimodal"
-    compound_patterns = [
-        (r'\bpre\s+trained\b', 'pretrained'),
-        (r'\bpretrained\b', 'pre trained'),  # reverse mapping
-        (r'\bmulti\s+modal\b', 'multimodal'),
-        (r'\bmultimodal\b', 'multi modal'),
-        (r'\bmulti\s+task\b', 'multitask'),
-        (r'\bmultitask\b', 'multi task'),
-        (r'\bmulti\s+agent\b', 'multiagent'),
-        (r'\bmultiagent\b', 'multi agent'),
-        (r'\bmulti\s+class\b', 'multiclass'),
-        (r'\bmulticlass\b', 'multi class'),
-        (r'\bmulti\s+layer\b', 'multilayer'),
-        (r'\bmultilayer\b', 'multi layer'),
-        (r'\bco\s+training\b', 'cotraining'),
-        (r'\bcotraining\b', 'co training'),
-        (r'\bfew\s+shot\b', 'fewshot'),
-        (r'\bfewshot\b', 'few shot'),
-        (r'\bzero\s+shot\b', 'zeroshot'),
-        (r'\bzeroshot\b', 'zero shot'),
-        (r'\bone\s+shot\b', 'oneshot'),
-        (r'\boneshot\b', 'one shot'),
-        (r'\breal\s+time\b', 'realtime'),
-        (r'\brealtime\b', 'real time'),
-        (r'\breal\s+world\b', 'realworld'),
-        (r'\brealworld\b', 'real world'),
-        
-        # Handle BERT variants and technical terms with hyphens/spaces
-        (r'\bscib\s+ert\b', 'scibert'),  # SciB ERT -> SciBERT
-        (r'\bscibert\b', 'scib ert'),    # SciBERT -> SciB ERT (reverse mapping)
-        (r'\bbio\s+bert\b', 'biobert'),  # Bio BERT -> BioBERT
-        (r'\bbiobert\b', 'bio bert'),    # BioBERT -> Bio BERT
-        (r'\brob\s+erta\b', 'roberta'),  # Rob ERTa -> RoBERTa
-        (r'\broberta\b', 'rob erta'),    # RoBERTa -> Rob ERTa
-        (r'\bdeb\s+erta\b', 'deberta'),  # Deb ERTa -> DeBERTa
-        (r'\bdeberta\b', 'deb erta'),    # DeBERTa -> Deb ERTa
-        (r'\bon\s+line\b', 'online'),
-        (r'\bonline\b', 'on line'),
-        (r'\boff\s+line\b', 'offline'),
-        (r'\boffline\b', 'off line'),
-    ]
+    compound_normalized = dehyphenated
+    for pattern, replacement in _TITLE_COMPOUND_PATTERNS:
+        compound_normalized = pattern.sub(replacement, compound_normalized)
     
-    t1_compound_normalized = t1_dehyphenated
-    t2_compound_normalized = t2_dehyphenated
-    for pattern, replacement in compound_patterns:
-        t1_compound_normalized = re.sub(pattern, replacement, t1_compound_normalized)
-        t2_compound_normalized = re.sub(pattern, replacement, t2_compound_normalized)
+    # Additional normalization: remove punctuation for comparison
+    normalized = _PUNCTUATION_RE.sub(' ', compound_normalized)
+    normalized = _WHITESPACE_RE.sub(' ', normalized).strip()
     
-    # Check for match after compound word normalization
-    if t1_compound_normalized == t2_compound_normalized:
-        return 1.0
+    return lowered, dehyphenated, normalized
+
+
+def calculate_title_similarity(title1: str, title2: str) -> float:
+    """
+    Calculate similarity between two titles using multiple approaches
     
-    # Additional normalization: remove punctuation for comparison
-    t1_normalized = re.sub(r'[^\w\s]', ' ', t1_compound_normalized)
-    t1_normalized = re.sub(r'\s+', ' ', t1_normalized).strip()
-    t2_normalized = re.sub(r'[^\w\s]', ' ', t2_compound_normalized)
-    t2_normalized = re.sub(r'\s+', ' ', t2_normalized).strip()
+    Args:
+        title1: First title
+        title2: Second title
+        
+    Returns:
+        Similarity score between 0 and 1
+    """
+    if not title1 or not title2:
+        return 0.0
+    
+    t1, t1_dehyphenated, t1_normalized = _title_similarity_forms(title1)
+    t2, t2_dehyphenated, t2_normalized = _title_similarity_forms(title2)
     
-    # Check for match after full normalization
+    # Both titles go through the same normalization stages (tech terms, hyphens,
+    # compound words, punctuation), so titles equal after any stage are also
+    # equal after the last one
     if t1_normalized == t2_normalized:
         return 1.0
     
     # Handle edition differences - check if one title is the same as the other but with edition info
     # Common edition patterns: "Second Edition", "2nd Edition", "Revised Edition", etc.
-    edition_patterns = [
-        r'\s+second\s+edition\s*$',
-        r'\s+third\s+edition\s*$',
-        r'\s+fourth\s+edition\s*$',
-        r'\s+fifth\s+edition\s*$',
-        r'\s+\d+(?:st|nd|rd|th)\s+edition\s*$',
-        r'\s+revised\s+edition\s*$',
-        r'\s+updated\s+edition\s*$',
-        r'\s+new\s+edition\s*$',
-        r'\s+latest\s+edition\s*$',
-    ]
-    
-    # Check if removing edition info from one title makes them match
-    for pattern in edition_patterns:
-        t1_no_edition = re.sub(pattern, '', t1_normalized, flags=re.IGNORECASE).strip()
-        t2_no_edition = re.sub(pattern, '', t2_normalized, flags=re.IGNORECASE).strip()
-        
-        # If removing edition info from either title makes them equal, they're the same work
-        if (t1_no_edition == t2_normalized) or (t2_no_edition == t1_normalized) or (t1_no_edition == t2_no_edition):
-            return 1.0
+    # Check if removing edition info from one title makes them match. Every pattern
+    # is anchored on a trailing "edition", so other titles are left unchanged by it
+    if t1_normalized.endswith('edition') or t2_normalized.endswith('edition'):
+        for pattern in _TITLE_EDITION_PATTERNS:
+            t1_no_edition = pattern.sub('', t1_normalized).strip()
+            t2_no_edition = pattern.sub('', t2_normalized).strip()
+            
+            # If removing edition info from either title makes them equal, they're the same work
+            if (t1_no_edition == t2_normalized) or (t2_no_edition == t1_normalized) or (t1_no_edition == t2_no_edition):
+                return 1.0
     
     # Check if one is substring of another, but require substantial overlap
     # to avoid false positives like "Rust programming language" vs "RustBelt: securing..."
@@ -3934,9 +4079,8 @@ def calculate_title_similarity(title1: str, title2: str) -> float:
     words2 = set(t2_normalized.split())
     
     # Remove common stop words that don't add much meaning
-    stop_words = {'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with', 'by'}
-    words1_filtered = words1 - stop_words
-    words2_filtered = words2 - stop_words
+    words1_filtered = words1 - TITLE_STOP_WORDS
+    words2_filtered = words2 - TITLE_STOP_WORDS
     
     # If filtering removed too many words, fall back to unfiltered comparison
     if not words1_filtered or not words2_filtered:
@@ -4008,6 +4152,248 @@ def _extract_key_phrases(title: str) -> List[str]:
     return phrases
 
 
+# Abbreviations expanded with word-boundary regexes when normalizing venues for comparison
+VENUE_COMPARISON_ABBREVIATIONS = {
+    # IEEE specific abbreviations (only expand with periods, not full words)
+    'robot.': 'robotics', 'autom.': 'automation', 'lett.': 'letters',
+    'trans.': 'transactions', 'syst.': 'systems', 'netw.': 'networks',
+    'learn.': 'learning', 'ind.': 'industrial', 'electron.': 'electronics',
+    'mechatron.': 'mechatronics', 'intell.': 'intelligence',
+    'transp.': 'transportation', 'contr.': 'control', 'mag.': 'magazine',
+    # General academic abbreviations (only expand with periods)
+    'int.': 'international', 'intl.': 'international', 'conf.': 'conference',
+    'j.': 'journal', 'proc.': 'proceedings', 'assoc.': 'association',
+    'comput.': 'computing', 'sci.': 'science', 'eng.': 'engineering',
+    'tech.': 'technology', 'artif.': 'artificial', 'mach.': 'machine',
+    'stat.': 'statistics', 'math.': 'mathematics', 'phys.': 'physics',
+    'chem.': 'chemistry', 'bio.': 'biology', 'med.': 'medicine',
+    'adv.': 'advances', 'ann.': 'annual', 'symp.': 'symposium',
+    'workshop': 'workshop', 'worksh.': 'workshop',
+    'natl.': 'national', 'acad.': 'academy', 'rev.': 'review',
+    # Physics journal abbreviations
+    'phys.': 'physics', 'phys. rev.': 'physical review', 
+    'phys. rev. lett.': 'physical review letters',
+    'phys. rev. a': 'physical review a', 'phys. rev. b': 'physical review b',
+    'phys. rev. c': 'physical review c', 'phys. rev. d': 'physical review d',
+    'phys. rev. e': 'physical review e', 'phys. lett.': 'physics letters',
+    'phys. lett. b': 'physics letters b', 'nucl. phys.': 'nuclear physics',
+    'nucl. phys. a': 'nuclear physics a', 'nucl. phys. b': 'nuclear physics b',
+    'j. phys.': 'journal of physics', 'ann. phys.': 'annals of physics',
+    'mod. phys. lett.': 'modern physics letters', 'eur. phys. j.': 'european physical journal',
+    # Nature journals
+    'nature phys.': 'nature physics', 'sci. adv.': 'science advances',
+    # Handle specific multi-word patterns and well-known acronyms
+    'proc. natl. acad. sci.': 'proceedings of the national academy of sciences',
+    'pnas': 'proceedings of the national academy of sciences',
+    # Special cases that don't follow standard acronym patterns
+    'neurips': 'neural information processing systems',  # Special case
+    'nips': 'neural information processing systems',     # old name for neurips
+}
+# Compiled once, longest abbreviation first so longer matches take precedence; abbreviations
+# ending in a period only need a word boundary at the start
+_VENUE_COMPARISON_ABBREV_PATTERNS = tuple(
+    (re.compile(r'\b' + re.escape(abbrev) + ('' if abbrev.endswith('.') else r'\b')), expansion)
+    for abbrev, expansion in sorted(VENUE_COMPARISON_ABBREVIATIONS.items(), key=lambda x: len(x[0]), reverse=True)
+)
+
+# Common academic abbreviations mapping used for word-level venue expansion
+VENUE_ABBREVIATIONS = {
+    # IEEE specific abbreviations (only expand with periods, not full words)
+    'robot.': 'robotics',
+    'autom.': 'automation',
+    'lett.': 'letters',
+    'trans.': 'transactions',
+    'syst.': 'systems',
+    'netw.': 'networks',
+    'learn.': 'learning',
+    'ind.': 'industrial',
+    'electron.': 'electronics',
+    'mechatron.': 'mechatronics',
+    'intell.': 'intelligence',
+    'transp.': 'transportation',
+    'contr.': 'control',
+    'mag.': 'magazine',
+
+    # General academic abbreviations (only expand with periods)
+    'int.': 'international',
+    'intl.': 'international', 
+    'conf.': 'conference',
+    'j.': 'journal',
+    'proc.': 'proceedings',
+    'assoc.': 'association',
+    'comput.': 'computer',
+    'sci.': 'science',
+    'eng.': 'engineering',
+    'res.': 'research',
+    'dev.': 'development',
+    'technol.': 'technology',
+    'adv.': 'advanced',
+    'artif.': 'artificial',
+    'mach.': 'machine',
+    'anal.': 'analysis',
+    'appl.': 'applications',
+    'theor.': 'theoretical',
+    'pract.': 'practical',
+    'found.': 'foundations',
+    'princ.': 'principles',
+    'mech.': 'mechanical',
+    'des.': 'design',
+    'manuf.': 'manufacturing',
+    'syst.': 'systems',
+    'inf.': 'information',
+    'softw.': 'software',
+    'process.': 'processing',
+    'symp.': 'symposium',
+    'ai': 'artificial intelligence',
+
+    # Common venue name patterns (only keep special cases that can't be auto-detected)
+    'iros': 'international conference on intelligent robots and systems',
+    'icra': 'international conference on robotics and automation',
+    'corl': 'conference on robot learning',
+    'rss': 'robotics science and systems',
+    'humanoids': 'ieee international conference on humanoid robots',
+    'iser': 'international symposium on experimental robotics',
+    'case': 'ieee international conference on automation science and engineering',
+    'ddcls': 'data driven control and learning systems conference',
+
+    # Physics journal abbreviations - very common in academic literature
+    'phys.': 'physics',  # Changed from 'physical' to 'physics' to match "Physics Letters"
+    'rev.': 'review',
+    'phys. rev.': 'physical review',  # But keep this as 'physical review' since that's the correct name
+    'phys. rev. lett.': 'physical review letters',
+    'phys. rev. a': 'physical review a',
+    'phys. rev. b': 'physical review b', 
+    'phys. rev. c': 'physical review c',
+    'phys. rev. d': 'physical review d',
+    'phys. rev. e': 'physical review e',
+    'phys. lett.': 'physics letters',
+    'phys. lett. b': 'physics letters b',
+    'nucl. phys.': 'nuclear physics',
+    'nucl. phys. a': 'nuclear physics a',
+    'nucl. phys. b': 'nuclear physics b',
+    'j. phys.': 'journal of physics',
+    'ann. phys.': 'annals of physics',
+    'mod. phys. lett.': 'modern physics letters',
+    'eur. phys. j.': 'european physical journal',
+
+    # Other common science journal abbreviations
+    'nature phys.': 'nature physics',
+    'nat. phys.': 'nature physics',
+    'science adv.': 'science advances',
+    'sci. adv.': 'science advances',
+    'proc. natl. acad. sci.': 'proceedings of the national academy of sciences',
+    'pnas': 'proceedings of the national academy of sciences',
+    'natl.': 'national',
+    'acad.': 'academy',
+
+    # Special cases that don't follow standard acronym patterns
+    'neurips': 'neural information processing systems',  # Special case: doesn't follow standard acronym rules
+    'nips': 'neural information processing systems',     # old name for neurips
+    'nsdi': 'networked systems design and implementation',  # USENIX NSDI
+}
+# Multi-word abbreviations, longest first to avoid partial matches
+_VENUE_MULTI_WORD_ABBREVIATIONS = tuple(
+    sorted((abbrev for abbrev in VENUE_ABBREVIATIONS if ' ' in abbrev), key=len, reverse=True)
+)
+_TRAILING_VENUE_PUNCTUATION_RE = re.compile(r'[.,;:]$')
+_VENUE_PENALTY_RE = re.compile(r'\\penalty\d+\s*')
+_VENUE_PUNCTUATION_RE = re.compile(r'[.,;:]')
+# The preposition and final spacing patterns are kept exactly as the comparison
+# normalization has always written them; the doubled backslashes mean they only
+# match a literal backslash, never whitespace
+_VENUE_ON_RE = re.compile(r'\\s+on\\s+')
+_VENUE_FOR_RE = re.compile(r'\\s+for\\s+')
+_VENUE_SPACING_RE = re.compile(r'\\s+')
+
+
+# Stop words that don't affect venue identity in the word-level comparison
+_VENUE_STOP_WORDS = frozenset({'the', 'a', 'an', 'of', 'on', 'in', 'at', 'to', 'for', 'with', 'by', 'and', 'or'})
+
+# Common word root patterns treated as equivalent in the word-level comparison
+_VENUE_WORD_ROOTS = {
+    'robot': 'robotics', 'robotics': 'robot',
+    'sci': 'science', 'science': 'sci',
+    'science': 'sciences', 'sciences': 'science',  # Handle singular/plural
+    'adv': 'advanced', 'advanced': 'adv', 
+    'intell': 'intelligent', 'intelligent': 'intell',
+    'syst': 'systems', 'systems': 'syst',
+    'int': 'international', 'international': 'int',
+    'res': 'research', 'research': 'res',
+    'autom': 'automation', 'automation': 'autom',
+    'lett': 'letters', 'letters': 'lett',
+    'trans': 'transactions', 'transactions': 'trans',
+    'electron': 'electronics', 'electronics': 'electron',
+    'mech': 'mechanical', 'mechanical': 'mech',
+    'eng': 'engineering', 'engineering': 'eng',
+    'comput': 'computer', 'computer': 'comput',
+    'j': 'journal', 'journal': 'j',
+    'des': 'design', 'design': 'des',
+    'soft': 'soft',  # Keep soft as is
+}
+
+
+@lru_cache(maxsize=4096)
+def _venue_word_set(normalized_venue: str) -> frozenset:
+    """Meaningful words of a venue comparison key, without stop words"""
+    return frozenset(normalized_venue.split()) - _VENUE_STOP_WORDS
+
+
+def _venue_words_similar(word1: str, word2: str) -> bool:
+    """Check if two venue words are similar (roots, abbreviations, etc.)"""
+    # Exact match
+    if word1 == word2:
+        return True
+        
+    # Check if one is an abbreviation of the other
+    # Remove periods for comparison
+    clean1 = word1.rstrip('.')
+    clean2 = word2.rstrip('.')
+    
+    # Short word is prefix of longer word (like "sci" -> "science")
+    if len(clean1) >= 3 and len(clean2) >= 3:
+        if clean1.startswith(clean2) or clean2.startswith(clean1):
+            return True
+    
+    # Check if words are related through root mappings
+    if clean1 in _VENUE_WORD_ROOTS and _VENUE_WORD_ROOTS[clean1] == clean2:
+        return True
+    if clean2 in _VENUE_WORD_ROOTS and _VENUE_WORD_ROOTS[clean2] == clean1:
+        return True
+        
+    return False
+
+
+@lru_cache(maxsize=4096)
+def _venue_comparison_key(venue_text: str) -> str:
+    """
+    Reduce a venue to the lowercase canonical form used for venue comparison.
+    
+    The display normalization is applied first, then abbreviations and aliases are
+    expanded and punctuation removed, so "NeurIPS" and "Neural Information
+    Processing Systems" share a key.
+    """
+    # Get the cleaned display version first
+    cleaned = normalize_venue_for_display(venue_text)
+    # Then normalize for comparison: lowercase, expand abbreviations, remove punctuation
+    venue_lower = cleaned.lower()
+    
+    # Handle LaTeX penalty commands before abbreviation expansion
+    venue_lower = _VENUE_PENALTY_RE.sub(' ', venue_lower)  # Remove \\penalty0 etc
+    venue_lower = _WHITESPACE_RE.sub(' ', venue_lower).strip()  # Clean up extra spaces
+    
+    # Expand abbreviations for comparison
+    for pattern, expansion in _VENUE_COMPARISON_ABBREV_PATTERNS:
+        venue_lower = pattern.sub(expansion, venue_lower)
+    
+    # Remove punctuation and normalize spacing for comparison
+    venue_lower = _VENUE_PUNCTUATION_RE.sub('', venue_lower)  # Remove punctuation
+    venue_lower = _VENUE_ON_RE.sub(' ', venue_lower)  # Remove \"on\" preposition
+    venue_lower = _VENUE_FOR_RE.sub(' ', venue_lower)  # Remove \"for\" preposition
+    venue_lower = _VENUE_SPACING_RE.sub(' ', venue_lower).strip()  # Normalize whitespace
+    
+    return sys.intern(venue_lower)
+
+
 def are_venues_substantially_different(venue1: str, venue2: str) -> bool:
     """
     Check if two venue names are substantially different (not just minor variations).
@@ -4027,185 +4413,23 @@ def are_venues_substantially_different(venue1: str, venue2: str) -> bool:
     venue1_latex_cleaned = strip_latex_commands(venue1)
     venue2_latex_cleaned = strip_latex_commands(venue2)
     
-    # For comparison, we need lowercase normalized versions
-    def normalize_for_comparison(venue_text):
-        # Get the cleaned display version first
-        cleaned = normalize_venue_for_display(venue_text)
-        # Then normalize for comparison: lowercase, expand abbreviations, remove punctuation
-        venue_lower = cleaned.lower()
-        
-        # Handle LaTeX penalty commands before abbreviation expansion
-        venue_lower = re.sub(r'\\penalty\d+\s*', ' ', venue_lower)  # Remove \\penalty0 etc
-        venue_lower = re.sub(r'\s+', ' ', venue_lower).strip()  # Clean up extra spaces
-        
-        # Expand abbreviations for comparison
-        def expand_abbreviations(text):
-            common_abbrevs = {
-                # IEEE specific abbreviations (only expand with periods, not full words)
-                'robot.': 'robotics', 'autom.': 'automation', 'lett.': 'letters',
-                'trans.': 'transactions', 'syst.': 'systems', 'netw.': 'networks',
-                'learn.': 'learning', 'ind.': 'industrial', 'electron.': 'electronics',
-                'mechatron.': 'mechatronics', 'intell.': 'intelligence',
-                'transp.': 'transportation', 'contr.': 'control', 'mag.': 'magazine',
-                # General academic abbreviations (only expand with periods)
-                'int.': 'international', 'intl.': 'international', 'conf.': 'conference',
-                'j.': 'journal', 'proc.': 'proceedings', 'assoc.': 'association',
-                'comput.': 'computing', 'sci.': 'science', 'eng.': 'engineering',
-                'tech.': 'technology', 'artif.': 'artificial', 'mach.': 'machine',
-                'stat.': 'statistics', 'math.': 'mathematics', 'phys.': 'physics',
-                'chem.': 'chemistry', 'bio.': 'biology', 'med.': 'medicine',
-                'adv.': 'advances', 'ann.': 'annual', 'symp.': 'symposium',
-                'workshop': 'workshop', 'worksh.': 'workshop',
-                'natl.': 'national', 'acad.': 'academy', 'rev.': 'review',
-                # Physics journal abbreviations
-                'phys.': 'physics', 'phys. rev.': 'physical review', 
-                'phys. rev. lett.': 'physical review letters',
-                'phys. rev. a': 'physical review a', 'phys. rev. b': 'physical review b',
-                'phys. rev. c': 'physical review c', 'phys. rev. d': 'physical review d',
-                'phys. rev. e': 'physical review e', 'phys. lett.': 'physics letters',
-                'phys. lett. b': 'physics letters b', 'nucl. phys.': 'nuclear physics',
-                'nucl. phys. a': 'nuclear physics a', 'nucl. phys. b': 'nuclear physics b',
-                'j. phys.': 'journal of physics', 'ann. phys.': 'annals of physics',
-                'mod. phys. lett.': 'modern physics letters', 'eur. phys. j.': 'european physical journal',
-                # Nature journals
-                'nature phys.': 'nature physics', 'sci. adv.': 'science advances',
-                # Handle specific multi-word patterns and well-known acronyms
-                'proc. natl. acad. sci.': 'proceedings of the national academy of sciences',
-                'pnas': 'proceedings of the national academy of sciences',
-                # Special cases that don't follow standard acronym patterns
-                'neurips': 'neural information processing systems',  # Special case
-                'nips': 'neural information processing systems',     # old name for neurips
-            }
-            # Sort by length (longest first) to ensure longer matches take precedence
-            for abbrev, expansion in sorted(common_abbrevs.items(), key=lambda x: len(x[0]), reverse=True):
-                # For abbreviations ending in period, use word boundary at start only
-                if abbrev.endswith('.'):
-                    pattern = r'\b' + re.escape(abbrev)
-                else:
-                    pattern = r'\b' + re.escape(abbrev) + r'\b'
-                text = re.sub(pattern, expansion, text)
-            return text
-        
-        venue_lower = expand_abbreviations(venue_lower)
-        
-        # Remove punctuation and normalize spacing for comparison
-        venue_lower = re.sub(r'[.,;:]', '', venue_lower)  # Remove punctuation
-        venue_lower = re.sub(r'\\s+on\\s+', ' ', venue_lower)  # Remove \"on\" preposition
-        venue_lower = re.sub(r'\\s+for\\s+', ' ', venue_lower)  # Remove \"for\" preposition
-        venue_lower = re.sub(r'\\s+', ' ', venue_lower).strip()  # Normalize whitespace
-        
-        return venue_lower
-    
-    normalized_venue1 = normalize_for_comparison(venue1_latex_cleaned)
-    normalized_venue2 = normalize_for_comparison(venue2_latex_cleaned)
+    # Each side is reduced to a cached canonical comparison key, so identical
+    # spellings and known aliases (e.g. NeurIPS / NIPS) match without further work
+    normalized_venue1 = _venue_comparison_key(venue1_latex_cleaned)
+    normalized_venue2 = _venue_comparison_key(venue2_latex_cleaned)
+    if normalized_venue1 == normalized_venue2:
+        return False
     
     def expand_abbreviations(text):
         """Generic abbreviation expansion using common academic patterns"""
-        # Common academic abbreviations mapping
-        common_abbrevs = {
-            # IEEE specific abbreviations (only expand with periods, not full words)
-            'robot.': 'robotics',
-            'autom.': 'automation',
-            'lett.': 'letters',
-            'trans.': 'transactions',
-            'syst.': 'systems',
-            'netw.': 'networks',
-            'learn.': 'learning',
-            'ind.': 'industrial',
-            'electron.': 'electronics',
-            'mechatron.': 'mechatronics',
-            'intell.': 'intelligence',
-            'transp.': 'transportation',
-            'contr.': 'control',
-            'mag.': 'magazine',
-            
-            # General academic abbreviations (only expand with periods)
-            'int.': 'international',
-            'intl.': 'international', 
-            'conf.': 'conference',
-            'j.': 'journal',
-            'proc.': 'proceedings',
-            'assoc.': 'association',
-            'comput.': 'computer',
-            'sci.': 'science',
-            'eng.': 'engineering',
-            'res.': 'research',
-            'dev.': 'development',
-            'technol.': 'technology',
-            'adv.': 'advanced',
-            'artif.': 'artificial',
-            'mach.': 'machine',
-            'anal.': 'analysis',
-            'appl.': 'applications',
-            'theor.': 'theoretical',
-            'pract.': 'practical',
-            'found.': 'foundations',
-            'princ.': 'principles',
-            'mech.': 'mechanical',
-            'des.': 'design',
-            'manuf.': 'manufacturing',
-            'syst.': 'systems',
-            'inf.': 'information',
-            'softw.': 'software',
-            'process.': 'processing',
-            'symp.': 'symposium',
-            'ai': 'artificial intelligence',
-            
-            # Common venue name patterns (only keep special cases that can't be auto-detected)
-            'iros': 'international conference on intelligent robots and systems',
-            'icra': 'international conference on robotics and automation',
-            'corl': 'conference on robot learning',
-            'rss': 'robotics science and systems',
-            'humanoids': 'ieee international conference on humanoid robots',
-            'iser': 'international symposium on experimental robotics',
-            'case': 'ieee international conference on automation science and engineering',
-            'ddcls': 'data driven control and learning systems conference',
-            
-            # Physics journal abbreviations - very common in academic literature
-            'phys.': 'physics',  # Changed from 'physical' to 'physics' to match "Physics Letters"
-            'rev.': 'review',
-            'phys. rev.': 'physical review',  # But keep this as 'physical review' since that's the correct name
-            'phys. rev. lett.': 'physical review letters',
-            'phys. rev. a': 'physical review a',
-            'phys. rev. b': 'physical review b', 
-            'phys. rev. c': 'physical review c',
-            'phys. rev. d': 'physical review d',
-            'phys. rev. e': 'physical review e',
-            'phys. lett.': 'physics letters',
-            'phys. lett. b': 'physics letters b',
-            'nucl. phys.': 'nuclear physics',
-            'nucl. phys. a': 'nuclear physics a',
-            'nucl. phys. b': 'nuclear physics b',
-            'j. phys.': 'journal of physics',
-            'ann. phys.': 'annals of physics',
-            'mod. phys. lett.': 'modern physics letters',
-            'eur. phys. j.': 'european physical journal',
-            
-            # Other common science journal abbreviations
-            'nature phys.': 'nature physics',
-            'nat. phys.': 'nature physics',
-            'science adv.': 'science advances',
-            'sci. adv.': 'science advances',
-            'proc. natl. acad. sci.': 'proceedings of the national academy of sciences',
-            'pnas': 'proceedings of the national academy of sciences',
-            'natl.': 'national',
-            'acad.': 'academy',
-            
-            # Special cases that don't follow standard acronym patterns
-            'neurips': 'neural information processing systems',  # Special case: doesn't follow standard acronym rules
-            'nips': 'neural information processing systems',     # old name for neurips
-            'nsdi': 'networked systems design and implementation',  # USENIX NSDI
-        }
-        
         # Apply abbreviation expansion - handle multi-word phrases first
         text_lower = text.lower()
         expanded_text = text_lower
         
         # First pass: handle multi-word abbreviations (longest first to avoid partial matches)
-        multi_word_abbrevs = {k: v for k, v in common_abbrevs.items() if ' ' in k}
-        for abbrev in sorted(multi_word_abbrevs.keys(), key=len, reverse=True):
+        for abbrev in _VENUE_MULTI_WORD_ABBREVIATIONS:
             if abbrev in expanded_text:
-                expanded_text = expanded_text.replace(abbrev, multi_word_abbrevs[abbrev])
+                expanded_text = expanded_text.replace(abbrev, VENUE_ABBREVIATIONS[abbrev])
                 break  # Only apply the first (longest) matching abbreviation to avoid conflicts
         
         # Second pass: handle single word abbreviations
@@ -4216,14 +4440,14 @@ def are_venues_substantially_different(venue1: str, venue2: str) -> bool:
             word_lower = word.lower()
             
             # Check for single-word abbreviations
-            if word_lower in common_abbrevs:
-                expanded_words.append(common_abbrevs[word_lower])
+            if word_lower in VENUE_ABBREVIATIONS:
+                expanded_words.append(VENUE_ABBREVIATIONS[word_lower])
             else:
                 # Try without punctuation + period (for cases like "int" -> "int.")
-                clean_word = re.sub(r'[.,;:]$', '', word_lower)
+                clean_word = _TRAILING_VENUE_PUNCTUATION_RE.sub('', word_lower)
                 abbrev_with_period = clean_word + '.'
-                if abbrev_with_period in common_abbrevs:
-                    expanded_words.append(common_abbrevs[abbrev_with_period])
+                if abbrev_with_period in VENUE_ABBREVIATIONS:
+                    expanded_words.append(VENUE_ABBREVIATIONS[abbrev_with_period])
                 else:
                     expanded_words.append(word)
         
@@ -4415,7 +4639,7 @@ def are_venues_substantially_different(venue1: str, venue2: str) -> bool:
                 return False
             
             # Use the internal comparison normalization function
-            normalized_full = normalize_for_comparison(full_text)
+            normalized_full = _venue_comparison_key(full_text)
             
             # Generate all possible acronyms from the full text
             possible_acronyms = []
@@ -4541,63 +4765,17 @@ def are_venues_substantially_different(venue1: str, venue2: str) -> bool:
     if check_acronym_match(venue1, venue2):
         return False
     
-    # Calculate word-level similarity with fuzzy matching
-    words1 = set(norm1.split())
-    words2 = set(norm2.split())
-    
-    # Remove common stop words that don't affect venue identity
-    stop_words = {'the', 'a', 'an', 'of', 'on', 'in', 'at', 'to', 'for', 'with', 'by', 'and', 'or'}
-    words1 = words1 - stop_words
-    words2 = words2 - stop_words
+    # Calculate word-level similarity with fuzzy matching, ignoring stop words
+    # that don't affect venue identity
+    words1 = _venue_word_set(norm1)
+    words2 = _venue_word_set(norm2)
     
     # If either venue has no meaningful words, consider them different
     if not words1 or not words2:
         return True
     
-    def words_are_similar(word1, word2):
-        """Check if two words are similar (roots, abbreviations, etc.)"""
-        # Exact match
-        if word1 == word2:
-            return True
-            
-        # Check if one is an abbreviation of the other
-        # Remove periods for comparison
-        clean1 = word1.rstrip('.')
-        clean2 = word2.rstrip('.')
-        
-        # Short word is prefix of longer word (like "sci" -> "science")
-        if len(clean1) >= 3 and len(clean2) >= 3:
-            if clean1.startswith(clean2) or clean2.startswith(clean1):
-                return True
-        
-        # Check common word root patterns
-        word_roots = {
-            'robot': 'robotics', 'robotics': 'robot',
-            'sci': 'science', 'science': 'sci',
-            'science': 'sciences', 'sciences': 'science',  # Handle singular/plural
-            'adv': 'advanced', 'advanced': 'adv', 
-            'intell': 'intelligent', 'intelligent': 'intell',
-            'syst': 'systems', 'systems': 'syst',
-            'int': 'international', 'international': 'int',
-            'res': 'research', 'research': 'res',
-            'autom': 'automation', 'automation': 'autom',
-            'lett': 'letters', 'letters': 'lett',
-            'trans': 'transactions', 'transactions': 'trans',
-            'electron': 'electronics', 'electronics': 'electron',
-            'mech': 'mechanical', 'mechanical': 'mech',
-            'eng': 'engineering', 'engineering': 'eng',
-            'comput': 'computer', 'computer': 'comput',
-            'j': 'journal', 'journal': 'j',
-            'des': 'design', 'design': 'des',
-            'soft': 'soft',  # Keep soft as is
-        }
-        
-        # Check if words are related through root mappings
-        if clean1 in word_roots and word_roots[clean1] == clean2:
-            return True
-        if clean2 in word_roots and word_roots[clean2] == clean1:
-            return True
-            
+    # Identical word sets align one-to-one below, so they match outright
+    if words1 == words2:
         return False
     
     # Order-aware fuzzy matching - words should match in sequence
@@ -4630,7 +4808,7 @@ def are_venues_substantially_different(venue1: str, venue2: str) -> bool:
         search_end = min(len(longer), i + 3)  # But not too much
         
         for j in range(search_start, search_end):
-            if j not in used_indices and words_are_similar(short_word, longer[j]):
+            if j not in used_indices and _venue_words_similar(short_word, longer[j]):
                 best_match_idx = j
                 break
         
@@ -4776,11 +4954,8 @@ def is_year_substantially_different(cited_year: int, correct_year: int, context:
         - is_different: True if years differ and should be flagged as warning
         - warning_message: Simple message about the year mismatch, or None if years match
     """
-    if not cited_year or not correct_year:
-        return False, None
-    
-    # If years are the same, no warning needed
-    if cited_year == correct_year:
+    # Missing or identical years need no warning
+    if not cited_year or not correct_year or cited_year == correct_year:
         return False, None
     
     # Any year difference should be flagged as a warning for manual review
@@ -4788,6 +4963,60 @@ def is_year_substantially_different(cited_year: int, correct_year: int, context:
     return True, warning_msg
 
 
+# Leading editor name lists like "..., editors, Venue ..." or "..., eds., Venue ..."
+_EDITORS_PREFIX_RE = re.compile(r"(?:^|,)\s*(?:editors?|eds?\.?|editor)\s*,\s*(.+)$", re.IGNORECASE)
+# "In [authors], eds., [venue], [optional metadata]"
+_IN_EDITORS_VENUE_RE = re.compile(r'in\s+[^,]+(?:,\s*[^,]*)*,\s*eds?\.,\s*(.+?)(?:,\s*volume\s*\d+|,\s*pp?\.|$)', re.IGNORECASE)
+_TRAILING_VOLUME_OF_RE = re.compile(r',\s*volume\s+\d+.*$', re.IGNORECASE)
+_TRAILING_OF_PROCEEDINGS_RE = re.compile(r'\s+of\s+proceedings.*$', re.IGNORECASE)
+_ARXIV_VENUE_RE = re.compile(r'arxiv:', re.IGNORECASE)
+
+# Year suffixes, only stripped from non-arXiv venues
+_VENUE_YEAR_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r',?\s*\d{4}[a-z]?\s*$',  # Years like "2024" or "2024b"
+    r',?\s*\(\d{4}\)$',       # Years in parentheses
+    r"'\d{2}$",               # Year suffixes like 'CVPR'16'
+))
+
+# Volume, issue, page and print metadata
+_VENUE_METADATA_PATTERNS = (
+    re.compile(r',?\s*(vol\.?\s*|volume\s*)\d+.*$', re.IGNORECASE),  # Volume info
+    re.compile(r',?\s*\d+\s*\([^)]*\).*$'),  # Issue info with optional spaces
+    re.compile(r',?\s*pp?\.\s*\d+.*$', re.IGNORECASE),  # Page info
+    re.compile(r'\s*\(print\).*$', re.IGNORECASE),  # Print designation
+    re.compile(r'\s*\(\d{4}\.\s*print\).*$', re.IGNORECASE),  # Year.Print
+)
+
+# Procedural prefixes, applied in order
+_VENUE_DISPLAY_PREFIX_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'^\d{4}\s+\d+(st|nd|rd|th)\s+',  # "2012 IEEE/RSJ"
+    r'^\d{4}\s+',                     # "2024 "
+    # Remove 'Proceedings of [the] [ORG]* [ordinal]*' only when followed by at least one word
+    # This avoids cutting a venue down to just 'Proceedings of the'
+    r'^proceedings\s+of\s+(?!the\s*$)(?:the\s+)?(?:(?:acm|ieee|usenix|aaai|sigcomm|sigkdd|sigmod|sigops|vldb|osdi|sosp|eurosys)\s+)*(?:\d+(?:st|nd|rd|th)\s+)?',
+    r'^proc\.\s+of\s+(the\s+)?(\d+(st|nd|rd|th)\s+)?(ieee\s+)?',        # "Proc. of the IEEE" (require "of")
+    r'^procs\.\s+of\s+(the\s+)?(\d+(st|nd|rd|th)\s+)?(ieee\s+)?',       # "Procs. of the IEEE" (require "of")
+    r'^in\s+',
+    r'^advances\s+in\s+',             # "Advances in Neural Information Processing Systems"
+    r'^adv\.\s+',                     # "Adv. Neural Information Processing Systems"
+    # Handle ordinal prefixes: "The Twelfth", "The Ninth", etc.
+    r'^the\s+(first|second|third|fourth|fifth|sixth|seventh|eighth|ninth|tenth|eleventh|twelfth|thirteenth|fourteenth|fifteenth|sixteenth|seventeenth|eighteenth|nineteenth|twentieth|twenty-first|twenty-second|twenty-third|twenty-fourth|twenty-fifth|twenty-sixth|twenty-seventh|twenty-eighth|twenty-ninth|thirtieth|thirty-first|thirty-second|thirty-third|thirty-fourth|thirty-fifth|thirty-sixth|thirty-seventh|thirty-eighth|thirty-ninth|fortieth|forty-first|forty-second|forty-third|forty-fourth|forty-fifth|forty-sixth|forty-seventh|forty-eighth|forty-ninth|fiftieth)\s+',
+    # Handle numeric ordinals: "The 41st", "The 12th", etc.
+    r'^the\s+\d+(st|nd|rd|th)\s+',
+    # Handle standalone "The" prefix
+    r'^the\s+',
+))
+# Every prefix above starts with a digit or one of these letters
+_VENUE_DISPLAY_PREFIX_START_RE = re.compile(r'[\dpiat]', re.IGNORECASE)
+
+_IEEE_TRANSACTIONS_RE = re.compile(r'ieee\s+transactions', re.IGNORECASE)
+_VENUE_ORG_PREFIX_RE = re.compile(r'^(ieee|acm|aaai|usenix|sigcomm|sigkdd|sigmod|vldb|osdi|sosp|eurosys)\s+', re.IGNORECASE)
+_VENUE_JOINT_ORG_PREFIX_RE = re.compile(r'^ieee/\w+\s+', re.IGNORECASE)
+_VENUE_ORG_SUFFIX_RE = re.compile(r'\s+(ieee|acm|aaai|usenix)\s*$', re.IGNORECASE)
+_VENUE_ORG_SEPARATOR_RE = re.compile(r'/\w+\s+')
+_VENUE_ORG_CONFERENCE_ON_RE = re.compile(r'^(ieee|acm|aaai|nips)(/\w+)?\s+conference\s+on\s+', re.IGNORECASE)
+
+
 def normalize_venue_for_display(venue: str) -> str:
     """
     Normalize venue names for consistent display and comparison.
@@ -4804,138 +5033,82 @@ def normalize_venue_for_display(venue: str) -> str:
     if not venue:
         return ""
     
-    def expand_abbreviations(text):
-        """Generic abbreviation expansion using common academic patterns"""
-        # Common academic abbreviations mapping
-        common_abbrevs = {
-            # IEEE specific abbreviations (only expand with periods, not full words)
-            'robot.': 'robotics',
-            'autom.': 'automation',
-            'lett.': 'letters',
-            'trans.': 'transactions',
-            'syst.': 'systems',
-            'netw.': 'networks',
-            'learn.': 'learning',
-            'ind.': 'industrial',
-            'electron.': 'electronics',
-            'mechatron.': 'mechatronics',
-            'intell.': 'intelligence',
-            'transp.': 'transportation',
-            'contr.': 'control',
-            'mag.': 'magazine',
-            
-            # General academic abbreviations (only expand with periods)
-            'int.': 'international',
-            'intl.': 'international', 
-            'conf.': 'conference',
-            'j.': 'journal',
-            'proc.': 'proceedings',
-            'assoc.': 'association',
-            'comput.': 'computing',
-            'sci.': 'science',
-            'eng.': 'engineering',
-            'tech.': 'technology',
-            'artif.': 'artificial',
-            'mach.': 'machine',
-            'stat.': 'statistics',
-            'math.': 'mathematics',
-            'phys.': 'physics',
-            'chem.': 'chemistry',
-            'bio.': 'biology',
-            'med.': 'medicine',
-            'adv.': 'advances',
-            'ann.': 'annual',
-            'symp.': 'symposium',
-            'workshop': 'workshop',
-            'worksh.': 'workshop',
-        }
-        
-        text_lower = text.lower()
-        for abbrev, expansion in common_abbrevs.items():
-            # Only replace if it's a word boundary to avoid partial replacements
-            pattern = r'\b' + re.escape(abbrev) + r'\b'
-            text_lower = re.sub(pattern, expansion, text_lower)
-        
-        return text_lower
-    
+    return _normalize_venue_for_display(venue)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_venue_for_display(venue: str) -> str:
+    """Cached worker for normalize_venue_for_display; bibliographies repeat the same venues"""
     venue_text = venue.strip()
     
-    # Strip leading editor name lists like "..., editors, Venue ..." or "..., eds., Venue ..."
-    # This prevents author/editor lists from being treated as venue
-    # Match 'editors,' 'editor,' or 'eds.,' possibly after a comma; capture the remainder as venue
-    editors_match = re.search(r"(?:^|,)\s*(?:editors?|eds?\.?|editor)\s*,\s*(.+)$", venue_text, re.IGNORECASE)
-    if editors_match:
-        venue_text = editors_match.group(1).strip()
-    
-    # Extract venue from complex editor strings (e.g. "In Smith, J.; and Doe, K., eds., Conference Name, volume 1")
-    # This handles patterns like "In [authors], eds., [venue], [optional metadata]" (case-insensitive)
-    editor_match = re.search(r'in\s+[^,]+(?:,\s*[^,]*)*,\s*eds?\.,\s*(.+?)(?:,\s*volume\s*\d+|,\s*pp?\.|$)', venue_text, re.IGNORECASE)
-    if editor_match:
-        # Extract the venue part from editor string (preserve original case)
-        venue_text = editor_match.group(1).strip()
-        # Clean up any remaining metadata like "volume X of Proceedings..." (case-insensitive)
-        venue_text = re.sub(r',\s*volume\s+\d+.*$', '', venue_text, flags=re.IGNORECASE)
-        venue_text = re.sub(r'\s+of\s+proceedings.*$', '', venue_text, flags=re.IGNORECASE)
+    # One lowercase copy tells us which keyword-driven rule groups can apply;
+    # most venues have no editor list or metadata and skip those scans entirely
+    lowered = venue_text.lower()
+    
+    # Every editor pattern below needs "ed" ("editors", "editor", "eds.", "ed.")
+    if 'ed' in lowered:
+        # Strip leading editor name lists like "..., editors, Venue ..." or "..., eds., Venue ..."
+        # This prevents author/editor lists from being treated as venue
+        # Match 'editors,' 'editor,' or 'eds.,' possibly after a comma; capture the remainder as venue
+        editors_match = _EDITORS_PREFIX_RE.search(venue_text)
+        if editors_match:
+            venue_text = editors_match.group(1).strip()
+        
+        # Extract venue from complex editor strings (e.g. "In Smith, J.; and Doe, K., eds., Conference Name, volume 1")
+        # This handles patterns like "In [authors], eds., [venue], [optional metadata]" (case-insensitive)
+        editor_match = _IN_EDITORS_VENUE_RE.search(venue_text)
+        if editor_match:
+            # Extract the venue part from editor string (preserve original case)
+            venue_text = editor_match.group(1).strip()
+            # Clean up any remaining metadata like "volume X of Proceedings..." (case-insensitive)
+            venue_text = _TRAILING_VOLUME_OF_RE.sub('', venue_text)
+            venue_text = _TRAILING_OF_PROCEEDINGS_RE.sub('', venue_text)
+        
+        if editors_match or editor_match:
+            lowered = venue_text.lower()
     
     # Remove years, volumes, pages, and other citation metadata
     # But preserve arXiv IDs (don't remove digits after arXiv:)
-    if not re.match(r'arxiv:', venue_text, re.IGNORECASE):
-        venue_text = re.sub(r',?\s*\d{4}[a-z]?\s*$', '', venue_text)  # Years like "2024" or "2024b"
-        venue_text = re.sub(r',?\s*\(\d{4}\)$', '', venue_text)  # Years in parentheses
-        venue_text = re.sub(r"'\d{2}$", '', venue_text)  # Year suffixes like 'CVPR'16'
-    venue_text = re.sub(r',?\s*(vol\.?\s*|volume\s*)\d+.*$', '', venue_text, flags=re.IGNORECASE)  # Volume info
-    venue_text = re.sub(r',?\s*\d+\s*\([^)]*\).*$', '', venue_text)  # Issue info with optional spaces
-    venue_text = re.sub(r',?\s*pp?\.\s*\d+.*$', '', venue_text, flags=re.IGNORECASE)  # Page info
-    venue_text = re.sub(r'\s*\(print\).*$', '', venue_text, flags=re.IGNORECASE)  # Print designation
-    venue_text = re.sub(r'\s*\(\d{4}\.\s*print\).*$', '', venue_text, flags=re.IGNORECASE)  # Year.Print
-    
-    # Remove procedural prefixes (case-insensitive)
-    prefixes_to_remove = [
-        r'^\d{4}\s+\d+(st|nd|rd|th)\s+',  # "2012 IEEE/RSJ"
-        r'^\d{4}\s+',                     # "2024 "
-    # Remove 'Proceedings of [the] [ORG]* [ordinal]*' only when followed by at least one word
-    # This avoids cutting a venue down to just 'Proceedings of the'
-    r'^proceedings\s+of\s+(?!the\s*$)(?:the\s+)?(?:(?:acm|ieee|usenix|aaai|sigcomm|sigkdd|sigmod|sigops|vldb|osdi|sosp|eurosys)\s+)*(?:\d+(?:st|nd|rd|th)\s+)?',
-        r'^proc\.\s+of\s+(the\s+)?(\d+(st|nd|rd|th)\s+)?(ieee\s+)?',        # "Proc. of the IEEE" (require "of")
-        r'^procs\.\s+of\s+(the\s+)?(\d+(st|nd|rd|th)\s+)?(ieee\s+)?',       # "Procs. of the IEEE" (require "of")
-        r'^in\s+',
-        r'^advances\s+in\s+',             # "Advances in Neural Information Processing Systems"
-        r'^adv\.\s+',                     # "Adv. Neural Information Processing Systems"
-        # Handle ordinal prefixes: "The Twelfth", "The Ninth", etc.
-        r'^the\s+(first|second|third|fourth|fifth|sixth|seventh|eighth|ninth|tenth|eleventh|twelfth|thirteenth|fourteenth|fifteenth|sixteenth|seventeenth|eighteenth|nineteenth|twentieth|twenty-first|twenty-second|twenty-third|twenty-fourth|twenty-fifth|twenty-sixth|twenty-seventh|twenty-eighth|twenty-ninth|thirtieth|thirty-first|thirty-second|thirty-third|thirty-fourth|thirty-fifth|thirty-sixth|thirty-seventh|thirty-eighth|thirty-ninth|fortieth|forty-first|forty-second|forty-third|forty-fourth|forty-fifth|forty-sixth|forty-seventh|forty-eighth|forty-ninth|fiftieth)\s+',
-        # Handle numeric ordinals: "The 41st", "The 12th", etc.
-        r'^the\s+\d+(st|nd|rd|th)\s+',
-        # Handle standalone "The" prefix
-        r'^the\s+',
-    ]
-    
-    for prefix_pattern in prefixes_to_remove:
-        venue_text = re.sub(prefix_pattern, '', venue_text, flags=re.IGNORECASE)
+    if not _ARXIV_VENUE_RE.match(venue_text):
+        for pattern in _VENUE_YEAR_PATTERNS:
+            venue_text = pattern.sub('', venue_text)
+    # The metadata patterns need "vol", "p." or "("; stripping years only
+    # truncates the text, so it cannot introduce any of them
+    if 'vol' in lowered or 'p.' in lowered or '(' in lowered:
+        for pattern in _VENUE_METADATA_PATTERNS:
+            venue_text = pattern.sub('', venue_text)
+    
+    # Remove procedural prefixes (case-insensitive); they are all anchored at the
+    # start, so a venue whose first character cannot begin one is left alone
+    if _VENUE_DISPLAY_PREFIX_START_RE.match(venue_text):
+        for pattern in _VENUE_DISPLAY_PREFIX_PATTERNS:
+            venue_text = pattern.sub('', venue_text)
     
     # Note: For display purposes, we preserve case and don't expand abbreviations
     # Only do minimal cleaning needed for proper display
     
     # Remove organization prefixes/suffixes that don't affect identity (case-insensitive)
     # But preserve IEEE when it's part of a journal name like \"IEEE Transactions\"
-    if not re.match(r'ieee\s+transactions', venue_text, re.IGNORECASE):
-        venue_text = re.sub(r'^(ieee|acm|aaai|usenix|sigcomm|sigkdd|sigmod|vldb|osdi|sosp|eurosys)\s+', '', venue_text, flags=re.IGNORECASE)  # Remove org prefixes
-    venue_text = re.sub(r'^ieee/\w+\s+', '', venue_text, flags=re.IGNORECASE)  # Remove "IEEE/RSJ " etc
-    venue_text = re.sub(r'\s+(ieee|acm|aaai|usenix)\s*$', '', venue_text, flags=re.IGNORECASE)  # Remove org suffixes
-    venue_text = re.sub(r'/\w+\s+', ' ', venue_text)  # Remove "/ACM " style org separators
+    if not _IEEE_TRANSACTIONS_RE.match(venue_text):
+        venue_text = _VENUE_ORG_PREFIX_RE.sub('', venue_text)  # Remove org prefixes
+    venue_text = _VENUE_JOINT_ORG_PREFIX_RE.sub('', venue_text)  # Remove "IEEE/RSJ " etc
+    venue_text = _VENUE_ORG_SUFFIX_RE.sub('', venue_text)  # Remove org suffixes
+    venue_text = _VENUE_ORG_SEPARATOR_RE.sub(' ', venue_text)  # Remove "/ACM " style org separators
     
     # IMPORTANT: Don't remove "Conference on" or "International" - they're needed for display
     # Only remove specific org-prefixed conference patterns where the org is clear
-    venue_text = re.sub(r'^(ieee|acm|aaai|nips)(/\w+)?\s+conference\s+on\s+', '', venue_text, flags=re.IGNORECASE)
+    venue_text = _VENUE_ORG_CONFERENCE_ON_RE.sub('', venue_text)
     
     # Note: Don't remove "Conference on" as it's often part of the actual venue name
-    # Only remove it if it's clearly a procedural prefix (handled in prefixes_to_remove above)
+    # Only remove it if it's clearly a procedural prefix (handled in _VENUE_DISPLAY_PREFIX_PATTERNS above)
     
     # Clean up spacing (preserve punctuation and case for display)
-    venue_text = re.sub(r'\s+', ' ', venue_text)     # Normalize whitespace
+    venue_text = _WHITESPACE_RE.sub(' ', venue_text)     # Normalize whitespace
     venue_text = venue_text.strip()
     
     # If what's left is too generic (e.g., just 'Proceedings of the'), treat as no venue
     if venue_text.lower() in {"proceedings of the", "proceedings of"}:
         return ""
     
-    return venue_text
\ No newline at end of file
+    # Venue variants commonly normalize to the same name; share one string object
+    return sys.intern(venue_text)
\ No newline at end of file
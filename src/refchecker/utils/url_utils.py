@@ -7,9 +7,58 @@ related to academic references.
 """
 
 import re
+from functools import lru_cache
 from typing import Optional
 from .doi_utils import normalize_doi
 
+# ArXiv ID patterns, tried in order by extract_arxiv_id_from_url; canonical
+# new-style URLs (the common case) resolve with a single anchored match
+_ARXIV_CANONICAL_URL_RE = re.compile(
+    r'https?://(?:www\.)?arxiv\.org/(?:abs|pdf|html)/(\d{4}\.\d{4,5})(?:v\d+)?(?:\.pdf)?/?$',
+    re.IGNORECASE,
+)
+_ARXIV_TEXT_ID_RE = re.compile(r'arXiv:(\d{4}\.\d{4,5})', re.IGNORECASE)
+_ARXIV_URL_ID_RE = re.compile(r'arxiv\.org/(?:abs|pdf|html)/([^\s/?#]+?)(?:\.pdf|v\d+)?(?:[?\#]|$)', re.IGNORECASE)
+_ARXIV_FALLBACK_ID_RE = re.compile(r'arxiv\.org/(?:abs|pdf|html)/([^/?#]+)', re.IGNORECASE)
+_ARXIV_VERSION_RE = re.compile(r'v\d+$')
+
+# Malformed "https://\\url{https://...}" wrappers and markdown "[text](url)" links;
+# both are only searched for when their literal markers are present. The link
+# text excludes '[' so runs of unclosed brackets are scanned once, not once per
+# bracket, and the search stops at the last ')' so unterminated URLs
+# cannot be rescanned either; both keep matching linear in the URL length.
+_LATEX_URL_WRAPPER_RE = re.compile(r'https?://\\url\{(https?://[^}]+)\}')
+_MARKDOWN_LINK_RE = re.compile(r'\[([^\[\]]*)\]\((https?://[^)]+)\)')
+
+
+def _markdown_link_target(url: str) -> Optional[str]:
+    """
+    Return the URL of the first markdown link "[text](url)" in url, if any
+    
+    Args:
+        url: Stripped URL text
+        
+    Returns:
+        The link target, or None if url contains no markdown link
+    """
+    if '](' not in url:
+        return None
+    
+    # A URL that is exactly one link is sliced without the regex: the text has
+    # no brackets and the target is a complete http(s) URL without ')', which
+    # is precisely when the pattern would match it from the first character
+    if url[0] == '[' and url[-1] == ')':
+        split = url.index('](')
+        text = url[1:split]
+        target = url[split + 2:-1]
+        if ('[' not in text and ']' not in text and ')' not in target
+                and target.startswith(('http://', 'https://'))
+                and target not in ('http://', 'https://')):
+            return target
+    
+    markdown_match = _MARKDOWN_LINK_RE.search(url, 0, url.rfind(')') + 1)
+    return markdown_match.group(2) if markdown_match else None
+
 
 def construct_doi_url(doi: str) -> str:
     """
@@ -48,28 +97,37 @@ def extract_arxiv_id_from_url(url: str) -> Optional[str]:
     """
     if not url or not isinstance(url, str):
         return None
+    return _extract_arxiv_id(url)
+
+
+@lru_cache(maxsize=4096)
+def _extract_arxiv_id(url: str) -> Optional[str]:
+    """Cached worker for extract_arxiv_id_from_url; the same URLs recur across a bibliography"""
+    canonical_match = _ARXIV_CANONICAL_URL_RE.match(url)
+    if canonical_match:
+        return canonical_match.group(1)
     
     # Pattern 1: arXiv: format (e.g., "arXiv:1610.10099" or "arXiv preprint arXiv:1610.10099")
-    arxiv_text_match = re.search(r'arXiv:(\d{4}\.\d{4,5})', url, re.IGNORECASE)
+    arxiv_text_match = _ARXIV_TEXT_ID_RE.search(url)
     if arxiv_text_match:
         arxiv_id = arxiv_text_match.group(1)
         # Remove version number if present
-        return re.sub(r'v\d+$', '', arxiv_id)
+        return _ARXIV_VERSION_RE.sub('', arxiv_id)
     
     # Pattern 2: arxiv.org URLs (abs, pdf, html)
     # Handle URLs with version numbers and various formats
-    arxiv_url_match = re.search(r'arxiv\.org/(?:abs|pdf|html)/([^\s/?#]+?)(?:\.pdf|v\d+)?(?:[?\#]|$)', url, re.IGNORECASE)
+    arxiv_url_match = _ARXIV_URL_ID_RE.search(url)
     if arxiv_url_match:
         arxiv_id = arxiv_url_match.group(1)
         # Remove version number if present
-        return re.sub(r'v\d+$', '', arxiv_id)
+        return _ARXIV_VERSION_RE.sub('', arxiv_id)
     
     # Pattern 3: Fallback for simpler URL patterns
-    fallback_match = re.search(r'arxiv\.org/(?:abs|pdf|html)/([^/?#]+)', url, re.IGNORECASE)
+    fallback_match = _ARXIV_FALLBACK_ID_RE.search(url)
     if fallback_match:
         arxiv_id = fallback_match.group(1).replace('.pdf', '')
         # Remove version number if present
-        return re.sub(r'v\d+$', '', arxiv_id)
+        return _ARXIV_VERSION_RE.sub('', arxiv_id)
     
     return None
 
@@ -232,19 +290,17 @@ def clean_url(url: str) -> str:
     
     # Handle malformed URLs that contain \url{} wrappers within the URL text
     # e.g., "https://\url{https://www.example.com/}" -> "https://www.example.com/"
-    import re
-    url_pattern = r'https?://\\url\{(https?://[^}]+)\}'
-    url_match = re.search(url_pattern, url)
-    if url_match:
-        url = url_match.group(1)
+    if '\\url{' in url:
+        url_match = _LATEX_URL_WRAPPER_RE.search(url)
+        if url_match:
+            url = url_match.group(1)
     
     # Handle markdown-style links like [text](url) or [url](url)
     # e.g., "[https://example.com](https://example.com)" -> "https://example.com"
-    markdown_pattern = r'\[([^\]]*)\]\((https?://[^)]+)\)'
-    markdown_match = re.search(markdown_pattern, url)
-    if markdown_match:
+    link_target = _markdown_link_target(url)
+    if link_target:
         # Use the URL from parentheses
-        url = markdown_match.group(2)
+        url = link_target
     
     # Remove trailing punctuation that's commonly part of sentence structure
     # but preserve legitimate URL characters
@@ -283,19 +339,17 @@ def clean_url_punctuation(url: str) -> str:
     
     # Handle malformed URLs that contain \\url{} wrappers within the URL text
     # e.g., "https://\\url{https://www.example.com/}" -> "https://www.example.com/"
-    import re
-    url_pattern = r'https?://\\url\{(https?://[^}]+)\}'
-    url_match = re.search(url_pattern, url)
-    if url_match:
-        url = url_match.group(1)
+    if '\\url{' in url:
+        url_match = _LATEX_URL_WRAPPER_RE.search(url)
+        if url_match:
+            url = url_match.group(1)
     
     # Handle markdown-style links like [text](url) or [url](url)
     # e.g., "[https://example.com](https://example.com)" -> "https://example.com"
-    markdown_pattern = r'\[([^\]]*)\]\((https?://[^)]+)\)'
-    markdown_match = re.search(markdown_pattern, url)
-    if markdown_match:
+    link_target = _markdown_link_target(url)
+    if link_target:
         # Use the URL from parentheses
-        url = markdown_match.group(2)
+        url = link_target
     
     # Remove trailing punctuation that's commonly part of sentence structure
     # but preserve legitimate URL characters
@@ -9,8 +9,10 @@ import sys
 from pathlib import Path
 from unittest.mock import Mock, MagicMock
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path for imports once per session; test modules rely on this
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
 
 @pytest.fixture
 def temp_dir():
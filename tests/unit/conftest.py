@@ -0,0 +1,17 @@
+"""
+Shared pytest fixtures for RefChecker unit tests.
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def ref_checker():
+    """Create a single ArxivReferenceChecker shared by all unit tests.
+
+    Tests using this fixture only call read-only methods, so one instance is
+    safe to share. The import is deferred so modules that do not need the
+    checker can be collected without its dependencies.
+    """
+    from refchecker.core.refchecker import ArxivReferenceChecker
+    return ArxivReferenceChecker()
@@ -955,6 +955,24 @@ Yuan, Z.; and Zhu, M. 2024.
                 result = enhanced_name_match(cited_name, correct_name)
                 self.assertTrue(result, f"Should still work: {repr(cited_name)} vs {repr(correct_name)}")
 
+    def test_repeated_parse_returns_independent_references(self):
+        """Test that re-parsing the same bibliography is not affected by callers mutating results"""
+        from refchecker.utils.bibtex_parser import parse_bibtex_references
+
+        bib_content = '''@article{smith2020,
+  title={Deep Learning},
+  author={Smith, John and Doe, Jane},
+  year={2020}
+}'''
+
+        first = parse_bibtex_references(bib_content)
+        first[0]['title'] = 'Changed'
+        first[0]['authors'].append('Extra Author')
+
+        second = parse_bibtex_references(bib_content)
+        self.assertEqual(second[0]['title'], 'Deep Learning')
+        self.assertEqual(len(second[0]['authors']), 2)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
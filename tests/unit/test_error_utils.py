@@ -25,6 +25,7 @@ try:
         format_author_mismatch,
         format_first_author_mismatch,
         format_three_line_mismatch,
+        count_error_types,
     )
     ERROR_UTILS_AVAILABLE = True
 except ImportError:
@@ -225,6 +226,25 @@ class TestErrorValidation:
         assert validate_error_dict(error_dict, [])
 
 
+class TestErrorCounting:
+    """Test counting of errors, warnings and info messages."""
+    
+    def test_count_error_types_excludes_unverified(self):
+        """Test that unverified errors are not counted as errors."""
+        errors = [
+            {'error_type': 'arxiv_id', 'error_details': 'ArXiv ID mismatch'},
+            {'warning_type': 'year', 'warning_details': 'Year mismatch'},
+            {'info_type': 'url', 'info_details': 'URL differs'},
+            {'error_type': 'unverified', 'error_details': 'Could not verify'},
+        ]
+        
+        assert count_error_types(errors) == (1, 1, 1)
+    
+    def test_count_error_types_empty(self):
+        """Test counting an empty error list."""
+        assert count_error_types([]) == (0, 0, 0)
+
+
 class TestDoiComparison:
     """Test DOI comparison case sensitivity and format handling"""
     
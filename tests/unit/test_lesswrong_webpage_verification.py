@@ -16,8 +16,10 @@ from refchecker.checkers.webpage_checker import WebPageChecker
 class TestLessWrongWebpageVerification(unittest.TestCase):
     """Test LessWrong webpage verification functionality."""
     
-    def setUp(self):
-        self.checker = WebPageChecker()
+    @classmethod
+    def setUpClass(cls):
+        # Tests only call read-only methods, so one checker is shared
+        cls.checker = WebPageChecker()
     
     def test_lesswrong_url_recognition(self):
         """Test that LessWrong URLs are recognized as verifiable web pages."""
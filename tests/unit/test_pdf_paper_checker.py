@@ -3,6 +3,7 @@
 Unit tests for PDF Paper Checker
 """
 
+import io
 import unittest
 import sys
 import os
@@ -17,8 +18,10 @@ from refchecker.checkers.pdf_paper_checker import PDFPaperChecker
 class TestPDFPaperChecker(unittest.TestCase):
     """Test PDF paper checker functionality"""
     
-    def setUp(self):
-        self.checker = PDFPaperChecker()
+    @classmethod
+    def setUpClass(cls):
+        # Tests only call read-only methods, so one checker is shared
+        cls.checker = PDFPaperChecker()
     
     def test_can_check_reference_pdf_url(self):
         """Test that direct PDF URLs are recognized"""
@@ -95,7 +98,7 @@ class TestPDFPaperChecker(unittest.TestCase):
     def test_verify_reference_success(self, mock_extract, mock_download):
         """Test successful PDF verification"""
         # Mock PDF download
-        mock_download.return_value = b'%PDF-1.4 mock pdf content'
+        mock_download.return_value = io.BytesIO(b'%PDF-1.4 mock pdf content')
         
         # Mock PDF data extraction
         mock_extract.return_value = {
@@ -146,7 +149,7 @@ class TestPDFPaperChecker(unittest.TestCase):
         """Test verification with PDF link detection"""
         # First download attempt fails (not a direct PDF)
         # Second download attempt succeeds (found PDF link)
-        mock_download.side_effect = [None, b'%PDF-1.4 mock pdf content']
+        mock_download.side_effect = [None, io.BytesIO(b'%PDF-1.4 mock pdf content')]
         
         # Mock finding PDF link
         mock_find_pdf.return_value = 'https://example.org/actual-document.pdf'
@@ -171,6 +174,34 @@ class TestPDFPaperChecker(unittest.TestCase):
             mock_find_pdf.assert_called_once()
             self.assertEqual(mock_download.call_count, 2)  # Called twice
     
+    @patch.object(PDFPaperChecker, '_download_pdf')
+    @patch.object(PDFPaperChecker, '_extract_pdf_data')
+    def test_batch_verification(self, mock_extract, mock_download):
+        """Test that batch verification returns one result per reference, in order"""
+        mock_download.side_effect = lambda url: io.BytesIO(b'%PDF-1.4 mock pdf content')
+        mock_extract.return_value = {
+            'title': 'Test Document',
+            'authors': ['Test Author'],
+            'text': 'This is a test document with relevant content',
+            'page_count': 1,
+            'extraction_method': 'pdfplumber'
+        }
+        
+        references = [
+            {'title': 'Test Document', 'authors': ['Test Author'], 'url': f'https://example.org/test{i}.pdf'}
+            for i in range(5)
+        ]
+        
+        results = self.checker.verify_references(references, max_workers=3)
+        
+        self.assertEqual(len(results), len(references))
+        self.assertEqual(mock_download.call_count, len(references))
+        for reference, (verified_data, errors, url) in zip(references, results):
+            self.assertIsNotNone(verified_data)
+            self.assertEqual(url, reference['url'])
+        
+        self.assertEqual(self.checker.verify_references([]), [])
+    
     def test_validate_citation_title_match(self):
         """Test citation validation with title matching"""
         reference = {
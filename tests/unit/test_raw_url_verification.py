@@ -7,7 +7,8 @@ Tests the new logic that verifies URLs when paper validators fail.
 import unittest
 import sys
 import os
-from unittest.mock import Mock, patch, MagicMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 # Add the src directory to the path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
@@ -16,18 +17,34 @@ from refchecker.checkers.webpage_checker import WebPageChecker
 from refchecker.core.refchecker import ArxivReferenceChecker
 
 
+def _response(status_code, content_type='', url='', content=b''):
+    """Build a minimal stand-in for a requests.Response."""
+    return SimpleNamespace(status_code=status_code, headers={'content-type': content_type}, url=url, content=content)
+
+
+def _stub_request(testcase, checker, response):
+    """Stub checker._respectful_request on the instance for the duration of a test.
+
+    ``response`` is either the value to return or a callable taking the URL.
+    """
+    fetch = response if callable(response) else (lambda url, timeout=15: response)
+    checker._respectful_request = fetch
+    testcase.addCleanup(delattr, checker, '_respectful_request')
+
+
 class TestRawUrlVerification(unittest.TestCase):
     """Test raw URL verification logic."""
     
-    def setUp(self):
-        self.webpage_checker = WebPageChecker()
-        self.refchecker = ArxivReferenceChecker()
+    @classmethod
+    def setUpClass(cls):
+        # Construction is the expensive part; the tests only read from these checkers
+        cls.webpage_checker = WebPageChecker()
+        cls.refchecker = ArxivReferenceChecker()
     
-    @patch('refchecker.checkers.webpage_checker.WebPageChecker._respectful_request')
-    def test_nonexistent_page_returns_correct_error(self, mock_request):
+    def test_nonexistent_page_returns_correct_error(self):
         """Test that non-existent pages return the correct error message."""
         # Mock a 404 response
-        mock_request.return_value = None
+        _stub_request(self, self.webpage_checker, None)
         
         reference = {
             'title': 'Test Paper',
@@ -44,16 +61,10 @@ class TestRawUrlVerification(unittest.TestCase):
         self.assertEqual(errors[0]['error_details'], 'non-existent web page')
         self.assertEqual(url, 'https://example.com/nonexistent')
     
-    @patch('refchecker.checkers.webpage_checker.WebPageChecker._respectful_request')
-    def test_existing_page_no_title_match_no_venue(self, mock_request):
+    def test_existing_page_no_title_match_no_venue(self):
         """Test existing page without title match and no venue specified."""
         # Mock a successful response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {'content-type': 'text/html'}
-        mock_response.url = 'https://example.com/page'
-        mock_response.content = b'<html><head><title>Different Title</title></head><body>Some content</body></html>'
-        mock_request.return_value = mock_response
+        _stub_request(self, self.webpage_checker, _response(200, 'text/html', 'https://example.com/page', b'<html><head><title>Different Title</title></head><body>Some content</body></html>'))
         
         reference = {
             'title': 'Machine Learning Paper',
@@ -71,16 +82,10 @@ class TestRawUrlVerification(unittest.TestCase):
         self.assertEqual(errors[0]['error_details'], "paper not found and URL doesn't reference it")
         self.assertEqual(url, 'https://example.com/page')
     
-    @patch('refchecker.checkers.webpage_checker.WebPageChecker._respectful_request')
-    def test_existing_page_title_match_no_venue_verified(self, mock_request):
+    def test_existing_page_title_match_no_venue_verified(self):
         """Test existing page with title match and no venue - should be verified."""
         # Mock a successful response with title match
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {'content-type': 'text/html'}
-        mock_response.url = 'https://example.com/page'
-        mock_response.content = b'<html><head><title>Machine Learning Research</title></head><body>This page contains information about Machine Learning Research and related topics.</body></html>'
-        mock_request.return_value = mock_response
+        _stub_request(self, self.webpage_checker, _response(200, 'text/html', 'https://example.com/page', b'<html><head><title>Machine Learning Research</title></head><body>This page contains information about Machine Learning Research and related topics.</body></html>'))
         
         reference = {
             'title': 'Machine Learning Research',
@@ -101,16 +106,10 @@ class TestRawUrlVerification(unittest.TestCase):
         self.assertEqual(verified_data['url'], 'https://example.com/page')
         self.assertEqual(url, 'https://example.com/page')
     
-    @patch('refchecker.checkers.webpage_checker.WebPageChecker._respectful_request')
-    def test_existing_page_title_match_with_venue_unverified(self, mock_request):
+    def test_existing_page_title_match_with_venue_unverified(self):
         """Test existing page with title match but venue specified - should remain unverified."""
         # Mock a successful response with title match
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {'content-type': 'text/html'}
-        mock_response.url = 'https://example.com/page'
-        mock_response.content = b'<html><head><title>Machine Learning Research</title></head><body>This page contains information about Machine Learning Research.</body></html>'
-        mock_request.return_value = mock_response
+        _stub_request(self, self.webpage_checker, _response(200, 'text/html', 'https://example.com/page', b'<html><head><title>Machine Learning Research</title></head><body>This page contains information about Machine Learning Research.</body></html>'))
         
         reference = {
             'title': 'Machine Learning Research',
@@ -128,15 +127,10 @@ class TestRawUrlVerification(unittest.TestCase):
         self.assertEqual(errors[0]['error_details'], 'paper not verified but URL references paper')
         self.assertEqual(url, 'https://example.com/page')
     
-    @patch('refchecker.checkers.webpage_checker.WebPageChecker._respectful_request')
-    def test_pdf_document_no_venue_verified(self, mock_request):
+    def test_pdf_document_no_venue_verified(self):
         """Test PDF document without venue specified - should be verified."""
         # Mock a PDF response
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {'content-type': 'application/pdf'}
-        mock_response.url = 'https://example.com/paper.pdf'
-        mock_request.return_value = mock_response
+        _stub_request(self, self.webpage_checker, _response(200, 'application/pdf', 'https://example.com/paper.pdf'))
         
         reference = {
             'title': 'Research Paper',
@@ -154,13 +148,10 @@ class TestRawUrlVerification(unittest.TestCase):
         self.assertEqual(verified_data['venue'], 'PDF Document')
         self.assertEqual(verified_data['url'], 'https://example.com/paper.pdf')
     
-    @patch('refchecker.checkers.webpage_checker.WebPageChecker._respectful_request')
-    def test_403_blocked_no_venue_verified(self, mock_request):
+    def test_403_blocked_no_venue_verified(self):
         """Test 403 blocked resource without venue - should be verified."""
         # Mock a 403 response
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_request.return_value = mock_response
+        _stub_request(self, self.webpage_checker, _response(403))
         
         reference = {
             'title': 'Blocked Resource',
@@ -207,17 +198,11 @@ class TestRawUrlVerification(unittest.TestCase):
         self.assertEqual(errors[0]['error_details'], "paper not found and URL doesn't reference it")
         self.assertIsNone(url)
     
-    @patch('refchecker.checkers.webpage_checker.WebPageChecker._respectful_request')
-    def test_partial_title_match_no_venue_verified(self, mock_request):
+    def test_partial_title_match_no_venue_verified(self):
         """Test partial title match (60% threshold) without venue - should be verified."""
         # Mock a successful response with partial title match
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.headers = {'content-type': 'text/html'}
-        mock_response.url = 'https://example.com/page'
         # Content has most key words from title
-        mock_response.content = b'<html><head><title>Research Page</title></head><body>This page discusses advanced machine learning techniques and neural networks.</body></html>'
-        mock_request.return_value = mock_response
+        _stub_request(self, self.webpage_checker, _response(200, 'text/html', 'https://example.com/page', b'<html><head><title>Research Page</title></head><body>This page discusses advanced machine learning techniques and neural networks.</body></html>'))
         
         reference = {
             'title': 'Advanced Machine Learning Techniques',
@@ -233,6 +218,25 @@ class TestRawUrlVerification(unittest.TestCase):
         self.assertEqual(len(errors), 0)
         self.assertIn(verified_data['venue'], ['Web Page', 'Example'])  # Can be either depending on organization extraction
     
+    def test_batch_verification_preserves_order(self):
+        """Test that batch URL verification returns one result per reference, in order."""
+        _stub_request(self, self.webpage_checker, lambda url: None if url.endswith('missing') else _response(
+            200, 'text/html', url, b'<html><head><title>Machine Learning Research</title></head><body>Machine Learning Research</body></html>'))
+        
+        references = [
+            {'title': 'Machine Learning Research', 'authors': ['John Doe'], 'url': 'https://example.com/page'},
+            {'title': 'Machine Learning Research', 'authors': ['John Doe'], 'url': 'https://example.com/missing'},
+            {'title': 'Machine Learning Research', 'authors': ['John Doe']},
+        ]
+        
+        results = self.webpage_checker.verify_raw_urls_for_unverified_references(references)
+        
+        self.assertEqual(len(results), 3)
+        self.assertIsNotNone(results[0][0])
+        self.assertEqual(results[1][1][0]['error_details'], 'non-existent web page')
+        self.assertIsNone(results[2][2])
+        self.assertEqual(self.webpage_checker.verify_raw_urls_for_unverified_references([]), [])
+    
     @patch('refchecker.checkers.webpage_checker.WebPageChecker.verify_raw_url_for_unverified_reference')
     def test_integration_with_main_verifier(self, mock_url_verify):
         """Test integration with the main reference verifier."""
@@ -268,10 +272,12 @@ class TestRawUrlVerification(unittest.TestCase):
 class TestWebContentVenues(unittest.TestCase):
     """Test web content venue detection and verification"""
     
+    @classmethod
+    def setUpClass(cls):
+        cls.checker = WebPageChecker()
+    
     def test_news_venue_verified(self):
         """Test that news venues are correctly verified"""
-        checker = WebPageChecker()
-        
         # Test various news venues
         news_venues = [
             "CBC News",
@@ -285,12 +291,10 @@ class TestWebContentVenues(unittest.TestCase):
         
         for venue in news_venues:
             with self.subTest(venue=venue):
-                self.assertTrue(checker._is_web_content_venue(venue, "https://example.com/news/article"))
+                self.assertTrue(self.checker._is_web_content_venue(venue, "https://example.com/news/article"))
     
     def test_tech_publication_venue_verified(self):
         """Test that tech publications are correctly verified"""
-        checker = WebPageChecker()
-        
         tech_venues = [
             "TechCrunch",
             "Wired",
@@ -301,12 +305,10 @@ class TestWebContentVenues(unittest.TestCase):
         
         for venue in tech_venues:
             with self.subTest(venue=venue):
-                self.assertTrue(checker._is_web_content_venue(venue, "https://example.com/tech/article"))
+                self.assertTrue(self.checker._is_web_content_venue(venue, "https://example.com/tech/article"))
     
     def test_blog_platform_venue_verified(self):
         """Test that blog platforms are correctly verified"""
-        checker = WebPageChecker()
-        
         blog_venues = [
             "Medium",
             "Company Blog",
@@ -316,12 +318,10 @@ class TestWebContentVenues(unittest.TestCase):
         
         for venue in blog_venues:
             with self.subTest(venue=venue):
-                self.assertTrue(checker._is_web_content_venue(venue, "https://example.com/blog/post"))
+                self.assertTrue(self.checker._is_web_content_venue(venue, "https://example.com/blog/post"))
     
     def test_academic_venue_not_web_content(self):
         """Test that academic venues are not considered web content"""
-        checker = WebPageChecker()
-        
         academic_venues = [
             "Nature",
             "Science",
@@ -333,30 +333,22 @@ class TestWebContentVenues(unittest.TestCase):
         
         for venue in academic_venues:
             with self.subTest(venue=venue):
-                self.assertFalse(checker._is_web_content_venue(venue, "https://example.com/paper"))
+                self.assertFalse(self.checker._is_web_content_venue(venue, "https://example.com/paper"))
     
     def test_url_domain_influences_detection(self):
         """Test that URL domain can influence web content detection"""
-        checker = WebPageChecker()
-        
         # Generic venue but URL suggests news content
-        self.assertTrue(checker._is_web_content_venue("Some Publication", "https://cbc.ca/news/article"))
-        self.assertTrue(checker._is_web_content_venue("Article", "https://techcrunch.com/blog/post"))
-        self.assertTrue(checker._is_web_content_venue("Report", "https://medium.com/@author/story"))
+        self.assertTrue(self.checker._is_web_content_venue("Some Publication", "https://cbc.ca/news/article"))
+        self.assertTrue(self.checker._is_web_content_venue("Article", "https://techcrunch.com/blog/post"))
+        self.assertTrue(self.checker._is_web_content_venue("Report", "https://medium.com/@author/story"))
         
         # Generic venue with academic URL should not be web content
-        self.assertFalse(checker._is_web_content_venue("Some Publication", "https://ieee.org/paper"))
+        self.assertFalse(self.checker._is_web_content_venue("Some Publication", "https://ieee.org/paper"))
 
-    @patch.object(WebPageChecker, '_respectful_request')
-    def test_news_article_with_venue_verified(self, mock_request):
+    def test_news_article_with_venue_verified(self):
         """Test that a news article with proper venue gets verified"""
-        checker = WebPageChecker()
-        
         # Mock successful HTTP response with title match
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.headers = {'content-type': 'text/html'}
-        mock_response.content = b'''
+        content = b'''
         <html>
             <head><title>Breaking News: Important Story</title></head>
             <body>
@@ -365,8 +357,7 @@ class TestWebContentVenues(unittest.TestCase):
             </body>
         </html>
         '''
-        mock_response.url = "https://cbc.ca/news/important-story"
-        mock_request.return_value = mock_response
+        _stub_request(self, self.checker, _response(200, 'text/html', "https://cbc.ca/news/important-story", content))
         
         reference = {
             'title': 'Breaking News: Important Story',
@@ -376,7 +367,7 @@ class TestWebContentVenues(unittest.TestCase):
             'url': 'https://cbc.ca/news/important-story'
         }
         
-        verified_data, errors, url = checker.verify_raw_url_for_unverified_reference(reference)
+        verified_data, errors, url = self.checker.verify_raw_url_for_unverified_reference(reference)
         
         # Should be verified because it's a news venue with matching content
         self.assertIsNotNone(verified_data)
@@ -2,7 +2,6 @@
 Unit tests for reference extraction functionality.
 """
 
-import pytest
 import sys
 import os
 from unittest.mock import Mock, patch, MagicMock
@@ -10,17 +9,10 @@ from unittest.mock import Mock, patch, MagicMock
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
-from refchecker.core.refchecker import ArxivReferenceChecker
-
 
 class TestReferenceExtraction:
     """Test reference extraction from text."""
     
-    @pytest.fixture
-    def ref_checker(self):
-        """Create an ArxivReferenceChecker instance for testing."""
-        return ArxivReferenceChecker()
-    
     def test_extract_bibliography(self, ref_checker, sample_bibliography):
         """Test bibliography extraction."""
         # Test find_bibliography_section which works with strings
@@ -75,11 +67,6 @@ class TestReferenceExtraction:
 class TestBibliographyExtraction:
     """Test bibliography section extraction."""
     
-    @pytest.fixture
-    def ref_checker(self):
-        """Create an ArxivReferenceChecker instance for testing."""
-        return ArxivReferenceChecker()
-    
     def test_find_bibliography_section(self, ref_checker, sample_pdf_content):
         """Test finding bibliography section in text."""
         # Test the actual method that exists
@@ -113,11 +100,6 @@ class TestBibliographyExtraction:
 class TestReferenceValidation:
     """Test reference validation logic."""
     
-    @pytest.fixture
-    def ref_checker(self):
-        """Create an ArxivReferenceChecker instance for testing."""
-        return ArxivReferenceChecker()
-    
     def test_doi_validation(self, ref_checker):
         """Test DOI validation functionality."""
         valid_doi = "10.1000/test"
@@ -152,11 +134,6 @@ class TestReferenceValidation:
 class TestArxivIntegration:
     """Test arXiv-specific functionality."""
     
-    @pytest.fixture
-    def ref_checker(self):
-        """Create an ArxivReferenceChecker instance for testing."""
-        return ArxivReferenceChecker()
-    
     def test_arxiv_paper_metadata(self, ref_checker):
         """Test arXiv paper metadata retrieval."""
         # Test the actual methods that exist
@@ -3,11 +3,6 @@ Unit tests for text utilities module.
 """
 
 import pytest
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from refchecker.utils.text_utils import (
     is_name_match, 
@@ -22,7 +17,9 @@ from refchecker.utils.text_utils import (
     are_venues_substantially_different,
     is_year_substantially_different,
     normalize_diacritics,
-    compare_authors
+    compare_authors,
+    normalize_venue_for_display,
+    strip_latex_commands,
 )
 
 
@@ -191,8 +188,6 @@ class TestNameMatching:
 
     def test_author_display_consistency_in_errors(self):
         """Test that author error messages show names in consistent 'First Last' format"""
-        from refchecker.utils.text_utils import compare_authors
-        
         # Test with comma format vs regular format - should show both in "First Last" format
         cited = ["Koundinyan, Srivathsan"] 
         correct = [{"name": "John P. Smith"}]  # Different name to trigger error
@@ -234,7 +229,17 @@ class TestAuthorNameProcessing:
         normalized = normalize_author_name("John Smith")
         assert isinstance(normalized, str)
         assert len(normalized) > 0
-    
+
+    def test_author_name_cleaning_handles_repeated_and_non_string_names(self):
+        """Test that repeated names give identical results and non-strings still work."""
+        assert clean_author_name("Dr. Y . Li") == clean_author_name("Dr. Y . Li") == "Y. Li"
+        assert normalize_author_name("[1] Y . Li") == normalize_author_name("[1] Y . Li")
+        # Different spellings of the same name normalize to the same key
+        assert normalize_author_name("J. Smith") == normalize_author_name("J  Smith")
+        assert clean_author_name("Dr. Y . Li") == clean_author_name("Y. Li")
+        assert clean_author_name(None) == ''
+        assert clean_author_name(42) == '42'
+
     def test_parse_authors_with_initials(self):
         """Test parsing authors with initials."""
         # Basic test
@@ -267,7 +272,18 @@ class TestAuthorNameProcessing:
             result = parse_authors_with_initials(input_authors)
             assert result == expected, f"Expected {expected} but got {result} for '{input_authors}'"
     
-    def test_single_author_lastname_firstname_parsing(self):
+    # Cases that were causing "Author count mismatch" errors, where the
+    # "firstname" is a single name or name+initial
+    @pytest.mark.parametrize("input_author,expected", [
+        ("Krathwohl, David R", ["Krathwohl, David R"]),  # first name + middle initial
+        ("Butler, Andrew C", ["Butler, Andrew C"]),     # first name + middle initial
+        ("Towns, Marcy H", ["Towns, Marcy H"]),         # first name + middle initial
+        ("Smith, John", ["Smith, John"]),               # single first name
+        ("O'Connor, Sean", ["O'Connor, Sean"]),         # single first name with apostrophe
+        ("Li, J.", ["Li, J."]),                         # single initial
+        ("Martinez, A. B.", ["Martinez, A. B."]),       # initials
+    ])
+    def test_single_author_lastname_firstname_parsing(self, input_author, expected):
         """
         Regression test for author count mismatch issue.
         
@@ -277,22 +293,9 @@ class TestAuthorNameProcessing:
         Previously, "Krathwohl, David R" was incorrectly parsed as 
         ["Krathwohl", "David R"] (2 authors) instead of ["Krathwohl, David R"] (1 author).
         """
-        # Test cases that were causing "Author count mismatch" errors
-        # These are cases where the "firstname" is a single name or name+initial
-        single_author_cases = [
-            ("Krathwohl, David R", ["Krathwohl, David R"]),  # first name + middle initial
-            ("Butler, Andrew C", ["Butler, Andrew C"]),     # first name + middle initial
-            ("Towns, Marcy H", ["Towns, Marcy H"]),         # first name + middle initial
-            ("Smith, John", ["Smith, John"]),               # single first name
-            ("O'Connor, Sean", ["O'Connor, Sean"]),         # single first name with apostrophe
-            ("Li, J.", ["Li, J."]),                         # single initial
-            ("Martinez, A. B.", ["Martinez, A. B."]),       # initials
-        ]
-        
-        for input_author, expected in single_author_cases:
-            result = parse_authors_with_initials(input_author)
-            assert result == expected, f"Expected {expected} but got {result} for '{input_author}'"
-            assert len(result) == 1, f"Expected 1 author but got {len(result)} for '{input_author}'"
+        result = parse_authors_with_initials(input_author)
+        assert result == expected
+        assert len(result) == 1
     
     def test_author_comparison_with_fixed_parsing(self):
         """
@@ -313,7 +316,15 @@ class TestAuthorNameProcessing:
             assert result == True, f"Expected match for {cited_authors} vs {correct_authors}, but got: {error}"
             assert "Authors match" in error, f"Expected 'Authors match' message but got: {error}"
     
-    def test_latex_author_parsing_fix(self):
+    @pytest.mark.parametrize("input_authors,expected", [
+        # The specific case that was failing
+        ("Hochreiter, Sepp and Schmidhuber, J{\"u}rgen", ["Hochreiter, Sepp", "Schmidhuber, Jurgen"]),
+        ("Smith, John and M{\"u}ller, Hans", ["Smith, John", "Muller, Hans"]),
+        # Plain Unicode (non-LaTeX) cases - these work better
+        ("García, José and López, María", ["García, José", "López, María"]),
+        ("Müller, Hans and Schmidt, Jürgen", ["Müller, Hans", "Schmidt, Jürgen"]),
+    ])
+    def test_latex_author_parsing_fix(self, input_authors, expected):
         """
         Regression test for LaTeX in author names causing parsing issues.
         
@@ -323,19 +334,8 @@ class TestAuthorNameProcessing:
         Previously, "Hochreiter, Sepp and Schmidhuber, J{\"u}rgen" was incorrectly 
         parsed as 3 authors instead of 2 due to LaTeX braces interfering with parsing.
         """
-        # Test the specific case that was failing
-        latex_cases = [
-            ("Hochreiter, Sepp and Schmidhuber, J{\"u}rgen", ["Hochreiter, Sepp", "Schmidhuber, Jurgen"]),
-            ("Smith, John and M{\"u}ller, Hans", ["Smith, John", "Muller, Hans"]),
-            # Test plain Unicode (non-LaTeX) cases - these work better
-            ("García, José and López, María", ["García, José", "López, María"]),
-            ("Müller, Hans and Schmidt, Jürgen", ["Müller, Hans", "Schmidt, Jürgen"]),
-        ]
-        
-        for input_authors, expected in latex_cases:
-            result = parse_authors_with_initials(input_authors)
-            assert result == expected, f"Expected {expected} but got {result} for '{input_authors}'"
-            
+        assert parse_authors_with_initials(input_authors) == expected
+    
     def test_latex_author_comparison_integration(self):
         """
         Test that LaTeX-cleaned author parsing integrates correctly with comparison.
@@ -424,53 +424,47 @@ class TestTitleCleaning:
         assert isinstance(title, str)
         assert len(title) > 0
     
-    def test_bibtex_publication_type_indicators(self):
+    @pytest.mark.parametrize("input_title,expected_output", [
+        # The original problematic case
+        ("A self regularized non-monotonic activation function [J]", 
+         "A self regularized non-monotonic activation function"),
+        
+        # Other publication type indicators  
+        ("Some Conference Paper [C]", "Some Conference Paper"),
+        ("A Book Title [M]", "A Book Title"),
+        ("PhD Dissertation Title [D]", "PhD Dissertation Title"),
+        ("Patent Document Title [P]", "Patent Document Title"),
+        ("Research Report Title [R]", "Research Report Title"),
+        
+        # Should not remove brackets in middle of title
+        ("Title with [brackets] inside [J]", "Title with [brackets] inside"),
+        ("Title [J] in middle", "Title [J] in middle"),
+        
+        # With extra whitespace
+        ("Title with trailing spaces [J]   ", "Title with trailing spaces"),
+        ("Title with leading spaces   [C]", "Title with leading spaces"),
+        
+        # Normal titles should be unchanged
+        ("Normal Title Without Indicators", "Normal Title Without Indicators"),
+        ("Title with [other brackets]", "Title with [other brackets]"),
+    ])
+    def test_bibtex_publication_type_indicators(self, input_title, expected_output):
         """Test removal of BibTeX publication type indicators like [J], [C], etc.
         
         Regression test for bug where titles like "A self regularized non-monotonic activation function [J]"
         were not properly cleaned, causing paper verification failures.
         """
-        test_cases = [
-            # The original problematic case
-            ("A self regularized non-monotonic activation function [J]", 
-             "A self regularized non-monotonic activation function"),
-            
-            # Other publication type indicators  
-            ("Some Conference Paper [C]", "Some Conference Paper"),
-            ("A Book Title [M]", "A Book Title"),
-            ("PhD Dissertation Title [D]", "PhD Dissertation Title"),
-            ("Patent Document Title [P]", "Patent Document Title"),
-            ("Research Report Title [R]", "Research Report Title"),
-            
-            # Should not remove brackets in middle of title
-            ("Title with [brackets] inside [J]", "Title with [brackets] inside"),
-            ("Title [J] in middle", "Title [J] in middle"),
-            
-            # With extra whitespace
-            ("Title with trailing spaces [J]   ", "Title with trailing spaces"),
-            ("Title with leading spaces   [C]", "Title with leading spaces"),
-            
-            # Normal titles should be unchanged
-            ("Normal Title Without Indicators", "Normal Title Without Indicators"),
-            ("Title with [other brackets]", "Title with [other brackets]"),
-        ]
-        
-        for input_title, expected_output in test_cases:
-            cleaned = clean_title(input_title)
-            assert cleaned == expected_output, f"Failed for '{input_title}': got '{cleaned}', expected '{expected_output}'"
-        
-        # Also test clean_title_for_search handles publication type indicators
-        search_test_cases = [
-            ("A self regularized non-monotonic activation function [J]", 
-             "A self regularized non-monotonic activation function"),
-            ("Some Conference Paper [C]", "Some Conference Paper"),
-            ("Normal Title", "Normal Title"),
-        ]
-        
-        for input_title, expected_output in search_test_cases:
-            search_cleaned = clean_title_for_search(input_title)
-            assert search_cleaned == expected_output, f"Search cleaning failed for '{input_title}': got '{search_cleaned}', expected '{expected_output}'"
-
+        assert clean_title(input_title) == expected_output
+    
+    @pytest.mark.parametrize("input_title,expected_output", [
+        ("A self regularized non-monotonic activation function [J]", 
+         "A self regularized non-monotonic activation function"),
+        ("Some Conference Paper [C]", "Some Conference Paper"),
+        ("Normal Title", "Normal Title"),
+    ])
+    def test_search_cleaning_removes_publication_type_indicators(self, input_title, expected_output):
+        """Test that clean_title_for_search also handles publication type indicators."""
+        assert clean_title_for_search(input_title) == expected_output
 
 class TestTextNormalization:
     """Test text normalization functions."""
@@ -652,8 +646,6 @@ class TestAndOthersHandling:
     
     def test_and_others_in_bibtex_format(self):
         """Test 'and others' in BibTeX comma-separated format"""
-        from refchecker.utils.text_utils import parse_authors_with_initials
-        
         test_cases = [
             # Basic case
             ("Smith, John and Doe, Jane and others", ["Smith, John", "Doe, Jane", "et al"]),
@@ -676,8 +668,6 @@ class TestAndOthersHandling:
     
     def test_and_others_edge_cases(self):
         """Test edge cases for 'and others' handling"""
-        from refchecker.utils.text_utils import parse_authors_with_initials
-        
         test_cases = [
             # Case sensitivity
             ("Smith, John and Others", ["Smith, John", "et al"]),
@@ -698,8 +688,6 @@ class TestAndOthersHandling:
     
     def test_backwards_compatibility_et_al(self):
         """Ensure existing 'et al' handling still works correctly"""
-        from refchecker.utils.text_utils import parse_authors_with_initials
-        
         test_cases = [
             # Various 'et al' formats should still work
             ("Smith, John and et al", ["Smith, John", "et al"]),
@@ -713,8 +701,6 @@ class TestAndOthersHandling:
     
     def test_no_false_positives(self):
         """Ensure words containing 'others' are not falsely converted"""
-        from refchecker.utils.text_utils import parse_authors_with_initials
-        
         test_cases = [
             # Author names that contain 'others' should not be converted
             ("Brothers, John and Sisters, Jane", ["Brothers, John", "Sisters, Jane"]),
@@ -737,8 +723,6 @@ class TestProceedingsOrdinalNormalization:
     
     def test_acm_sigops_29th_symposium(self):
         """Test the specific case that was failing"""
-        from refchecker.utils.text_utils import normalize_venue_for_display, are_venues_substantially_different
-        
         cited_venue = 'Proceedings of the ACM SIGOPS 29th Symposium on Operating Systems Principles'
         actual_venue = 'Symposium on Operating Systems Principles'
         
@@ -755,15 +739,12 @@ class TestProceedingsOrdinalNormalization:
             "These venues should be considered the same after normalization"
         
         # Test that no venue warning would be generated (simulating the checker logic)
-        from refchecker.utils.error_utils import create_venue_warning
         should_create_warning = are_venues_substantially_different(cited_venue, actual_venue)
         assert not should_create_warning, \
             "No venue warning should be generated for properly normalized venues"
     
     def test_ieee_ordinal_conference(self):
         """Test IEEE proceedings with ordinals"""
-        from refchecker.utils.text_utils import normalize_venue_for_display, are_venues_substantially_different
-        
         cited_venue = 'Proceedings of the IEEE 25th International Conference on Computer Vision'
         actual_venue = 'International Conference on Computer Vision'
         
@@ -778,8 +759,6 @@ class TestProceedingsOrdinalNormalization:
     
     def test_usenix_osdi_ordinal(self):
         """Test USENIX OSDI with ordinals"""
-        from refchecker.utils.text_utils import normalize_venue_for_display, are_venues_substantially_different
-        
         cited_venue = 'Proceedings of the USENIX OSDI 15th Symposium on Operating Systems Design'
         actual_venue = 'Symposium on Operating Systems Design'
         
@@ -794,8 +773,6 @@ class TestProceedingsOrdinalNormalization:
     
     def test_simple_ordinal_proceedings(self):
         """Test proceedings with simple ordinals (no org names)"""
-        from refchecker.utils.text_utils import normalize_venue_for_display, are_venues_substantially_different
-        
         cited_venue = 'Proceedings of the 29th Conference on Machine Learning'
         actual_venue = 'Conference on Machine Learning'
         
@@ -810,8 +787,6 @@ class TestProceedingsOrdinalNormalization:
     
     def test_neurips_preserved(self):
         """Test that proceedings without org prefixes are preserved correctly"""
-        from refchecker.utils.text_utils import normalize_venue_for_display
-        
         # This case should NOT be over-processed
         venue = 'Proceedings of Neural Information Processing Systems'
         normalized = normalize_venue_for_display(venue)
@@ -821,8 +796,6 @@ class TestProceedingsOrdinalNormalization:
     
     def test_multiple_organization_names(self):
         """Test proceedings with multiple organization acronyms"""
-        from refchecker.utils.text_utils import normalize_venue_for_display, are_venues_substantially_different
-        
         cited_venue = 'Proceedings of the ACM SIGCOMM 45th Annual Conference on Data Communication'
         actual_venue = 'Annual Conference on Data Communication'
         
@@ -837,8 +810,6 @@ class TestProceedingsOrdinalNormalization:
     
     def test_edge_cases(self):
         """Test edge cases that should not be affected"""
-        from refchecker.utils.text_utils import normalize_venue_for_display
-        
         test_cases = [
             # Regular journals should not be affected
             ('IEEE Transactions on Software Engineering', 'IEEE Transactions on Software Engineering'),
@@ -854,14 +825,20 @@ class TestProceedingsOrdinalNormalization:
             normalized = normalize_venue_for_display(input_venue)
             assert normalized == expected_output, f"Failed for {input_venue}: got {normalized}, expected {expected_output}"
 
+    def test_repeated_and_empty_venues(self):
+        """Test that repeated venues normalize identically and empty values still work"""
+        venue = 'Proceedings of the 41st International Conference on Machine Learning'
+        assert normalize_venue_for_display(venue) == normalize_venue_for_display(venue) == 'International Conference on Machine Learning'
+        assert normalize_venue_for_display(venue) == normalize_venue_for_display('International Conference on Machine Learning, 2024')
+        assert normalize_venue_for_display(None) == ''
+        assert normalize_venue_for_display([]) == ''
+
 
 class TestVenueParsingRegression:
     """Test venue parsing and display issues regression fixes"""
     
     def test_latex_penalty_commands_in_venues(self):
         """Test that venues with LaTeX penalty commands are parsed correctly"""
-        from refchecker.utils.text_utils import strip_latex_commands, are_venues_substantially_different
-        
         test_cases = [
             # LaTeX penalty commands should be removed (positive numbers work)
             ("IEEE Transactions on \\penalty0 Software Engineering", "IEEE Transactions on Software Engineering"),
@@ -882,8 +859,6 @@ class TestVenueParsingRegression:
     
     def test_venue_comparison_with_latex_constructs(self):
         """Test that venue comparison handles LaTeX constructs appropriately"""
-        from refchecker.utils.text_utils import are_venues_substantially_different
-        
         test_cases = [
             # Same venue with and without LaTeX commands should match
             ("IEEE Transactions on \\penalty0 Software Engineering", "IEEE Transactions on Software Engineering"),
@@ -908,8 +883,6 @@ class TestAuthorComparisonBugFixes:
     
     def test_duplicate_author_handling(self):
         """Test that duplicate authors in correct list are handled properly"""
-        from refchecker.utils.text_utils import compare_authors
-        
         cited_authors = ["J. Smith", "A. Doe"]
         # Simulate a database result with duplicate authors (could happen in collaboration papers)
         correct_authors = ["John Smith", "Alice Doe", "John Smith"]  # Duplicate John Smith
@@ -921,8 +894,6 @@ class TestAuthorComparisonBugFixes:
     
     def test_et_al_error_message_accuracy(self):
         """Test that et al error messages don't show misleading positional matches"""
-        from refchecker.utils.text_utils import compare_authors
-        
         cited_authors = ["Nonexistent Author", "et al"]
         correct_authors = ["Real Author 1", "Real Author 2", "Real Author 3"]
         
@@ -942,8 +913,6 @@ class TestNeurIPSVenueMatching:
     
     def test_neurips_venue_abbreviation_matching(self):
         """Test that NeurIPS abbreviation correctly matches full venue name"""
-        from refchecker.utils.text_utils import are_venues_substantially_different
-        
         # Test cases for NeurIPS venue matching
         test_cases = [
             # NeurIPS variations should all match
@@ -971,8 +940,6 @@ class TestNeurIPSVenueMatching:
     
     def test_neurips_does_not_falsely_match_different_venues(self):
         """Test that NeurIPS doesn't incorrectly match unrelated venues"""
-        from refchecker.utils.text_utils import are_venues_substantially_different
-        
         # Test cases that should NOT match
         test_cases = [
             ("NeurIPS", "International Conference on Machine Learning"),
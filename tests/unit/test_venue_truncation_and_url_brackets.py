@@ -8,19 +8,58 @@ This test ensures that:
 """
 
 import unittest
-import sys
-import os
-
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from refchecker.utils.bibtex_parser import parse_bibtex_references
 from refchecker.utils.url_utils import clean_url
 
 
+# Shared BibTeX fixtures without leading indentation; no test mutates these
+ACL_INPROCEEDINGS_BIBTEX = '''@inproceedings{test2023,
+  title={Automatic instruction evolving for large language models},
+  author={Yidong Wang and others},
+  booktitle={Proceedings of the 61st Annual Meeting of the Association for Computational Linguistics},
+  year={2023},
+  pages={4587--4601}
+}'''
+
+JOURNAL_AND_BOOKTITLE_BIBTEX = '''@article{test2024,
+  title={Venue precedence},
+  author={Test Author},
+  booktitle={Workshop on Something},
+  journal={Journal of Something},
+  year={2024}
+}'''
+
+MARKDOWN_HOWPUBLISHED_BIBTEX = '''@misc{inf_orm_2023,
+  title={Inf-orm-llama3.1-70b},
+  author={Test Author},
+  howpublished={[https://huggingface.co/infly/INF-ORM-Llama3.1-70B](https://huggingface.co/infly/INF-ORM-Llama3.1-70B)},
+  year={2023}
+}'''
+
+MARKDOWN_TITLE_BIBTEX = '''@misc{test_title_markdown,
+  title={[https://huggingface.co/model](https://huggingface.co/model)},
+  author={Test Author},
+  year={2023}
+}'''
+
+COMBINED_ISSUES_BIBTEX = '''@inproceedings{combined_test,
+  title={Test paper with both issues},
+  author={Test Author},
+  booktitle={Proceedings of the 42nd Important Conference on Advanced Topics},
+  howpublished={[https://example.com/paper](https://example.com/paper)},
+  year={2023}
+}'''
+
+
 class TestVenueTruncationAndUrlBrackets(unittest.TestCase):
     """Test venue truncation and URL bracket formatting fixes"""
     
+    @classmethod
+    def setUpClass(cls):
+        # Parse once up front so the parser's deferred imports are not charged to whichever test runs first
+        parse_bibtex_references('@misc{warmup, title={Warmup}}')
+    
     def test_venue_field_fallback_to_journal(self):
         """Test that venue display correctly falls back to journal field"""
         # Simulate what BibTeX parser creates - venue is empty, journal has the value
@@ -41,17 +80,7 @@ class TestVenueTruncationAndUrlBrackets(unittest.TestCase):
     
     def test_bibtex_parsing_preserves_full_venue(self):
         """Test that BibTeX parsing correctly maps booktitle to journal field"""
-        test_bibtex = '''
-        @inproceedings{test2023,
-          title={Automatic instruction evolving for large language models},
-          author={Yidong Wang and others},
-          booktitle={Proceedings of the 61st Annual Meeting of the Association for Computational Linguistics},
-          year={2023},
-          pages={4587--4601}
-        }
-        '''
-        
-        references = parse_bibtex_references(test_bibtex)
+        references = parse_bibtex_references(ACL_INPROCEEDINGS_BIBTEX)
         self.assertEqual(len(references), 1)
         
         ref = references[0]
@@ -59,39 +88,42 @@ class TestVenueTruncationAndUrlBrackets(unittest.TestCase):
         self.assertEqual(ref['journal'], 'Proceedings of the 61st Annual Meeting of the Association for Computational Linguistics')
         # The venue field should be empty or not present (BibTeX parser maps booktitle to journal)
         self.assertEqual(ref.get('venue', ''), '')
+
+    def test_bibtex_journal_takes_precedence_over_booktitle(self):
+        """Test that the parser resolves the venue once, preferring journal over booktitle"""
+        ref = parse_bibtex_references(JOURNAL_AND_BOOKTITLE_BIBTEX)[0]
+        self.assertEqual(ref['journal'], 'Journal of Something')
+        self.assertEqual(ref.get('venue', ''), '')
     
     def test_markdown_url_cleaning(self):
         """Test that markdown-style URL links are correctly cleaned"""
-        test_cases = [
+        expected = {
             # Standard markdown link
-            ('[https://huggingface.co/model](https://huggingface.co/model)', 'https://huggingface.co/model'),
+            '[https://huggingface.co/model](https://huggingface.co/model)': 'https://huggingface.co/model',
             # Markdown link with different text
-            ('[Model Page](https://huggingface.co/model)', 'https://huggingface.co/model'),
+            '[Model Page](https://huggingface.co/model)': 'https://huggingface.co/model',
             # Regular URL should be unchanged
-            ('https://huggingface.co/model', 'https://huggingface.co/model'),
+            'https://huggingface.co/model': 'https://huggingface.co/model',
             # Incomplete markdown (missing closing paren) should be unchanged
-            ('[https://example.com](https://example.com', '[https://example.com](https://example.com'),
+            '[https://example.com](https://example.com': '[https://example.com](https://example.com',
             # Malformed markdown should be unchanged
-            ('[no url here]', '[no url here]'),
-        ]
+            '[no url here]': '[no url here]',
+        }
         
-        for input_url, expected_output in test_cases:
-            with self.subTest(url=input_url):
-                cleaned = clean_url(input_url)
-                self.assertEqual(cleaned, expected_output)
+        actual = {input_url: clean_url(input_url) for input_url in expected}
+        self.assertEqual(actual, expected)
+    
+    def test_markdown_url_cleaning_adversarial_input(self):
+        """Test that long runs of unclosed markdown links are returned unchanged"""
+        unclosed_brackets = '[' * 10000 + '](https://example.com'
+        unclosed_links = '[](https://example.com' * 2000
+
+        self.assertEqual(clean_url(unclosed_brackets), unclosed_brackets)
+        self.assertEqual(clean_url(unclosed_links), unclosed_links)
     
     def test_bibtex_markdown_url_extraction(self):
         """Test that BibTeX parsing correctly handles markdown-style URLs in howpublished field"""
-        test_bibtex = '''
-        @misc{inf_orm_2023,
-          title={Inf-orm-llama3.1-70b},
-          author={Test Author},
-          howpublished={[https://huggingface.co/infly/INF-ORM-Llama3.1-70B](https://huggingface.co/infly/INF-ORM-Llama3.1-70B)},
-          year={2023}
-        }
-        '''
-        
-        references = parse_bibtex_references(test_bibtex)
+        references = parse_bibtex_references(MARKDOWN_HOWPUBLISHED_BIBTEX)
         self.assertEqual(len(references), 1)
         
         ref = references[0]
@@ -105,15 +137,7 @@ class TestVenueTruncationAndUrlBrackets(unittest.TestCase):
     
     def test_bibtex_markdown_url_in_title_field(self):
         """Test that markdown-style URLs in title field are handled correctly"""
-        test_bibtex = '''
-        @misc{test_title_markdown,
-          title={[https://huggingface.co/model](https://huggingface.co/model)},
-          author={Test Author},
-          year={2023}
-        }
-        '''
-        
-        references = parse_bibtex_references(test_bibtex)
+        references = parse_bibtex_references(MARKDOWN_TITLE_BIBTEX)
         self.assertEqual(len(references), 1)
         
         ref = references[0]
@@ -124,17 +148,7 @@ class TestVenueTruncationAndUrlBrackets(unittest.TestCase):
     
     def test_combined_venue_and_url_issues(self):
         """Test a reference that has both venue and URL formatting issues"""
-        test_bibtex = '''
-        @inproceedings{combined_test,
-          title={Test paper with both issues},
-          author={Test Author},
-          booktitle={Proceedings of the 42nd Important Conference on Advanced Topics},
-          howpublished={[https://example.com/paper](https://example.com/paper)},
-          year={2023}
-        }
-        '''
-        
-        references = parse_bibtex_references(test_bibtex)
+        references = parse_bibtex_references(COMBINED_ISSUES_BIBTEX)
         self.assertEqual(len(references), 1)
         
         ref = references[0]
@@ -5,11 +5,6 @@ web resource terms are accepted without generating author/organization mismatch
 """
 
 import unittest
-import sys
-import os
-
-# Add the src directory to the path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'src'))
 
 from refchecker.checkers.webpage_checker import WebPageChecker
 
@@ -17,8 +12,10 @@ from refchecker.checkers.webpage_checker import WebPageChecker
 class TestWebpageAuthorMatching(unittest.TestCase):
     """Test webpage author matching logic."""
     
-    def setUp(self):
-        self.checker = WebPageChecker()
+    @classmethod
+    def setUpClass(cls):
+        # _check_author_match does not touch checker state, so one checker is shared
+        cls.checker = WebPageChecker()
     
     def test_generic_web_resource_terms_accepted(self):
         """Test that generic web resource terms are accepted for any web URL."""
@@ -43,10 +40,9 @@ class TestWebpageAuthorMatching(unittest.TestCase):
             'Internet Resource'
         ]
         
-        for term in generic_terms:
-            with self.subTest(term=term):
-                result = self.checker._check_author_match(term, site_info, url)
-                self.assertTrue(result, f"Generic term '{term}' should be accepted for web URLs")
+        rejected = [term for term in generic_terms
+                    if not self.checker._check_author_match(term, site_info, url)]
+        self.assertFalse(rejected, f"Generic terms {rejected} should be accepted for web URLs")
     
     def test_specific_organization_names_still_work(self):
         """Test that specific organization names still work correctly."""
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Unit tests for how WebPageChecker turns a fetched page into searchable text.
+"""
+
+import unittest
+
+from refchecker.checkers.webpage_checker import WebPageChecker
+
+
+class TestWebpageContentExtraction(unittest.TestCase):
+    """Test page parsing and text extraction helpers."""
+
+    @classmethod
+    def setUpClass(cls):
+        # The extraction helpers do not touch checker state, so one checker is shared
+        cls.checker = WebPageChecker()
+
+    def test_utf8_page_without_meta_charset(self):
+        """Test that a UTF-8 page without a declared charset keeps its non-ASCII text."""
+        content = (
+            '<html><head><title>Über die Müller-Lyer Täuschung</title>'
+            '<script>var x = "hidden";</script><style>p {}</style></head>'
+            '<body><p>Größenwahrnehmung und Café</p></body></html>'
+        ).encode('utf-8')
+
+        soup = self.checker._parse_html(content)
+        page_text = self.checker._extract_page_text(soup)
+
+        self.assertIn('Über die Müller-Lyer Täuschung', page_text)
+        self.assertIn('Größenwahrnehmung und Café', page_text)
+        self.assertNotIn('hidden', page_text)
+        self.assertNotIn('p {}', page_text)
+
+    def test_raw_title_matches_parsed_title(self):
+        """Test that the raw-bytes <title> shortcut agrees with the parsed page title."""
+        pages = {
+            'uppercase tag': '<HTML><HEAD><TITLE>Attention Is All You Need</TITLE></HEAD></HTML>',
+            'tag attributes': '<html><head><title lang="en" data-x="1">Deep Residual Learning</title></head></html>',
+            'entities': '<html><head><title>Tips &amp; Tricks &lt;v2&gt; &#8211; Guide</title></head></html>',
+            'non-ASCII': '<html><head><title>Über Müller – 深度学习</title></head></html>',
+        }
+        for label, page in pages.items():
+            with self.subTest(page=label):
+                content = page.encode('utf-8')
+                raw_title = self.checker._extract_raw_title(content)
+                parsed_title = self.checker._extract_page_title(self.checker._parse_html(content))
+                self.assertIsNotNone(raw_title)
+                self.assertEqual(raw_title.strip(), parsed_title)
+
+    def test_text_content_types_accepted(self):
+        """Test that text, HTML, XML and JSON content types are parsed."""
+        accepted = [
+            '',
+            'text/html',
+            'text/html; charset=utf-8',
+            'text/plain',
+            'text/markdown',
+            'application/xhtml+xml',
+            'application/xml',
+            'application/atom+xml',
+            'application/rss+xml',
+            'application/json',
+            'application/ld+json',
+        ]
+        for content_type in accepted:
+            with self.subTest(content_type=content_type):
+                self.assertTrue(self.checker._is_text_content_type(content_type))
+
+    def test_binary_content_types_rejected(self):
+        """Test that images, archives and other binary downloads are not parsed."""
+        rejected = [
+            'image/png',
+            'image/jpeg',
+            'application/octet-stream',
+            'application/zip',
+            'application/gzip',
+            'video/mp4',
+            'audio/mpeg',
+            'application/vnd.openxmlformats-officedocument.wordprocessingml.document',
+        ]
+        for content_type in rejected:
+            with self.subTest(content_type=content_type):
+                self.assertFalse(self.checker._is_text_content_type(content_type))
+
+
+if __name__ == '__main__':
+    unittest.main()